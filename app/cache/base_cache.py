@@ -0,0 +1,104 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, Callable, Dict, List, Optional
+
+
+class BaseCache(ABC):
+    """
+    Abstract base class for product price cache backends.
+
+    Prices are stored as strings, keyed by product ID. Backends shared between workers
+    also carry price invalidations to the other workers' near caches; for a backend
+    local to one process there is no one to tell, so those methods do nothing by default.
+
+    Attributes:
+        publishes_invalidations (bool): Whether writes from other workers are announced
+            through `iter_price_invalidations`.
+    """
+
+    publishes_invalidations: bool = False
+
+    @abstractmethod
+    async def initialize(self) -> None:
+        """
+        Open the connection to the backend if it hasn't been opened yet.
+        """
+        pass
+
+    @abstractmethod
+    async def get_product_price(self, product_id: str) -> Optional[str]:
+        """
+        Retrieve the price of a product from the cache.
+
+        Args:
+            product_id (str): The ID of the product.
+
+        Returns:
+            Optional[str]: The price of the product if found, None otherwise.
+        """
+        pass
+
+    @abstractmethod
+    async def set_product_price(self, product_id: str, price: str) -> None:
+        """
+        Set the price of a product in the cache.
+
+        Args:
+            product_id (str): The ID of the product.
+            price (str): The price of the product.
+        """
+        pass
+
+    @abstractmethod
+    async def get_product_prices(self, product_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve the prices of many products from the cache in batches.
+
+        Args:
+            product_ids (List[str]): The IDs of the products.
+
+        Returns:
+            Dict[str, Optional[str]]: The price of each product, or None if it isn't cached.
+        """
+        pass
+
+    @abstractmethod
+    async def set_product_prices(self, prices: Dict[str, str]) -> None:
+        """
+        Set the prices of many products in the cache in batches.
+
+        Args:
+            prices (Dict[str, str]): The price of each product, by product ID.
+        """
+        pass
+
+    async def publish_price_invalidation(self, product_ids: List[str], origin: Optional[str] = None) -> None:
+        """
+        Tell other workers that the prices of some products have changed.
+
+        Args:
+            product_ids (List[str]): The IDs of the products whose prices were written.
+            origin (Optional[str]): The ID of the near cache that wrote them, so it can skip its own message.
+        """
+        pass
+
+    async def iter_price_invalidations(
+        self, on_subscribed: Optional[Callable[[], None]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Subscribe to price invalidations and yield each raw message.
+
+        Args:
+            on_subscribed (Optional[Callable[[], None]]): Called once the subscription is active.
+
+        Yields:
+            str: The JSON payload of each invalidation message.
+        """
+        return
+        yield
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Close the connection to the backend if it is open.
+        """
+        pass
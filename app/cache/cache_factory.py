@@ -0,0 +1,25 @@
+from app.cache.base_cache import BaseCache
+from app.constants import CACHE_BACKEND
+
+
+def create_cache(backend: str = CACHE_BACKEND) -> BaseCache:
+    """
+    Create the configured price cache backend.
+
+    Args:
+        backend (str): The backend name, either "redis" (shared between workers) or "sqlite"
+            (a local file, for single-node runs). Defaults to CACHE_BACKEND.
+
+    Returns:
+        BaseCache: The cache backend, not yet initialized.
+
+    Raises:
+        ValueError: If the backend name is unknown.
+    """
+    if backend == "redis":
+        from app.cache.redis_cache import RedisCache
+        return RedisCache()
+    if backend == "sqlite":
+        from app.cache.sqlite_cache import SqliteCache
+        return SqliteCache()
+    raise ValueError(f"Unknown cache backend: {backend}")
@@ -0,0 +1,170 @@
+import asyncio
+import json
+import logging
+import uuid
+from decimal import Decimal
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from cachetools import TTLCache
+
+from app.cache.base_cache import BaseCache
+from app.constants import NEAR_CACHE_MAX_SIZE, NEAR_CACHE_TTL
+from app.utils.retry_policy import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class NearCache:
+    """
+    An in-process LRU cache of product prices with a per-entry TTL, in front of Redis.
+
+    Entries hold parsed Decimals, so a hit costs neither a round trip nor a parse. The
+    cache is bounded by `max_size`, evicting the least recently used entry when full,
+    and entries expire after `ttl` seconds as a backstop for missed invalidations.
+
+    Other workers invalidate entries by publishing the IDs they wrote through a shared
+    backend such as Redis. Each NearCache has its own `instance_id`, so it ignores the
+    invalidations it published itself.
+
+    Attributes:
+        instance_id (str): The ID this cache publishes its invalidations under.
+        hits (int): The number of lookups answered from the cache.
+        misses (int): The number of lookups that had to go to Redis.
+    """
+
+    def __init__(self, max_size: int = NEAR_CACHE_MAX_SIZE, ttl: float = NEAR_CACHE_TTL) -> None:
+        """
+        Initialize the NearCache.
+
+        Args:
+            max_size (int): The maximum number of prices kept. Defaults to NEAR_CACHE_MAX_SIZE.
+            ttl (float): The seconds a price is kept for. Defaults to NEAR_CACHE_TTL.
+        """
+        self.instance_id = uuid.uuid4().hex
+        self.hits = 0
+        self.misses = 0
+        self._entries: TTLCache = TTLCache(maxsize=max_size, ttl=ttl)
+        self._listener: Optional[asyncio.Task] = None
+
+    def get(self, product_id: str) -> Tuple[bool, Optional[Decimal]]:
+        """
+        Look up the price of a product, counting the hit or miss.
+
+        Args:
+            product_id (str): The ID of the product.
+
+        Returns:
+            Tuple[bool, Optional[Decimal]]: Whether the price was cached, and the price if it was.
+        """
+        price = self._entries.get(product_id, _MISSING)
+        if price is _MISSING:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        return True, price
+
+    def set(self, product_id: str, price: Decimal) -> None:
+        """
+        Cache the price of a product.
+
+        Args:
+            product_id (str): The ID of the product.
+            price (Decimal): The price of the product.
+        """
+        self._entries[product_id] = price
+
+    def invalidate(self, product_ids: Iterable[str]) -> None:
+        """
+        Drop the cached prices of some products.
+
+        Args:
+            product_ids (Iterable[str]): The IDs of the products.
+        """
+        for product_id in product_ids:
+            self._entries.pop(product_id, None)
+
+    def clear(self) -> None:
+        """
+        Drop every cached price.
+        """
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the hit and miss counters.
+
+        Returns:
+            Dict[str, Any]: The hits, misses, hit rate and current number of entries.
+        """
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+            "size": len(self._entries),
+        }
+
+    def start_invalidation_listener(self, cache: BaseCache) -> None:
+        """
+        Start applying invalidations published by other workers, if the backend carries any.
+
+        Args:
+            cache (BaseCache): The cache backend to subscribe through.
+        """
+        if not cache.publishes_invalidations:
+            return
+        if self._listener is None or self._listener.done():
+            self._listener = asyncio.create_task(self._listen(cache))
+
+    async def stop_invalidation_listener(self) -> None:
+        """
+        Stop applying invalidations published by other workers.
+        """
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+
+    async def _listen(self, cache: BaseCache) -> None:
+        """
+        Apply invalidation messages until cancelled, resubscribing if the connection drops.
+
+        The cache is cleared whenever the subscription is (re)established, since any
+        invalidation sent while it was down has been missed. Resubscribing waits a
+        full-jitter backoff that grows while subscribing keeps failing, so workers that
+        lost the same connection don't all reconnect at once.
+
+        Args:
+            cache (BaseCache): The cache backend to subscribe through.
+        """
+        retry_policy = RetryPolicy()
+        attempt = 0
+
+        def on_subscribed() -> None:
+            nonlocal attempt
+            attempt = 0
+            self.clear()
+
+        while True:
+            try:
+                async for data in cache.iter_price_invalidations(on_subscribed=on_subscribed):
+                    try:
+                        message = json.loads(data)
+                    except ValueError:
+                        logger.warning(f"Ignoring malformed price invalidation: {data!r}")
+                        continue
+                    if message.get("origin") != self.instance_id:
+                        self.invalidate(message.get("ids", []))
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Price invalidation listener failed: {str(e)}")
+            attempt += 1
+            delay = retry_policy.backoff(attempt)
+            logger.warning(f"Price invalidation subscription ended, resubscribing in {delay:.2f}s")
+            await asyncio.sleep(delay)
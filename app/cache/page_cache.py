@@ -0,0 +1,176 @@
+import hashlib
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from decimal import Decimal
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from app.constants import PAGE_CACHE_DIR
+from app.parsers.base_parser import ParsedPage, ProductRecord
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_url(url: str) -> str:
+    """
+    Normalize a URL so that equivalent catalog page URLs share one cache entry.
+
+    The scheme and host are lowercased, the fragment is dropped, query parameters
+    are sorted and an empty path becomes "/".
+
+    Args:
+        url (str): The URL to normalize.
+
+    Returns:
+        str: The normalized URL.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(parts.query, keep_blank_values=True)))
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or "/", query, ""))
+
+
+def hash_body(html: str) -> str:
+    """
+    Hash a page body for change detection.
+
+    Args:
+        html (str): The HTML content of the page.
+
+    Returns:
+        str: The SHA-256 hex digest of the body.
+    """
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CachedPage:
+    """
+    A cached catalog page: its validators, body hash and previously extracted records.
+
+    Attributes:
+        url (str): The normalized URL of the page.
+        etag (Optional[str]): The ETag response header, if any.
+        last_modified (Optional[str]): The Last-Modified response header, if any.
+        body_hash (str): The SHA-256 of the page body.
+        parsed (ParsedPage): The product records and pagination data extracted from the body.
+    """
+    url: str
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body_hash: str
+    parsed: ParsedPage
+
+    def conditional_headers(self) -> Dict[str, str]:
+        """
+        Build revalidation headers from the stored validators.
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers, empty if no validators are stored.
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the entry into JSON-serializable data."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CachedPage":
+        """Rebuild an entry from the data produced by to_dict."""
+        parsed = data["parsed"]
+        return cls(
+            url=data["url"],
+            etag=data.get("etag"),
+            last_modified=data.get("last_modified"),
+            body_hash=data["body_hash"],
+            parsed=ParsedPage(
+                product_records=[
+                    ProductRecord(**{**record, "product_price": Decimal(record["product_price"])})
+                    for record in parsed["product_records"]
+                ],
+                next_page_url=parsed.get("next_page_url"),
+                last_page_number=parsed.get("last_page_number"),
+            ),
+        )
+
+
+class PageCache:
+    """
+    A persistent on-disk cache of catalog pages, keyed by normalized URL.
+
+    Each page is stored as one JSON file, so concurrent page fetches never contend on
+    a shared index.
+
+    Attributes:
+        cache_dir (str): The directory cache entries are stored in.
+    """
+
+    def __init__(self, cache_dir: str = PAGE_CACHE_DIR) -> None:
+        """
+        Initialize the PageCache.
+
+        Args:
+            cache_dir (str): The directory cache entries are stored in. Defaults to PAGE_CACHE_DIR.
+        """
+        self.cache_dir = cache_dir
+
+    def _entry_path(self, url: str) -> str:
+        """Return the file path of the entry for a URL."""
+        key = hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """
+        Retrieve the cached entry for a URL.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            Optional[CachedPage]: The cached entry, or None if the page isn't cached or can't be read.
+        """
+        entry_path = self._entry_path(url)
+        if not os.path.exists(entry_path):
+            return None
+        try:
+            with open(entry_path, "r") as f:
+                return CachedPage.from_dict(json.load(f))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable page cache entry for {url}: {str(e)}")
+            return None
+
+    def set(
+        self,
+        url: str,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        body_hash: str,
+        parsed: ParsedPage,
+    ) -> CachedPage:
+        """
+        Store a page's validators, body hash and extracted records.
+
+        Args:
+            url (str): The URL of the page.
+            etag (Optional[str]): The ETag response header, if any.
+            last_modified (Optional[str]): The Last-Modified response header, if any.
+            body_hash (str): The SHA-256 of the page body.
+            parsed (ParsedPage): The product records and pagination data extracted from the body.
+
+        Returns:
+            CachedPage: The stored entry.
+        """
+        entry = CachedPage(normalize_url(url), etag, last_modified, body_hash, parsed)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry_path = self._entry_path(url)
+        temp_path = f"{entry_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(entry.to_dict(), f, default=str)
+        os.replace(temp_path, entry_path)
+        return entry
@@ -1,28 +1,48 @@
-from typing import Optional
+import json
+from typing import AsyncIterator, Callable, Dict, List, Optional
 
 import aioredis
 
-from app.constants import PRODUCT_PRICE_CACHE_KEY, REDIS_URL
+from app.cache.base_cache import BaseCache
+from app.constants import (
+    PRODUCT_PRICE_CACHE_KEY,
+    PRODUCT_PRICE_INVALIDATION_CHANNEL,
+    REDIS_BATCH_SIZE,
+    REDIS_MAX_CONNECTIONS,
+    REDIS_URL,
+)
 
 
-class RedisCache:
+class RedisCache(BaseCache):
     """
     A class to handle Redis caching operations.
+
+    Redis is shared between workers, so price invalidations are carried over pub/sub.
     """
 
-    def __init__(self):
+    publishes_invalidations: bool = True
+
+    def __init__(self, batch_size: int = REDIS_BATCH_SIZE, max_connections: int = REDIS_MAX_CONNECTIONS):
         """
         Initialize the RedisCache instance.
+
+        Args:
+            batch_size (int): The maximum number of keys sent in one MGET or pipeline.
+            max_connections (int): The size of the connection pool. Defaults to REDIS_MAX_CONNECTIONS.
         """
         self.redis: Optional[aioredis.Redis] = None
         self.redis_url: str = REDIS_URL
+        self.batch_size: int = batch_size
+        self.max_connections: int = max_connections
 
     async def initialize(self) -> None:
         """
         Initialize the Redis connection if it hasn't been established yet.
         """
         if self.redis is None:
-            self.redis = await aioredis.from_url(self.redis_url, encoding="utf-8", decode_responses=True)
+            self.redis = await aioredis.from_url(
+                self.redis_url, encoding="utf-8", decode_responses=True, max_connections=self.max_connections
+            )
 
     async def get_product_price(self, product_id: str) -> Optional[str]:
         """
@@ -51,6 +71,86 @@ class RedisCache:
         if self.redis:
             await self.redis.set(PRODUCT_PRICE_CACHE_KEY.format(product_id), price)
 
+    async def get_product_prices(self, product_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve the prices of many products from the cache with MGET.
+
+        The IDs are sent in chunks of `batch_size`, one round trip per chunk.
+
+        Args:
+            product_ids (List[str]): The IDs of the products.
+
+        Returns:
+            Dict[str, Optional[str]]: The price of each product, or None if it isn't cached.
+        """
+        await self.initialize()
+        prices: Dict[str, Optional[str]] = {}
+        if self.redis:
+            for start in range(0, len(product_ids), self.batch_size):
+                chunk = product_ids[start:start + self.batch_size]
+                values = await self.redis.mget([PRODUCT_PRICE_CACHE_KEY.format(product_id) for product_id in chunk])
+                prices.update(zip(chunk, values))
+        return prices
+
+    async def set_product_prices(self, prices: Dict[str, str]) -> None:
+        """
+        Set the prices of many products in the cache with pipelined SETs.
+
+        The pipeline isn't transactional; it is flushed every `batch_size` commands.
+
+        Args:
+            prices (Dict[str, str]): The price of each product, by product ID.
+        """
+        await self.initialize()
+        if self.redis:
+            items = list(prices.items())
+            for start in range(0, len(items), self.batch_size):
+                async with self.redis.pipeline(transaction=False) as pipeline:
+                    for product_id, price in items[start:start + self.batch_size]:
+                        pipeline.set(PRODUCT_PRICE_CACHE_KEY.format(product_id), price)
+                    await pipeline.execute()
+
+    async def publish_price_invalidation(self, product_ids: List[str], origin: Optional[str] = None) -> None:
+        """
+        Tell other workers that the prices of some products have changed.
+
+        Args:
+            product_ids (List[str]): The IDs of the products whose prices were written.
+            origin (Optional[str]): The ID of the near cache that wrote them, so it can skip its own message.
+        """
+        await self.initialize()
+        if self.redis and product_ids:
+            await self.redis.publish(
+                PRODUCT_PRICE_INVALIDATION_CHANNEL, json.dumps({"origin": origin, "ids": product_ids})
+            )
+
+    async def iter_price_invalidations(
+        self, on_subscribed: Optional[Callable[[], None]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Subscribe to price invalidations and yield each raw message.
+
+        Args:
+            on_subscribed (Optional[Callable[[], None]]): Called once the subscription is active.
+
+        Yields:
+            str: The JSON payload of each invalidation message.
+        """
+        await self.initialize()
+        if not self.redis:
+            return
+        pubsub = self.redis.pubsub()
+        await pubsub.subscribe(PRODUCT_PRICE_INVALIDATION_CHANNEL)
+        try:
+            if on_subscribed is not None:
+                on_subscribed()
+            async for message in pubsub.listen():
+                if message["type"] == "message":
+                    yield message["data"]
+        finally:
+            await pubsub.unsubscribe(PRODUCT_PRICE_INVALIDATION_CHANNEL)
+            await pubsub.close()
+
     async def close(self) -> None:
         """
         Close the Redis connection if it exists.
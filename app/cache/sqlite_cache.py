@@ -0,0 +1,111 @@
+import logging
+import os
+import sqlite3
+from typing import Dict, List, Optional
+
+from app.cache.base_cache import BaseCache
+from app.constants import SQLITE_CACHE_BATCH_SIZE, SQLITE_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+
+class SqliteCache(BaseCache):
+    """
+    A price cache in a local SQLite file, for single-node runs without Redis.
+
+    Prices persist across runs in one table keyed by product ID. The database runs in
+    WAL mode with NORMAL synchronisation, so a batch write is one short transaction
+    rather than an fsync per product. Queries are small indexed lookups and run
+    inline on the event loop.
+    """
+
+    def __init__(self, path: str = SQLITE_CACHE_PATH, batch_size: int = SQLITE_CACHE_BATCH_SIZE):
+        """
+        Initialize the SqliteCache instance.
+
+        Args:
+            path (str): The path of the SQLite database file. Defaults to SQLITE_CACHE_PATH.
+            batch_size (int): The maximum number of IDs bound in one query, below SQLite's variable limit.
+        """
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.connection: Optional[sqlite3.Connection] = None
+
+    async def initialize(self) -> None:
+        """
+        Open the database and create the price table if it hasn't been opened yet.
+        """
+        if self.connection is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            self.connection = sqlite3.connect(self.path)
+            self.connection.execute("PRAGMA journal_mode=WAL")
+            self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS product_prices (product_id TEXT PRIMARY KEY, price TEXT NOT NULL)"
+            )
+            self.connection.commit()
+            logger.info(f"SQLite price cache opened at {self.path}")
+
+    async def get_product_price(self, product_id: str) -> Optional[str]:
+        """
+        Retrieve the price of a product from the cache.
+
+        Args:
+            product_id (str): The ID of the product.
+
+        Returns:
+            Optional[str]: The price of the product if found, None otherwise.
+        """
+        return (await self.get_product_prices([product_id]))[product_id]
+
+    async def set_product_price(self, product_id: str, price: str) -> None:
+        """
+        Set the price of a product in the cache.
+
+        Args:
+            product_id (str): The ID of the product.
+            price (str): The price of the product.
+        """
+        await self.set_product_prices({product_id: price})
+
+    async def get_product_prices(self, product_ids: List[str]) -> Dict[str, Optional[str]]:
+        """
+        Retrieve the prices of many products, `batch_size` IDs per query.
+
+        Args:
+            product_ids (List[str]): The IDs of the products.
+
+        Returns:
+            Dict[str, Optional[str]]: The price of each product, or None if it isn't cached.
+        """
+        await self.initialize()
+        prices: Dict[str, Optional[str]] = dict.fromkeys(product_ids)
+        for start in range(0, len(product_ids), self.batch_size):
+            chunk = product_ids[start:start + self.batch_size]
+            placeholders = ", ".join("?" * len(chunk))
+            rows = self.connection.execute(
+                f"SELECT product_id, price FROM product_prices WHERE product_id IN ({placeholders})", chunk
+            )
+            prices.update(rows)
+        return prices
+
+    async def set_product_prices(self, prices: Dict[str, str]) -> None:
+        """
+        Set the prices of many products in a single transaction.
+
+        Args:
+            prices (Dict[str, str]): The price of each product, by product ID.
+        """
+        await self.initialize()
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO product_prices (product_id, price) VALUES (?, ?)", prices.items()
+            )
+
+    async def close(self) -> None:
+        """
+        Close the database if it is open.
+        """
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
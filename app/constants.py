@@ -6,9 +6,23 @@ API_KEY_NAME = "X-API-Key"
 
 # Database Configuration
 DATABASE_URL = os.getenv("DATABASE_URL")
+DB_UPSERT_BATCH_SIZE = int(os.getenv("DB_UPSERT_BATCH_SIZE", 1000))
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 10))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", 20))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 30))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", 1800))
+DB_ECHO = os.getenv("DB_ECHO", "false").lower() == "true"
 
 # Redis Configuration
 REDIS_URL = os.getenv("REDIS_URL")
+REDIS_BATCH_SIZE = int(os.getenv("REDIS_BATCH_SIZE", 1000))
+REDIS_MAX_CONNECTIONS = int(os.getenv("REDIS_MAX_CONNECTIONS", 50))
+
+# Near Cache Configuration
+NEAR_CACHE_ENABLED = os.getenv("NEAR_CACHE_ENABLED", "true").lower() == "true"
+NEAR_CACHE_MAX_SIZE = int(os.getenv("NEAR_CACHE_MAX_SIZE", 10000))
+NEAR_CACHE_TTL = float(os.getenv("NEAR_CACHE_TTL", 300))
+PRODUCT_PRICE_INVALIDATION_CHANNEL = "product_price:invalidate"
 
 # Twilio Configuration
 TWILIO_ACCOUNT_SID = os.getenv("TWILIO_ACCOUNT_SID")
@@ -25,18 +39,92 @@ SMTP_PORT = 587
 
 # Scraper Configuration
 TARGET_URL = os.getenv("TARGET_URL", "https://dentalstall.com/shop/")
+SCRAPER_PAGE_CONCURRENCY = int(os.getenv("SCRAPER_PAGE_CONCURRENCY", 4))
+STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", 100))
+UPDATED_PRODUCTS_SAMPLE_SIZE = int(os.getenv("UPDATED_PRODUCTS_SAMPLE_SIZE", 10))
+IMAGE_DOWNLOAD_CONCURRENCY = int(os.getenv("IMAGE_DOWNLOAD_CONCURRENCY", 20))
+IMAGE_DOWNLOAD_CONCURRENCY_PER_HOST = int(os.getenv("IMAGE_DOWNLOAD_CONCURRENCY_PER_HOST", 8))
+
+# Scrape Job Configuration
+SCRAPE_JOB_WORKERS = int(os.getenv("SCRAPE_JOB_WORKERS", 2))
+SCRAPE_JOB_MAX_PENDING = int(os.getenv("SCRAPE_JOB_MAX_PENDING", 100))
+SCRAPE_JOB_HISTORY = int(os.getenv("SCRAPE_JOB_HISTORY", 200))
+SCRAPE_RESULT_REUSE_SECONDS = float(os.getenv("SCRAPE_RESULT_REUSE_SECONDS", 60))
+
+# Multi-Site Configuration
+SITES_CONFIG_PATH = os.getenv("SITES_CONFIG_PATH")
+SCHEDULER_GLOBAL_CONCURRENCY = int(os.getenv("SCHEDULER_GLOBAL_CONCURRENCY", 16))
+
+# Store API Configuration
+STORE_API_ENABLED = os.getenv("STORE_API_ENABLED", "true").lower() == "true"
+STORE_API_PRODUCTS_PATH = "/wp-json/wc/store/v1/products"
+STORE_API_PER_PAGE = int(os.getenv("STORE_API_PER_PAGE", 100))
+
+# HTML Parser Configuration
+HTML_PARSER_ENGINE = os.getenv("HTML_PARSER_ENGINE", "lxml")
+HTML_PARSER_TARGETED = os.getenv("HTML_PARSER_TARGETED", "true").lower() == "true"
+PARSER_POOL_SIZE = int(os.getenv("PARSER_POOL_SIZE", os.cpu_count() or 1))
 
 # Storage Configuration
 STORAGE_PATH = os.getenv("STORAGE_PATH", "./storage")
 IMAGE_SAVE_DIR = os.path.join(STORAGE_PATH, "images")
+IMAGE_DOWNLOAD_CHUNK_SIZE = int(os.getenv("IMAGE_DOWNLOAD_CHUNK_SIZE", 64 * 1024))
+IMAGE_MAX_SIZE = int(os.getenv("IMAGE_MAX_SIZE")) if os.getenv("IMAGE_MAX_SIZE") else None
+PAGE_CACHE_DIR = os.path.join(STORAGE_PATH, "page_cache")
+CHECKPOINT_DIR = os.path.join(STORAGE_PATH, "checkpoints")
+PAGE_CACHE_ENABLED = os.getenv("PAGE_CACHE_ENABLED", "true").lower() == "true"
+
+# Price Cache Backend Configuration
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "redis")
+SQLITE_CACHE_PATH = os.getenv("SQLITE_CACHE_PATH", os.path.join(STORAGE_PATH, "price_cache.sqlite3"))
+SQLITE_CACHE_BATCH_SIZE = int(os.getenv("SQLITE_CACHE_BATCH_SIZE", 500))
 
 # Application Configuration
 PORT = int(os.getenv("PORT", 8000))
 HOST = os.getenv("HOST", "0.0.0.0")
 
+# HTTP Session Configuration
+HTTP_TRANSPORT = os.getenv("HTTP_TRANSPORT", "aiohttp")
+HTTP_CONNECTOR_LIMIT = int(os.getenv("HTTP_CONNECTOR_LIMIT", 100))
+HTTP_CONNECTOR_LIMIT_PER_HOST = int(os.getenv("HTTP_CONNECTOR_LIMIT_PER_HOST", 10))
+HTTP_DNS_CACHE_TTL = int(os.getenv("HTTP_DNS_CACHE_TTL", 300))
+HTTP_KEEPALIVE_TIMEOUT = float(os.getenv("HTTP_KEEPALIVE_TIMEOUT", 30))
+HTTP_REQUEST_TIMEOUT = float(os.getenv("HTTP_REQUEST_TIMEOUT", 10))
+HTTP_DEFAULT_TIMEOUT = float(os.getenv("HTTP_DEFAULT_TIMEOUT", 300))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("HTTP_CONNECT_TIMEOUT", 30))
+
+# Adaptive Timeout and Hedging Configuration
+LATENCY_WINDOW = int(os.getenv("LATENCY_WINDOW", 200))
+LATENCY_MIN_SAMPLES = int(os.getenv("LATENCY_MIN_SAMPLES", 20))
+ADAPTIVE_TIMEOUT_PERCENTILE = float(os.getenv("ADAPTIVE_TIMEOUT_PERCENTILE", 0.99))
+ADAPTIVE_TIMEOUT_MULTIPLIER = float(os.getenv("ADAPTIVE_TIMEOUT_MULTIPLIER", 3.0))
+ADAPTIVE_TIMEOUT_MIN = float(os.getenv("ADAPTIVE_TIMEOUT_MIN", 2.0))
+HEDGE_ENABLED = os.getenv("HEDGE_ENABLED", "false").lower() == "true"
+HEDGE_PERCENTILE = float(os.getenv("HEDGE_PERCENTILE", 0.95))
+HEDGE_MAX_RATE = float(os.getenv("HEDGE_MAX_RATE", 0.05))
+
+# Adaptive Rate Limiting Configuration
+ADAPTIVE_INITIAL_CONCURRENCY = int(os.getenv("ADAPTIVE_INITIAL_CONCURRENCY", 4))
+ADAPTIVE_MIN_CONCURRENCY = int(os.getenv("ADAPTIVE_MIN_CONCURRENCY", 1))
+ADAPTIVE_MAX_CONCURRENCY = int(os.getenv("ADAPTIVE_MAX_CONCURRENCY", 32))
+ADAPTIVE_LATENCY_TARGET = float(os.getenv("ADAPTIVE_LATENCY_TARGET", 2.0))
+ADAPTIVE_DECREASE_FACTOR = float(os.getenv("ADAPTIVE_DECREASE_FACTOR", 0.5))
+
+# Proxy Pool Configuration
+PROXY_LIST = [proxy.strip() for proxy in os.getenv("PROXY_LIST", "").split(",") if proxy.strip()]
+PROXY_HEALTH_WINDOW = int(os.getenv("PROXY_HEALTH_WINDOW", 50))
+PROXY_FAILURE_THRESHOLD = int(os.getenv("PROXY_FAILURE_THRESHOLD", 3))
+PROXY_QUARANTINE_SECONDS = float(os.getenv("PROXY_QUARANTINE_SECONDS", 60.0))
+PROXY_LATENCY_FLOOR = 0.1
+PROXY_FAILURE_STATUSES = (403, 407, 429)
+
 # Retry Configuration
 MAX_RETRY_ATTEMPTS = 3
-RETRY_DELAY = 5
+RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", 1.0))
+RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", 30.0))
+RETRY_BUDGET = int(os.getenv("RETRY_BUDGET", 50))
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5))
+CIRCUIT_BREAKER_RESET_TIMEOUT = float(os.getenv("CIRCUIT_BREAKER_RESET_TIMEOUT", 30.0))
 
 # HTML Classes
 PRODUCT_CLASS = "product"
@@ -44,6 +132,7 @@ PRODUCT_TITLE_CLASS = "woo-loop-product__title"
 PRODUCT_PRICE_CLASS = "woocommerce-Price-amount"
 PRODUCT_IMAGE_CLASS = "attachment-woocommerce_thumbnail"
 NEXT_PAGE_CLASS = "next.page-numbers"
+PAGE_NUMBERS_CLASS = "page-numbers"
 
 # Cache Keys
 PRODUCT_PRICE_CACHE_KEY = "product_price:{}"
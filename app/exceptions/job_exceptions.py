@@ -0,0 +1,15 @@
+class JobException(Exception):
+    """Base exception for scrape job errors."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class JobQueueFullException(JobException):
+    """Exception raised when a job is submitted while the queue of pending jobs is full."""
+    pass
+
+
+class JobNotFoundException(JobException):
+    """Exception raised when no job has the requested ID."""
+    pass
@@ -10,6 +10,26 @@ class NetworkException(ScraperException):
     pass
 
 
+class ClientErrorException(NetworkException):
+    """Exception raised when the server rejects a request with a client error that retrying won't fix."""
+    pass
+
+
+class PageNotFoundException(ClientErrorException):
+    """Exception raised when a requested page does not exist (HTTP 404)."""
+    pass
+
+
+class StoreApiUnavailableException(ClientErrorException):
+    """Exception raised when a site doesn't serve the WooCommerce Store API."""
+    pass
+
+
+class CircuitOpenException(NetworkException):
+    """Exception raised when a host's circuit breaker is open and requests to it fail fast."""
+    pass
+
+
 class ParsingException(ScraperException):
     """Exception raised for errors during HTML parsing."""
     pass
@@ -28,3 +48,13 @@ class PaginationException(ScraperException):
 class DataExtractionException(ScraperException):
     """Exception raised for errors during data extraction from scraped content."""
     pass
+
+
+class ImageTooLargeException(DataExtractionException):
+    """Exception raised when a downloaded image exceeds the configured maximum size."""
+    pass
+
+
+class CheckpointException(ScraperException):
+    """Exception raised for errors loading or resuming a crawl checkpoint."""
+    pass
@@ -0,0 +1,15 @@
+class TransportException(Exception):
+    """Base exception for HTTP transport errors, raised instead of client library errors."""
+    def __init__(self, message: str):
+        self.message = message
+        super().__init__(self.message)
+
+
+class TransportTimeoutException(TransportException):
+    """Exception raised when an HTTP request or its body read times out."""
+    pass
+
+
+class TransportProxyException(TransportException):
+    """Exception raised when the proxy can't be reached or rejects the request."""
+    pass
@@ -0,0 +1,98 @@
+import json
+import logging
+from dataclasses import dataclass, field, fields
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.constants import SITES_CONFIG_PATH, STORE_API_ENABLED, TARGET_URL
+from app.parsers.base_parser import SiteSelectors
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SiteConfig:
+    """
+    The crawl configuration of one shop.
+
+    Attributes:
+        name (str): The unique name of the site, used in logs, checkpoints and API requests.
+        start_url (str): The URL of the first catalog page.
+        selectors (SiteSelectors): The classes that locate products and pagination in its HTML.
+        weight (float): The site's share of the scheduler's concurrency relative to other sites.
+        page_limit (Optional[int]): The maximum number of pages to crawl, unless a request sets one.
+        store_api (bool): Whether to try the WooCommerce Store API before scraping HTML.
+    """
+    name: str
+    start_url: str
+    selectors: SiteSelectors = field(default_factory=SiteSelectors)
+    weight: float = 1.0
+    page_limit: Optional[int] = None
+    store_api: bool = STORE_API_ENABLED
+
+    @property
+    def source(self) -> str:
+        """The scheme and domain of the site, used as the source of its products."""
+        parsed_url = urlparse(self.start_url)
+        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SiteConfig":
+        """
+        Build a site config from its JSON form, where selectors are a nested object.
+
+        Args:
+            data (Dict[str, Any]): The site's name, start_url and optional settings.
+
+        Returns:
+            SiteConfig: The site config.
+
+        Raises:
+            ValueError: If a required setting is missing or a selector name is unknown.
+        """
+        data = dict(data)
+        if not data.get("name") or not data.get("start_url"):
+            raise ValueError(f"Site config needs a name and a start_url: {data}")
+        selector_names = {selector.name for selector in fields(SiteSelectors)}
+        selectors = data.pop("selectors", None) or {}
+        unknown = set(selectors) - selector_names
+        if unknown:
+            raise ValueError(f"Unknown selectors for site {data['name']}: {sorted(unknown)}")
+        return cls(selectors=SiteSelectors(**selectors), **data)
+
+
+def default_site_config() -> SiteConfig:
+    """
+    Return the config of the single site crawled when no sites file is configured.
+
+    Returns:
+        SiteConfig: The TARGET_URL site with the default selectors.
+    """
+    return SiteConfig(name=urlparse(TARGET_URL).netloc, start_url=TARGET_URL)
+
+
+def load_site_configs(path: Optional[str] = SITES_CONFIG_PATH) -> List[SiteConfig]:
+    """
+    Load the sites to crawl from a JSON file holding a list of site configs.
+
+    Args:
+        path (Optional[str]): The path of the sites file. Defaults to SITES_CONFIG_PATH.
+
+    Returns:
+        List[SiteConfig]: The configured sites, or only the default site if no file is configured.
+
+    Raises:
+        ValueError: If the file is invalid or two sites share a name.
+    """
+    if not path:
+        return [default_site_config()]
+    with open(path, "r") as f:
+        entries = json.load(f)
+    if not isinstance(entries, list):
+        raise ValueError(f"Sites file must hold a list of site configs: {path}")
+    sites = [SiteConfig.from_dict(entry) for entry in entries]
+    names = [site.name for site in sites]
+    if len(set(names)) != len(names):
+        raise ValueError(f"Duplicate site names in {path}")
+    logger.info(f"Loaded {len(sites)} site configs from {path}")
+    return sites
@@ -0,0 +1,44 @@
+import logging
+from typing import List
+
+from app.constants import (
+    EMAIL_PASSWORD,
+    EMAIL_RECEIVER,
+    EMAIL_SENDER,
+    TWILIO_ACCOUNT_SID,
+    TWILIO_AUTH_TOKEN,
+    TWILIO_FROM_NUMBER,
+    TWILIO_TO_NUMBER,
+)
+from app.notifications.base_notifier import BaseNotifier
+
+logger = logging.getLogger(__name__)
+
+
+def create_notifiers() -> List[BaseNotifier]:
+    """
+    Create a notifier for every channel whose credentials are configured.
+
+    Twilio and email are enabled when all of their settings are present. If neither
+    is, notifications go to the console.
+
+    Returns:
+        List[BaseNotifier]: The notifiers, never empty.
+
+    Raises:
+        AuthenticationException: If a notifier's credentials are rejected.
+    """
+    notifiers: List[BaseNotifier] = []
+    if all([TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_FROM_NUMBER, TWILIO_TO_NUMBER]):
+        from app.notifications.twilio_notifier import TwilioNotifier
+        logger.info("Twilio notifier enabled")
+        notifiers.append(TwilioNotifier())
+    if all([EMAIL_SENDER, EMAIL_PASSWORD, EMAIL_RECEIVER]):
+        from app.notifications.email_notifier import EmailNotifier
+        logger.info("Email notifier enabled")
+        notifiers.append(EmailNotifier())
+    if not notifiers:
+        from app.notifications.console_notifier import ConsoleNotifier
+        logger.info("No external notifiers configured, using console notifier")
+        notifiers.append(ConsoleNotifier())
+    return notifiers
@@ -0,0 +1,141 @@
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import List, Optional
+
+from app.constants import (
+    NEXT_PAGE_CLASS,
+    PAGE_NUMBERS_CLASS,
+    PRODUCT_CLASS,
+    PRODUCT_IMAGE_CLASS,
+    PRODUCT_PRICE_CLASS,
+    PRODUCT_TITLE_CLASS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SiteSelectors:
+    """
+    The CSS classes that locate products and pagination in a site's catalog markup.
+
+    The defaults match the WooCommerce theme of TARGET_URL. Instances are hashable and
+    picklable, so parser pool workers can keep one parser per set of selectors.
+
+    Attributes:
+        product_class (str): The class of a product list item.
+        product_title_class (str): The class of a product's title heading.
+        product_price_class (str): The class of a product's price.
+        product_image_class (str): The class of a product's image.
+        next_page_class (str): The compound class of the next page link, e.g. "next.page-numbers".
+        page_numbers_class (str): The class of the pagination links.
+        image_url_attribute (str): The image attribute holding the image URL.
+    """
+    product_class: str = PRODUCT_CLASS
+    product_title_class: str = PRODUCT_TITLE_CLASS
+    product_price_class: str = PRODUCT_PRICE_CLASS
+    product_image_class: str = PRODUCT_IMAGE_CLASS
+    next_page_class: str = NEXT_PAGE_CLASS
+    page_numbers_class: str = PAGE_NUMBERS_CLASS
+    image_url_attribute: str = "data-lazy-src"
+
+
+@dataclass
+class ProductRecord:
+    """
+    Plain product data extracted from a catalog page, before image download.
+
+    Attributes:
+        source_id (str): ID received from scraping.
+        product_title (str): Title of the product.
+        product_price (Decimal): Price of the product.
+        image_url (str): Absolute URL of the product image.
+    """
+    source_id: str
+    product_title: str
+    product_price: Decimal
+    image_url: str
+
+
+@dataclass
+class ParsedPage:
+    """
+    Everything the scraper needs from a single catalog page.
+
+    Attributes:
+        product_records (List[ProductRecord]): The products found on the page, in page order.
+        next_page_url (Optional[str]): The URL of the next page, if any.
+        last_page_number (Optional[int]): The highest page number shown in the pagination block, if any.
+    """
+    product_records: List[ProductRecord] = field(default_factory=list)
+    next_page_url: Optional[str] = None
+    last_page_number: Optional[int] = None
+
+
+class BaseParser(ABC):
+    """
+    Abstract base class for HTML parser engines.
+
+    Every engine must extract the same records from the same HTML, so that the
+    products built from them are identical whichever engine is configured.
+
+    Attributes:
+        selectors (SiteSelectors): The classes that locate products and pagination.
+    """
+
+    def __init__(self, selectors: Optional[SiteSelectors] = None) -> None:
+        """
+        Initialize the parser.
+
+        Args:
+            selectors (Optional[SiteSelectors]): The site's selectors. Defaults to those of TARGET_URL.
+        """
+        self.selectors = selectors or SiteSelectors()
+
+    @abstractmethod
+    def parse_page(self, url: str, html: str) -> ParsedPage:
+        """
+        Parse a catalog page and extract its products and pagination.
+
+        Args:
+            url (str): The URL the HTML was fetched from, used to resolve relative links.
+            html (str): The HTML content of the page.
+
+        Returns:
+            ParsedPage: The extracted product records and pagination data.
+
+        Raises:
+            ParsingException: If the HTML cannot be parsed.
+            PaginationException: If there's an error getting the next page URL.
+        """
+        pass
+
+    @staticmethod
+    def parse_price(price_text: str) -> Decimal:
+        """
+        Convert displayed price text such as "₹1,299.00" into a Decimal.
+
+        Args:
+            price_text (str): The price text as displayed on the page.
+
+        Returns:
+            Decimal: The numeric price, or 0 if the text holds no digits.
+        """
+        price_value = ''.join(filter(lambda x: x.isdigit() or x == '.', price_text.strip()))
+        return Decimal(price_value) if price_value else Decimal('0')
+
+    @staticmethod
+    def parse_page_number(text: str) -> Optional[int]:
+        """
+        Convert the text of a pagination link into a page number.
+
+        Args:
+            text (str): The stripped text of the pagination element.
+
+        Returns:
+            Optional[int]: The page number, or None if the element isn't a numbered link.
+        """
+        text = text.replace(',', '')
+        return int(text) if text.isdigit() else None
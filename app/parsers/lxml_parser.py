@@ -0,0 +1,149 @@
+import logging
+from decimal import Decimal
+from typing import List, Optional
+from urllib.parse import urljoin
+
+from lxml import etree, html as lxml_html
+
+from app.exceptions.scraper_exceptions import PaginationException, ParsingException
+from app.parsers.base_parser import BaseParser, ParsedPage, ProductRecord, SiteSelectors
+
+logger = logging.getLogger(__name__)
+
+
+def _has_classes(selector: str) -> str:
+    """
+    Build an XPath predicate matching elements that carry every class in a compound class selector.
+
+    Args:
+        selector (str): One or more class names joined by dots, e.g. "next.page-numbers".
+
+    Returns:
+        str: The XPath predicate, without surrounding brackets.
+    """
+    return " and ".join(
+        f"contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')"
+        for class_name in selector.split('.')
+    )
+
+
+class LxmlParser(BaseParser):
+    """
+    lxml parser engine using XPath expressions compiled once per parser from the site's selectors.
+
+    It extracts the same records as SoupParser, with tree building and queries done in C.
+    """
+
+    _product_id = etree.XPath(f"(.//a[{_has_classes('button')}])[1]/@data-product_id")
+    _title_link = etree.XPath("(.//a)[1]")
+
+    def __init__(self, selectors: Optional[SiteSelectors] = None) -> None:
+        """
+        Initialize the LxmlParser and compile its XPath expressions.
+
+        Args:
+            selectors (Optional[SiteSelectors]): The site's selectors. Defaults to those of TARGET_URL.
+        """
+        super().__init__(selectors)
+        selectors = self.selectors
+        self._products = etree.XPath(f"//li[{_has_classes(selectors.product_class)}]")
+        self._title = etree.XPath(f"(.//h2[{_has_classes(selectors.product_title_class)}])[1]")
+        self._price = etree.XPath(f"(.//span[{_has_classes(selectors.product_price_class)}])[1]")
+        self._image_url = etree.XPath(f"(.//img[{_has_classes(selectors.product_image_class)}])[1]")
+        self._next_page = etree.XPath(f"(//*[{_has_classes(selectors.next_page_class)}])[1]")
+        self._page_numbers = etree.XPath(
+            f"//a[{_has_classes(selectors.page_numbers_class)}] | //span[{_has_classes(selectors.page_numbers_class)}]"
+        )
+
+    def parse_page(self, url: str, html: str) -> ParsedPage:
+        """
+        Parse a catalog page and extract its products and pagination.
+
+        Args:
+            url (str): The URL the HTML was fetched from, used to resolve relative links.
+            html (str): The HTML content of the page.
+
+        Returns:
+            ParsedPage: The extracted product records and pagination data.
+
+        Raises:
+            ParsingException: If the HTML cannot be parsed.
+            PaginationException: If there's an error getting the next page URL.
+        """
+        try:
+            try:
+                root = lxml_html.document_fromstring(html)
+            except ValueError:
+                # lxml rejects str input that carries an XML encoding declaration
+                root = lxml_html.document_fromstring(html.encode('utf-8'))
+        except (etree.ParserError, ValueError) as e:
+            logger.error(f"Error parsing page {url}: {str(e)}")
+            raise ParsingException(f"Failed to parse page: {str(e)}") from e
+
+        return ParsedPage(
+            product_records=self._extract_product_records(root, url),
+            next_page_url=self._find_next_page_url(root, url),
+            last_page_number=self._find_last_page_number(root),
+        )
+
+    def _extract_product_records(self, root: etree._Element, base_url: str) -> List[ProductRecord]:
+        """Extract a record for every product element, skipping those that fail."""
+        records = []
+        for product_element in self._products(root):
+            try:
+                records.append(ProductRecord(
+                    source_id=self._extract_product_id(product_element),
+                    product_title=self._extract_product_title(product_element),
+                    product_price=self._extract_product_price(product_element),
+                    image_url=self._extract_product_image_url(product_element, base_url),
+                ))
+            except Exception as e:
+                logger.warning(f"Skipping product due to parsing error: {str(e)}")
+                logger.warning(f"Product element: {etree.tostring(product_element, encoding='unicode')}")
+        return records
+
+    def _extract_product_id(self, product_element: etree._Element) -> str:
+        """Extract the product ID from the product element."""
+        product_id = self._product_id(product_element)
+        return str(product_id[0]) if product_id else ''
+
+    def _extract_product_title(self, product_element: etree._Element) -> str:
+        """Extract the product title from the product element."""
+        title_element = self._title(product_element)
+        title_link = self._title_link(title_element[0]) if title_element else []
+        return title_link[0].text_content().strip() if title_link else ''
+
+    def _extract_product_price(self, product_element: etree._Element) -> Decimal:
+        """Extract the product price from the product element."""
+        price_element = self._price(product_element)
+        return self.parse_price(price_element[0].text_content() if price_element else '')
+
+    def _extract_product_image_url(self, product_element: etree._Element, base_url: str) -> str:
+        """Extract the product image URL from the product element."""
+        image_element = self._image_url(product_element)
+        image_url = image_element[0].get(self.selectors.image_url_attribute, '') if image_element else ''
+        return urljoin(base_url, image_url)
+
+    def _find_last_page_number(self, root: etree._Element) -> Optional[int]:
+        """Find the highest page number shown in the pagination block."""
+        numbers = [
+            number for number in (
+                self.parse_page_number(''.join(text.strip() for text in element.itertext()))
+                for element in self._page_numbers(root)
+            ) if number is not None
+        ]
+        return max(numbers) if numbers else None
+
+    def _find_next_page_url(self, root: etree._Element, current_url: str) -> Optional[str]:
+        """Find the next page link, mirroring SoupParser.find_next_page_url."""
+        try:
+            next_page = self._next_page(root)
+            if next_page and next_page[0].get('href') is not None:
+                next_url = urljoin(current_url, next_page[0].get('href'))
+                logger.info(f"Found next page URL: {next_url}")
+                return next_url
+            logger.info("No next page found")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting next page URL: {str(e)}")
+            raise PaginationException(f"Failed to get next page URL: {str(e)}") from e
@@ -0,0 +1,33 @@
+from typing import Optional
+
+from app.constants import HTML_PARSER_ENGINE, HTML_PARSER_TARGETED
+from app.parsers.base_parser import BaseParser, SiteSelectors
+
+
+def create_parser(
+    engine: str = HTML_PARSER_ENGINE,
+    targeted: bool = HTML_PARSER_TARGETED,
+    selectors: Optional[SiteSelectors] = None,
+) -> BaseParser:
+    """
+    Create the configured HTML parser engine.
+
+    Args:
+        engine (str): The engine name, either "lxml" or "soup". Defaults to HTML_PARSER_ENGINE.
+        targeted (bool): Whether the soup engine builds only the product and pagination subtrees.
+            Defaults to HTML_PARSER_TARGETED.
+        selectors (Optional[SiteSelectors]): The site's selectors. Defaults to those of TARGET_URL.
+
+    Returns:
+        BaseParser: The parser engine.
+
+    Raises:
+        ValueError: If the engine name is unknown.
+    """
+    if engine == "lxml":
+        from app.parsers.lxml_parser import LxmlParser
+        return LxmlParser(selectors)
+    if engine == "soup":
+        from app.parsers.soup_parser import SoupParser
+        return SoupParser(targeted=targeted, selectors=selectors)
+    raise ValueError(f"Unknown HTML parser engine: {engine}")
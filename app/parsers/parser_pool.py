@@ -0,0 +1,124 @@
+import asyncio
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Optional
+
+from app.constants import HTML_PARSER_ENGINE, HTML_PARSER_TARGETED, PARSER_POOL_SIZE
+from app.parsers.base_parser import BaseParser, ParsedPage, SiteSelectors
+from app.parsers.parser_factory import create_parser
+
+logger = logging.getLogger(__name__)
+
+# Parser engine settings of the current worker process, set once by the pool initializer.
+_worker_engine: str = HTML_PARSER_ENGINE
+_worker_targeted: bool = HTML_PARSER_TARGETED
+# Parsers of the current worker process, created once per set of site selectors.
+_worker_parsers: Dict[SiteSelectors, BaseParser] = {}
+
+
+def _init_worker(engine: str, targeted: bool) -> None:
+    """
+    Configure the parser engine once per worker process.
+
+    Args:
+        engine (str): The parser engine name.
+        targeted (bool): Whether the soup engine builds only the product and pagination subtrees.
+    """
+    global _worker_engine, _worker_targeted
+    _worker_engine = engine
+    _worker_targeted = targeted
+    _worker_parsers.clear()
+
+
+def _parse_in_worker(url: str, html: str, selectors: SiteSelectors) -> ParsedPage:
+    """
+    Parse a page inside a worker process.
+
+    Args:
+        url (str): The URL the HTML was fetched from.
+        html (str): The HTML content of the page.
+        selectors (SiteSelectors): The selectors of the page's site.
+
+    Returns:
+        ParsedPage: Plain, picklable product records and pagination data.
+    """
+    parser = _worker_parsers.get(selectors)
+    if parser is None:
+        parser = _worker_parsers[selectors] = create_parser(_worker_engine, _worker_targeted, selectors)
+    return parser.parse_page(url, html)
+
+
+class ParserPool:
+    """
+    Runs the CPU-bound HTML extraction stage in a process pool.
+
+    Workers receive raw HTML and return plain ParsedPage records, so the event loop
+    only does I/O while pages are parsed on all cores.
+
+    Attributes:
+        max_workers (int): The number of worker processes.
+        engine (str): The parser engine used by the workers.
+        targeted (bool): Whether the soup engine builds only the product and pagination subtrees.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = PARSER_POOL_SIZE,
+        engine: str = HTML_PARSER_ENGINE,
+        targeted: bool = HTML_PARSER_TARGETED,
+    ) -> None:
+        """
+        Initialize the ParserPool.
+
+        Args:
+            max_workers (int): The number of worker processes. Defaults to PARSER_POOL_SIZE.
+            engine (str): The parser engine used by the workers. Defaults to HTML_PARSER_ENGINE.
+            targeted (bool): Whether the soup engine builds only the product and pagination subtrees.
+        """
+        self.max_workers = max_workers
+        self.engine = engine
+        self.targeted = targeted
+        self._executor: Optional[ProcessPoolExecutor] = None
+
+    def start(self) -> None:
+        """
+        Start the worker processes if they haven't been started yet.
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                initializer=_init_worker,
+                initargs=(self.engine, self.targeted),
+            )
+            logger.info(f"Parser pool started with {self.max_workers} workers using engine: {self.engine}")
+
+    def shutdown(self) -> None:
+        """
+        Stop the worker processes, waiting for in-flight parses to finish.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+            logger.info("Parser pool shut down")
+
+    async def parse_page(self, url: str, html: str, selectors: Optional[SiteSelectors] = None) -> ParsedPage:
+        """
+        Parse a page in a worker process without blocking the event loop.
+
+        Args:
+            url (str): The URL the HTML was fetched from.
+            html (str): The HTML content of the page.
+            selectors (Optional[SiteSelectors]): The selectors of the page's site. Defaults to those of TARGET_URL.
+
+        Returns:
+            ParsedPage: The extracted product records and pagination data.
+
+        Raises:
+            RuntimeError: If the pool has not been started.
+            ParsingException: If the HTML cannot be parsed.
+            PaginationException: If there's an error getting the next page URL.
+        """
+        if self._executor is None:
+            raise RuntimeError("Parser pool is not running; call start() first")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, _parse_in_worker, url, html, selectors or SiteSelectors())
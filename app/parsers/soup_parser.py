@@ -0,0 +1,159 @@
+import logging
+from decimal import Decimal
+from typing import List, Optional
+from urllib.parse import urljoin
+
+from bs4 import BeautifulSoup, SoupStrainer, Tag
+
+from app.exceptions.scraper_exceptions import PaginationException, ParsingException
+from app.parsers.base_parser import BaseParser, ParsedPage, ProductRecord, SiteSelectors
+
+logger = logging.getLogger(__name__)
+
+
+class SoupParser(BaseParser):
+    """
+    BeautifulSoup parser engine, kept as the compatibility reference.
+
+    In targeted mode a SoupStrainer restricts tree building to the product list
+    and pagination subtrees, skipping the rest of the themed page.
+
+    Attributes:
+        targeted (bool): Whether to build only the product and pagination subtrees.
+        parse_only (Optional[SoupStrainer]): The strainer used in targeted mode.
+    """
+
+    def __init__(self, targeted: bool = False, selectors: Optional[SiteSelectors] = None) -> None:
+        """
+        Initialize the SoupParser.
+
+        Args:
+            targeted (bool): Whether to build only the product and pagination subtrees.
+            selectors (Optional[SiteSelectors]): The site's selectors. Defaults to those of TARGET_URL.
+        """
+        super().__init__(selectors)
+        self.targeted = targeted
+        self.parse_only: Optional[SoupStrainer] = SoupStrainer(class_=self._is_targeted_class) if targeted else None
+
+    def _is_targeted_class(self, class_value: Optional[str]) -> bool:
+        """
+        Whether a class attribute marks a product or pagination element.
+
+        Elements usually carry several classes, e.g. "product type-product instock", so the
+        value is split and checked for either class rather than compared as a whole.
+
+        Args:
+            class_value (Optional[str]): The class attribute, or one of its values, as given by bs4.
+
+        Returns:
+            bool: True if the product or page numbers class is among the classes.
+        """
+        if not class_value:
+            return False
+        classes = class_value.split()
+        return self.selectors.product_class in classes or self.selectors.page_numbers_class in classes
+
+    def parse_page(self, url: str, html: str) -> ParsedPage:
+        """
+        Parse a catalog page and extract its products and pagination.
+
+        Args:
+            url (str): The URL the HTML was fetched from, used to resolve relative links.
+            html (str): The HTML content of the page.
+
+        Returns:
+            ParsedPage: The extracted product records and pagination data.
+
+        Raises:
+            ParsingException: If the HTML cannot be parsed.
+            PaginationException: If there's an error getting the next page URL.
+        """
+        try:
+            soup = BeautifulSoup(html, 'html.parser', parse_only=self.parse_only)
+        except Exception as e:
+            logger.error(f"Error parsing page {url}: {str(e)}")
+            raise ParsingException(f"Failed to parse page: {str(e)}") from e
+
+        return ParsedPage(
+            product_records=self._extract_product_records(soup, url),
+            next_page_url=self.find_next_page_url(soup, url, self.selectors.next_page_class),
+            last_page_number=self._find_last_page_number(soup),
+        )
+
+    def _extract_product_records(self, soup: BeautifulSoup, base_url: str) -> List[ProductRecord]:
+        """Extract a record for every product element, skipping those that fail."""
+        records = []
+        for product_element in soup.find_all('li', class_=self.selectors.product_class):
+            try:
+                records.append(ProductRecord(
+                    source_id=self._extract_product_id(product_element),
+                    product_title=self._extract_product_title(product_element),
+                    product_price=self._extract_product_price(product_element),
+                    image_url=self._extract_product_image_url(product_element, base_url),
+                ))
+            except Exception as e:
+                logger.warning(f"Skipping product due to parsing error: {str(e)}")
+                logger.warning(f"Product element: {product_element}")
+        return records
+
+    @staticmethod
+    def _extract_product_id(product_element: Tag) -> str:
+        """Extract the product ID from the product element."""
+        product_id_element = product_element.find('a', class_='button')
+        return product_id_element.get('data-product_id', '') if product_id_element else ''
+
+    def _extract_product_title(self, product_element: Tag) -> str:
+        """Extract the product title from the product element."""
+        title_element = product_element.find('h2', class_=self.selectors.product_title_class)
+        return title_element.a.text.strip() if title_element and title_element.a else ''
+
+    def _extract_product_price(self, product_element: Tag) -> Decimal:
+        """Extract the product price from the product element."""
+        price_element = product_element.find('span', class_=self.selectors.product_price_class)
+        return self.parse_price(price_element.text if price_element else '')
+
+    def _extract_product_image_url(self, product_element: Tag, base_url: str) -> str:
+        """Extract the product image URL from the product element."""
+        image_element = product_element.find('img', class_=self.selectors.product_image_class)
+        image_url = image_element.get(self.selectors.image_url_attribute, '') if image_element else ''
+        return urljoin(base_url, image_url)
+
+    def _find_last_page_number(self, soup: BeautifulSoup) -> Optional[int]:
+        """Find the highest page number shown in the pagination block."""
+        numbers = [
+            number for number in (
+                self.parse_page_number(element.get_text(strip=True))
+                for element in soup.find_all(['a', 'span'], class_=self.selectors.page_numbers_class)
+            ) if number is not None
+        ]
+        return max(numbers) if numbers else None
+
+    @staticmethod
+    def find_next_page_url(
+        soup: BeautifulSoup, current_url: str, next_page_class: str = SiteSelectors.next_page_class
+    ) -> Optional[str]:
+        """
+        Find the next page link in an already parsed page.
+
+        Args:
+            soup (BeautifulSoup): The parsed page.
+            current_url (str): The URL of the current page.
+            next_page_class (str): The compound class of the next page link.
+
+        Returns:
+            Optional[str]: The URL of the next page, or None if there is no next page.
+
+        Raises:
+            PaginationException: If there's an error getting the next page URL.
+        """
+        try:
+            next_page = soup.select_one(f'.{next_page_class}')
+            if next_page and 'href' in next_page.attrs:
+                next_url = urljoin(current_url, next_page['href'])
+                logger.info(f"Found next page URL: {next_url}")
+                return next_url
+            logger.info("No next page found")
+            return None
+        except Exception as e:
+            logger.error(f"Error getting next page URL: {str(e)}")
+            raise PaginationException(f"Failed to get next page URL: {str(e)}") from e
@@ -1,13 +1,64 @@
-from typing import List
+import logging
+from typing import Any, Dict, List
 
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.future import select
 from sqlalchemy.orm import sessionmaker
 
+from app.constants import (
+    DATABASE_URL,
+    DB_ECHO,
+    DB_MAX_OVERFLOW,
+    DB_POOL_RECYCLE,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUT,
+    DB_UPSERT_BATCH_SIZE,
+)
 from app.models.db_models import ProductDB
 from app.models.product import Product
 from app.repositories.base_repository import BaseRepository
 
+logger = logging.getLogger(__name__)
+
+# The columns overwritten when a product with the same ID already exists.
+UPSERT_COLUMNS = ("source", "source_id", "product_title", "product_price", "path_to_image")
+# The most bind parameters the Postgres wire protocol allows in one statement.
+MAX_BIND_PARAMETERS = 32767
+
+
+def create_db_engine(
+    db_url: str = DATABASE_URL,
+    pool_size: int = DB_POOL_SIZE,
+    max_overflow: int = DB_MAX_OVERFLOW,
+    pool_timeout: float = DB_POOL_TIMEOUT,
+    pool_recycle: int = DB_POOL_RECYCLE,
+    echo: bool = DB_ECHO,
+) -> AsyncEngine:
+    """
+    Creates the pooled database engine, meant to be shared for the lifetime of the app.
+
+    Args:
+        db_url (str): The database connection URL. Defaults to DATABASE_URL.
+        pool_size (int): The number of connections kept open in the pool.
+        max_overflow (int): The number of extra connections allowed beyond `pool_size` under load.
+        pool_timeout (float): The seconds to wait for a free connection before giving up.
+        pool_recycle (int): The seconds after which a connection is replaced, to outlive server-side timeouts.
+        echo (bool): Whether every SQL statement is logged.
+
+    Returns:
+        AsyncEngine: The engine, to be disposed of on shutdown.
+    """
+    return create_async_engine(
+        db_url,
+        echo=echo,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=True,
+    )
+
 
 class PostgresRepository(BaseRepository):
     """
@@ -16,21 +67,24 @@ class PostgresRepository(BaseRepository):
     This class implements the methods defined in the BaseRepository for saving and retrieving products.
     """
 
-    def __init__(self, db_url: str) -> None:
+    def __init__(self, engine: AsyncEngine, batch_size: int = DB_UPSERT_BATCH_SIZE) -> None:
         """
-        Initializes the PostgresRepository with the database URL.
+        Initializes the PostgresRepository with a database engine.
 
         Args:
-            db_url (str): The database connection URL.
+            engine (AsyncEngine): The pooled engine shared by the app, see create_db_engine.
+            batch_size (int): The maximum number of rows per upsert statement and transaction, lowered if
+                needed so a statement stays within MAX_BIND_PARAMETERS.
         """
-        self.engine = create_async_engine(db_url, echo=True)
+        self.batch_size = max(1, min(batch_size, MAX_BIND_PARAMETERS // (len(UPSERT_COLUMNS) + 1)))
+        self.engine = engine
         self.async_session = sessionmaker(
             self.engine, class_=AsyncSession, expire_on_commit=False
         )
 
     async def save_product(self, product: Product) -> None:
         """
-        Saves a single product to the PostgreSQL database.
+        Saves a single product to the PostgreSQL database, updating it if it already exists.
 
         Args:
             product (Product): The Product instance to be saved.
@@ -38,21 +92,15 @@ class PostgresRepository(BaseRepository):
         Raises:
             Exception: If there is an error during the save operation.
         """
-        async with self.async_session() as session:
-            db_product = ProductDB(
-                id=product.id,
-                source=product.source,
-                source_id=product.source_id,
-                product_title=product.product_title,
-                product_price=product.product_price,
-                path_to_image=product.path_to_image
-            )
-            session.add(db_product)
-            await session.commit()
+        await self.save_products([product])
 
     async def save_products(self, products: List[Product]) -> None:
         """
-        Saves a list of products to the PostgreSQL database.
+        Upserts a list of products into the PostgreSQL database.
+
+        Products are written with multi-row INSERT ... ON CONFLICT (id) DO UPDATE statements
+        of at most `batch_size` rows, each batch in its own transaction. If a product ID
+        appears more than once, the last occurrence is kept.
 
         Args:
             products (List[Product]): A list of Product instances to be saved.
@@ -60,20 +108,38 @@ class PostgresRepository(BaseRepository):
         Raises:
             Exception: If there is an error during the save operation.
         """
-        async with self.async_session() as session:
-            db_products = [
-                ProductDB(
-                    id=product.id,
-                    source=product.source,
-                    source_id=product.source_id,
-                    product_title=product.product_title,
-                    product_price=product.product_price,
-                    path_to_image=product.path_to_image
-                )
-                for product in products
-            ]
-            session.add_all(db_products)
-            await session.commit()
+        rows = list({product.id: self._to_row(product) for product in products}.values())
+        for start in range(0, len(rows), self.batch_size):
+            batch = rows[start:start + self.batch_size]
+            statement = insert(ProductDB).values(batch)
+            statement = statement.on_conflict_do_update(
+                index_elements=[ProductDB.id],
+                set_={column: statement.excluded[column] for column in UPSERT_COLUMNS},
+            )
+            async with self.async_session() as session:
+                async with session.begin():
+                    await session.execute(statement)
+            logger.info(f"Upserted {len(batch)} products")
+
+    @staticmethod
+    def _to_row(product: Product) -> Dict[str, Any]:
+        """
+        Converts a product into the column values of its database row.
+
+        Args:
+            product (Product): The Product instance to convert.
+
+        Returns:
+            Dict[str, Any]: The column values, by column name.
+        """
+        return {
+            "id": product.id,
+            "source": product.source,
+            "source_id": product.source_id,
+            "product_title": product.product_title,
+            "product_price": product.product_price,
+            "path_to_image": product.path_to_image,
+        }
 
     async def get_all_products(self) -> List[Product]:
         """
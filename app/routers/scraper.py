@@ -1,134 +1,382 @@
+import json
 import logging
-import os
-from typing import List, Optional, Tuple
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from starlette.status import (
-    HTTP_403_FORBIDDEN,
+    HTTP_202_ACCEPTED,
+    HTTP_404_NOT_FOUND,
     HTTP_422_UNPROCESSABLE_ENTITY,
-    HTTP_500_INTERNAL_SERVER_ERROR,
     HTTP_503_SERVICE_UNAVAILABLE,
 )
 
-from app.cache.redis_cache import RedisCache
-from app.constants import (
-    DATABASE_URL,
-    EMAIL_PASSWORD,
-    EMAIL_RECEIVER,
-    EMAIL_SENDER,
-    TWILIO_ACCOUNT_SID,
-    TWILIO_AUTH_TOKEN,
-    TWILIO_FROM_NUMBER,
-    TWILIO_TO_NUMBER,
-)
-from app.exceptions.authentication_exceptions import AuthenticationException
-from app.exceptions.caching_exceptions import CacheException
-from app.exceptions.notification_exceptions import NotificationException
-from app.exceptions.scraper_exceptions import ScraperException
-from app.exceptions.storage_exceptions import StorageException
+from app.exceptions.job_exceptions import JobNotFoundException, JobQueueFullException
+from app.exceptions.scraper_exceptions import CheckpointException, ScraperException
 from app.models.product import Product
-from app.notifications.console_notifier import ConsoleNotifier
-from app.notifications.email_notifier import EmailNotifier
-from app.notifications.twilio_notifier import TwilioNotifier
 from app.repositories.postgres_repository import PostgresRepository
-from app.schemas.scraper_schemas import ScraperRequest, ScraperResponse
+from app.schemas.scraper_schemas import (
+    MultiSiteScraperRequest,
+    MultiSiteScraperResponse,
+    ScrapeJobResponse,
+    ScraperRequest,
+    ScraperResponse,
+)
 from app.services.caching_service import CachingService
 from app.services.notification_service import NotificationService
 from app.services.scraper_service import ScraperService
 from app.services.storage_service import StorageService
+from app.utils.crawl_checkpoint import CrawlCheckpoint
+from app.utils.job_queue import ScrapeJob, ScrapeJobQueue
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-async def get_scraper_service() -> ScraperService:
+def get_storage_service(request: Request) -> StorageService:
+    """
+    Build the storage service on the database engine created with the app.
+
+    Args:
+        request (Request): The incoming request, used to reach the app-lifetime database engine.
+
+    Returns:
+        StorageService: A storage service backed by Postgres.
+    """
+    return StorageService(PostgresRepository(request.app.state.db_engine))
+
+def get_caching_service(request: Request) -> CachingService:
     """
-    Initialize and return a ScraperService instance.
+    Build the caching service on the price cache and near cache created with the app.
 
-    This function sets up all necessary dependencies for the ScraperService,
-    including database connection, caching, and notification services.
+    Args:
+        request (Request): The incoming request, used to reach the app-lifetime caches.
+
+    Returns:
+        CachingService: The caching service.
+    """
+    return CachingService(request.app.state.cache, getattr(request.app.state, "near_cache", None))
+
+def get_notification_service(request: Request) -> NotificationService:
+    """
+    Return the notification service created with the app.
+
+    Args:
+        request (Request): The incoming request, used to reach the app-lifetime notifiers.
+
+    Returns:
+        NotificationService: The notification service.
+    """
+    return request.app.state.notification_service
+
+def get_scraper_service(
+    request: Request,
+    storage_service: StorageService = Depends(get_storage_service),
+    caching_service: CachingService = Depends(get_caching_service),
+    notification_service: NotificationService = Depends(get_notification_service),
+) -> ScraperService:
+    """
+    Build a ScraperService from the connection pools and services created with the app.
+
+    Nothing here opens a connection or reads a file: the site configs, database engine,
+    price cache, HTTP transport, parser pool and notifiers are all created once in the app lifespan.
+
+    Args:
+        request (Request): The incoming request, used to reach the site configs, parser pool and HTTP transport.
+        storage_service (StorageService): The storage service (injected dependency).
+        caching_service (CachingService): The caching service (injected dependency).
+        notification_service (NotificationService): The notification service (injected dependency).
 
     Returns:
         ScraperService: An instance of the ScraperService.
+    """
+    return ScraperService(
+        storage_service,
+        caching_service,
+        notification_service,
+        parser_pool=getattr(request.app.state, "parser_pool", None),
+        sites=getattr(request.app.state, "sites", None),
+        transport=getattr(request.app.state, "transport", None),
+    )
 
-    Raises:
-        HTTPException: If there's an error during initialization.
+def get_job_queue(request: Request) -> ScrapeJobQueue:
     """
-    logger.info("Initializing scraper service")
-    try:
-        db_url = DATABASE_URL
-        repository = PostgresRepository(db_url)
-        storage_service = StorageService(repository)
-
-        cache = RedisCache()
-        await cache.initialize()
-        caching_service = CachingService(cache)
-
-        notifiers: List[ConsoleNotifier | EmailNotifier | TwilioNotifier] = []
-        if all([os.getenv(env_var) for env_var in [TWILIO_ACCOUNT_SID, TWILIO_AUTH_TOKEN, TWILIO_FROM_NUMBER, TWILIO_TO_NUMBER]]):
-            logger.info("Twilio notifier enabled")
-            notifiers.append(TwilioNotifier())
-        if all([os.getenv(env_var) for env_var in [EMAIL_SENDER, EMAIL_PASSWORD, EMAIL_RECEIVER]]):
-            logger.info("Email notifier enabled")
-            notifiers.append(EmailNotifier())
-        if not notifiers:
-            logger.info("No external notifiers configured, using console notifier")
-            notifiers.append(ConsoleNotifier())
-
-        notification_service = NotificationService(notifiers)
-
-        logger.info("Scraper service initialized")
-        return ScraperService(storage_service, caching_service, notification_service)
-    except AuthenticationException as e:
-        logger.error(f"Authentication error initializing scraper service: {str(e)}")
-        raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Authentication failed initializing scraper service")
-    except (StorageException, CacheException, NotificationException) as e:
-        logger.error(f"Failed to initialize scraper service: {str(e)}")
-        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Service Unavailable: Failed to initialize scraper service")
-
-@router.post("/scrape", response_model=ScraperResponse, status_code=200)
+    Return the scrape job queue started with the app.
+
+    Args:
+        request (Request): The incoming request, used to reach the app-lifetime job queue.
+
+    Returns:
+        ScrapeJobQueue: The job queue.
+    """
+    return request.app.state.job_queue
+
+def _job_response(job: ScrapeJob) -> ScrapeJobResponse:
+    """
+    Describe a scrape job for the API.
+
+    Args:
+        job (ScrapeJob): The job.
+
+    Returns:
+        ScrapeJobResponse: The job's status, progress and, once it has completed, its result.
+    """
+    def to_datetime(timestamp: Optional[float]) -> Optional[datetime]:
+        return datetime.fromtimestamp(timestamp, timezone.utc) if timestamp is not None else None
+
+    return ScrapeJobResponse(
+        job_id=job.id,
+        status=job.status,
+        created_at=to_datetime(job.created_at),
+        started_at=to_datetime(job.started_at),
+        finished_at=to_datetime(job.finished_at),
+        pages_done=job.pages_done,
+        total_scraped=job.products_scraped,
+        total_updated=job.products_updated,
+        resume_token=job.resume_token,
+        result=job.result,
+        error=job.error,
+        submissions=job.submissions
+    )
+
+def _request_key(request: ScraperRequest) -> str:
+    """
+    Normalize a scrape request into the key identical requests are coalesced on.
+
+    Proxies are compared as a set, since the crawl rotates through them regardless of order.
+
+    Args:
+        request (ScraperRequest): The scrape request.
+
+    Returns:
+        str: The request's parameters as canonical JSON.
+    """
+    return json.dumps({
+        "page_limit": request.page_limit,
+        "proxy": str(request.proxy) if request.proxy else None,
+        "proxies": sorted({str(proxy) for proxy in request.proxies or []}),
+        "resume_token": request.resume_token,
+        "site": request.site,
+    }, sort_keys=True)
+
+async def _run_scrape(scraper_service: ScraperService, request: ScraperRequest, job: ScrapeJob) -> ScraperResponse:
+    """
+    Run a scrape job and summarize its result.
+
+    The result is kept with the job for status queries, so it carries only the counts;
+    the updated products themselves are in the database.
+
+    Args:
+        scraper_service (ScraperService): The scraper service to run the scrape with.
+        request (ScraperRequest): The request the job was submitted with.
+        job (ScrapeJob): The job, which progress is reported on.
+
+    Returns:
+        ScraperResponse: The result of the scrape.
+    """
+    total_scraped, total_updated, _, resume_token = await scraper_service.scrape_catalog_streaming(
+        page_limit=request.page_limit,
+        proxy=str(request.proxy) if request.proxy else None,
+        resume_token=request.resume_token,
+        proxies=[str(proxy) for proxy in request.proxies] if request.proxies else None,
+        site_name=request.site,
+        progress=job.record_progress
+    )
+    logger.info(f"Scraping completed. Total products: {total_scraped}, Updated products: {total_updated}")
+    return ScraperResponse(
+        status="partial" if resume_token else "success",
+        total_scraped=total_scraped,
+        total_updated=total_updated,
+        resume_token=resume_token
+    )
+
+@router.post("/scrape", response_model=ScrapeJobResponse, status_code=HTTP_202_ACCEPTED)
 async def scrape(
     request: ScraperRequest,
-    scraper_service: ScraperService = Depends(get_scraper_service)
-) -> ScraperResponse:
+    scraper_service: ScraperService = Depends(get_scraper_service),
+    job_queue: ScrapeJobQueue = Depends(get_job_queue)
+) -> ScrapeJobResponse:
     """
-    Initiate a scraping operation.
+    Submit a scraping job.
 
-    This endpoint triggers a scraping process based on the provided request parameters.
-    It uses the ScraperService to perform the actual scraping and returns the results.
+    The request is validated and queued, and the job ID returned straight away; the
+    crawl runs on the job queue's worker pool. Poll `GET /scrape/{job_id}` for its
+    progress and result.
+
+    Identical requests are coalesced: while a job for the same parameters is queued or
+    running, or completed within SCRAPE_RESULT_REUSE_SECONDS, that job is returned
+    instead of starting another crawl of the same catalog.
 
     Args:
         request (ScraperRequest): The request object containing scraping parameters.
         scraper_service (ScraperService): The scraper service instance (injected dependency).
+        job_queue (ScrapeJobQueue): The scrape job queue (injected dependency).
 
     Returns:
-        ScraperResponse: The response containing the results of the scraping operation.
+        ScrapeJobResponse: The queued job, or the identical job it was coalesced into.
 
     Raises:
-        HTTPException: If there's an error during the scraping process.
+        HTTPException: If the resume token or site is unknown, or the job queue is full.
     """
-    logger.info(f"Received scrape request with page_limit: {request.page_limit}, proxy: {request.proxy}")
+    logger.info(
+        f"Received scrape request with page_limit: {request.page_limit}, proxy: {request.proxy}, "
+        f"resume_token: {request.resume_token}"
+    )
     try:
-        all_products, updated_products = await scraper_service.scrape_catalog(
-            page_limit=request.page_limit,
-            proxy=str(request.proxy) if request.proxy else None
+        if request.resume_token:
+            CrawlCheckpoint.load(request.resume_token)
+        else:
+            request.site = scraper_service.get_site(request.site).name
+        job = job_queue.submit(
+            lambda job: _run_scrape(scraper_service, request, job),
+            request.dict(exclude_none=True),
+            key=_request_key(request)
         )
-        logger.info(f"Scraping completed. Total products: {len(all_products)}, Updated products: {len(updated_products)}")
-        return ScraperResponse(
-            status="success",
-            total_scraped=len(all_products),
-            total_updated=len(updated_products),
-            updated_products=[product.dict() for product in updated_products]
+        return _job_response(job)
+    except CheckpointException as e:
+        logger.error(f"Cannot resume scraping: {str(e)}")
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=f"Not Found: {str(e)}")
+    except ScraperException as e:
+        logger.error(f"Cannot submit scraping job: {str(e)}")
+        raise HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unprocessable Entity: {str(e)}")
+    except JobQueueFullException as e:
+        logger.error(f"Cannot submit scraping job: {str(e)}")
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=f"Service Unavailable: {str(e)}")
+
+@router.get("/scrape/{job_id}", response_model=ScrapeJobResponse, status_code=200)
+async def get_scrape_job(job_id: str, job_queue: ScrapeJobQueue = Depends(get_job_queue)) -> ScrapeJobResponse:
+    """
+    Report the status, progress and result of a scraping job.
+
+    Args:
+        job_id (str): The ID returned when the job was submitted.
+        job_queue (ScrapeJobQueue): The scrape job queue (injected dependency).
+
+    Returns:
+        ScrapeJobResponse: The job.
+
+    Raises:
+        HTTPException: If no job has the ID.
+    """
+    try:
+        return _job_response(job_queue.get(job_id))
+    except JobNotFoundException as e:
+        raise HTTPException(status_code=HTTP_404_NOT_FOUND, detail=f"Not Found: {str(e)}")
+
+@router.get("/cache/stats", status_code=200)
+async def cache_stats(request: Request) -> Dict[str, Any]:
+    """
+    Report the hit and miss counters of this worker's in-process price cache.
+
+    Args:
+        request (Request): The incoming request, used to reach the near cache started with the app.
+
+    Returns:
+        Dict[str, Any]: The near cache counters, or `{"enabled": False}` if it is disabled.
+    """
+    near_cache = getattr(request.app.state, "near_cache", None)
+    if near_cache is None:
+        return {"enabled": False}
+    return {"enabled": True, **near_cache.stats()}
+
+def _multi_site_request_key(request: MultiSiteScraperRequest) -> str:
+    """
+    Normalize a multi-site scrape request into the key identical requests are coalesced on.
+
+    Sites and proxies are compared as sets, since the sites are crawled at once and the
+    crawls rotate through the proxies regardless of order.
+
+    Args:
+        request (MultiSiteScraperRequest): The multi-site scrape request, with its sites resolved.
+
+    Returns:
+        str: The request's parameters as canonical JSON.
+    """
+    return json.dumps({
+        "sites": sorted(set(request.sites or [])),
+        "page_limit": request.page_limit,
+        "proxies": sorted({str(proxy) for proxy in request.proxies or []}),
+    }, sort_keys=True)
+
+async def _run_multi_site_scrape(
+    scraper_service: ScraperService, request: MultiSiteScraperRequest, job: ScrapeJob
+) -> MultiSiteScraperResponse:
+    """
+    Run a multi-site scrape job and summarize each site's result.
+
+    As with single-site jobs, the result carries only the counts. A site whose scrape
+    fails is reported in `errors` without failing the others.
+
+    Args:
+        scraper_service (ScraperService): The scraper service to run the scrape with.
+        request (MultiSiteScraperRequest): The request the job was submitted with.
+        job (ScrapeJob): The job.
+
+    Returns:
+        MultiSiteScraperResponse: The results of each site's scrape.
+    """
+    site_results = await scraper_service.scrape_sites(
+        site_names=request.sites,
+        page_limit=request.page_limit,
+        proxies=[str(proxy) for proxy in request.proxies] if request.proxies else None
+    )
+    response = MultiSiteScraperResponse(status="success")
+    for site_name, result in site_results.items():
+        if isinstance(result, BaseException):
+            logger.error(f"Scraping of {site_name} failed: {str(result)}")
+            response.errors[site_name] = str(result)
+            response.status = "partial"
+            continue
+        total_scraped, total_updated, _, resume_token = result
+        if resume_token:
+            response.status = "partial"
+        response.results[site_name] = ScraperResponse(
+            status="partial" if resume_token else "success",
+            total_scraped=total_scraped,
+            total_updated=total_updated,
+            resume_token=resume_token
+        )
+    logger.info(f"Multi-site scraping of job {job.id} finished with status {response.status}")
+    return response
+
+@router.post("/scrape/sites", response_model=ScrapeJobResponse, status_code=HTTP_202_ACCEPTED)
+async def scrape_sites(
+    request: MultiSiteScraperRequest,
+    scraper_service: ScraperService = Depends(get_scraper_service),
+    job_queue: ScrapeJobQueue = Depends(get_job_queue)
+) -> ScrapeJobResponse:
+    """
+    Submit a job scraping several configured sites at once under a shared concurrency budget.
+
+    The sites are validated and the job queued like `POST /scrape`, including the
+    coalescing of identical requests. Poll `GET /scrape/{job_id}` for its result.
+
+    Args:
+        request (MultiSiteScraperRequest): The request object containing the sites and scraping parameters.
+        scraper_service (ScraperService): The scraper service instance (injected dependency).
+        job_queue (ScrapeJobQueue): The scrape job queue (injected dependency).
+
+    Returns:
+        ScrapeJobResponse: The queued job, or the identical job it was coalesced into.
+
+    Raises:
+        HTTPException: If a site isn't configured, or the job queue is full.
+    """
+    logger.info(f"Received multi-site scrape request for sites: {request.sites}, page_limit: {request.page_limit}")
+    try:
+        if request.sites:
+            request.sites = [scraper_service.get_site(name).name for name in request.sites]
+        else:
+            request.sites = [site.name for site in scraper_service.sites]
+        job = job_queue.submit(
+            lambda job: _run_multi_site_scrape(scraper_service, request, job),
+            request.dict(exclude_none=True),
+            key=_multi_site_request_key(request)
         )
-    except AuthenticationException as e:
-        logger.error(f"Authentication failed during scraping: {str(e)}")
-        raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Authentication failed during scraping")
+        return _job_response(job)
     except ScraperException as e:
-        logger.error(f"Scraping failed: {str(e)}")
+        logger.error(f"Cannot submit multi-site scraping job: {str(e)}")
         raise HTTPException(status_code=HTTP_422_UNPROCESSABLE_ENTITY, detail=f"Unprocessable Entity: {str(e)}")
-    except (StorageException, CacheException, NotificationException) as e:
-        logger.error(f"Service error during scraping process: {str(e)}")
-        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Service Unavailable: Internal service error")
-    except Exception as e:
-        logger.error(f"Unexpected error during scraping process: {str(e)}")
-        raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal Server Error")
+    except JobQueueFullException as e:
+        logger.error(f"Cannot submit multi-site scraping job: {str(e)}")
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail=f"Service Unavailable: {str(e)}")
@@ -1,4 +1,5 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field, HttpUrl
 
@@ -12,9 +13,15 @@ class ScraperRequest(BaseModel):
     Attributes:
         page_limit (Optional[int]): Maximum number of pages to scrape. Must be greater than or equal to 1.
         proxy (Optional[HttpUrl]): Proxy URL to use for scraping.
+        proxies (Optional[List[HttpUrl]]): Proxy URLs to rotate through while scraping.
+        resume_token (Optional[str]): Token of an interrupted crawl to continue from its last checkpoint.
+        site (Optional[str]): Name of the configured site to scrape. Defaults to the first configured site.
     """
     page_limit: Optional[int] = Field(None, ge=1, description="Maximum number of pages to scrape")
     proxy: Optional[HttpUrl] = Field(None, description="Proxy URL to use for scraping")
+    proxies: Optional[List[HttpUrl]] = Field(None, description="Proxy URLs to rotate through while scraping")
+    resume_token: Optional[str] = Field(None, description="Token of an interrupted crawl to resume")
+    site: Optional[str] = Field(None, description="Name of the configured site to scrape")
 
 
 class ScraperResponse(BaseModel):
@@ -25,9 +32,75 @@ class ScraperResponse(BaseModel):
         status (str): Status of the scraping operation.
         total_scraped (int): Total number of products scraped.
         total_updated (int): Number of products updated in the database.
-        updated_products (List[ProductSchema]): List of updated products.
+        updated_products (List[ProductSchema]): A sample of the updated products, at most
+            UPDATED_PRODUCTS_SAMPLE_SIZE of them. Empty in job results, which keep only the counts.
+        resume_token (Optional[str]): Token to resume the crawl with, if it was interrupted.
     """
     status: str = Field(..., description="Status of the scraping operation")
     total_scraped: int = Field(..., ge=0, description="Total number of products scraped")
     total_updated: int = Field(..., ge=0, description="Number of products updated in the database")
-    updated_products: List[ProductSchema] = Field(default_factory=list, description="List of updated products")
+    updated_products: List[ProductSchema] = Field(default_factory=list, description="Sample of updated products")
+    resume_token: Optional[str] = Field(None, description="Token to resume an interrupted crawl with")
+
+
+class MultiSiteScraperRequest(BaseModel):
+    """
+    Schema for the multi-site scraper request payload.
+
+    Attributes:
+        sites (Optional[List[str]]): Names of the configured sites to scrape. Defaults to all of them.
+        page_limit (Optional[int]): Maximum number of pages to scrape per site. Must be greater than or equal to 1.
+        proxies (Optional[List[HttpUrl]]): Proxy URLs to rotate through while scraping.
+    """
+    sites: Optional[List[str]] = Field(None, description="Names of the configured sites to scrape")
+    page_limit: Optional[int] = Field(None, ge=1, description="Maximum number of pages to scrape per site")
+    proxies: Optional[List[HttpUrl]] = Field(None, description="Proxy URLs to rotate through while scraping")
+
+
+class MultiSiteScraperResponse(BaseModel):
+    """
+    Schema for the multi-site scraper response payload.
+
+    Attributes:
+        status (str): "success" if every site finished, "partial" otherwise.
+        results (Dict[str, ScraperResponse]): The result of each site that was scraped, by site name.
+        errors (Dict[str, str]): The error of each site whose scrape failed, by site name.
+    """
+    status: str = Field(..., description="Status of the scraping operation")
+    results: Dict[str, ScraperResponse] = Field(default_factory=dict, description="Results by site name")
+    errors: Dict[str, str] = Field(default_factory=dict, description="Errors by site name")
+
+
+class ScrapeJobResponse(BaseModel):
+    """
+    Schema for the status of a scraping job.
+
+    Attributes:
+        job_id (str): ID of the job, to poll its status with.
+        status (str): "queued", "running", "completed", "failed" or "cancelled".
+        created_at (datetime): When the job was submitted.
+        started_at (Optional[datetime]): When the job started running.
+        finished_at (Optional[datetime]): When the job finished.
+        pages_done (int): Number of catalog pages finished so far.
+        total_scraped (int): Number of products scraped so far.
+        total_updated (int): Number of products updated in the database so far.
+        resume_token (Optional[str]): Token to resume the job's crawl with, while it is incomplete.
+        result (Optional[Union[ScraperResponse, MultiSiteScraperResponse]]): Result of the scrape, once
+            the job has completed.
+        error (Optional[str]): Error the job failed with, if any.
+        submissions (int): Number of identical scrape requests served by this job, including the first.
+    """
+    job_id: str = Field(..., description="ID of the scraping job")
+    status: str = Field(..., description="Status of the scraping job")
+    created_at: datetime = Field(..., description="When the job was submitted")
+    started_at: Optional[datetime] = Field(None, description="When the job started running")
+    finished_at: Optional[datetime] = Field(None, description="When the job finished")
+    pages_done: int = Field(0, ge=0, description="Number of catalog pages finished so far")
+    total_scraped: int = Field(0, ge=0, description="Number of products scraped so far")
+    total_updated: int = Field(0, ge=0, description="Number of products updated in the database so far")
+    resume_token: Optional[str] = Field(None, description="Token to resume the job's crawl with")
+    result: Optional[Union[ScraperResponse, MultiSiteScraperResponse]] = Field(
+        None, description="Result of the scrape once the job has completed"
+    )
+    error: Optional[str] = Field(None, description="Error the job failed with")
+    submissions: int = Field(1, ge=1, description="Number of identical scrape requests served by this job")
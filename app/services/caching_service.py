@@ -1,22 +1,29 @@
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
-from app.cache.redis_cache import RedisCache
+from app.cache.base_cache import BaseCache
+from app.cache.near_cache import NearCache
 
 
 class CachingService:
     """
-    A service class for caching product prices using Redis.
+    A service class for caching product prices in the configured cache backend.
+
+    With a near cache, lookups are answered in-process when possible and only misses go
+    to the backend. Writes go through to both tiers and are published as invalidations,
+    so other workers' near caches drop the old prices.
     """
 
-    def __init__(self, cache: RedisCache):
+    def __init__(self, cache: BaseCache, near_cache: Optional[NearCache] = None):
         """
-        Initialize the CachingService with a Redis cache.
+        Initialize the CachingService with a cache backend.
 
         Args:
-            cache (RedisCache): An instance of RedisCache for caching operations.
+            cache (BaseCache): The cache backend, such as RedisCache or SqliteCache.
+            near_cache (Optional[NearCache]): An in-process cache in front of the backend, shared across requests.
         """
         self.cache = cache
+        self.near_cache = near_cache
 
     async def get_product_price(self, product_id: str) -> Optional[Decimal]:
         """
@@ -28,8 +35,15 @@ class CachingService:
         Returns:
             Optional[Decimal]: The price of the product as a Decimal, or None if not found.
         """
+        if self.near_cache is not None:
+            found, price = self.near_cache.get(product_id)
+            if found:
+                return price
         price_str = await self.cache.get_product_price(product_id)
-        return Decimal(price_str) if price_str else None
+        price = Decimal(price_str) if price_str else None
+        if price is not None and self.near_cache is not None:
+            self.near_cache.set(product_id, price)
+        return price
 
     async def set_product_price(self, product_id: str, price: Decimal) -> None:
         """
@@ -43,3 +57,65 @@ class CachingService:
             None
         """
         await self.cache.set_product_price(product_id, str(price))
+        if self.near_cache is not None:
+            self.near_cache.set(product_id, price)
+        await self.cache.publish_price_invalidation([product_id], self._origin())
+
+    async def get_product_prices(self, product_ids: List[str]) -> Dict[str, Optional[Decimal]]:
+        """
+        Retrieve the cached prices of many products in a few round trips.
+
+        Only the products missing from the near cache are looked up in the backend.
+
+        Args:
+            product_ids (List[str]): The unique identifiers of the products.
+
+        Returns:
+            Dict[str, Optional[Decimal]]: The price of each product as a Decimal, or None if not found.
+        """
+        prices: Dict[str, Optional[Decimal]] = {}
+        missing = product_ids
+        if self.near_cache is not None:
+            missing = []
+            for product_id in product_ids:
+                found, price = self.near_cache.get(product_id)
+                if found:
+                    prices[product_id] = price
+                else:
+                    missing.append(product_id)
+        if missing:
+            for product_id, price_str in (await self.cache.get_product_prices(missing)).items():
+                price = Decimal(price_str) if price_str else None
+                prices[product_id] = price
+                if price is not None and self.near_cache is not None:
+                    self.near_cache.set(product_id, price)
+        return prices
+
+    async def set_product_prices(self, prices: Dict[str, Decimal]) -> None:
+        """
+        Cache the prices of many products in a few round trips.
+
+        Args:
+            prices (Dict[str, Decimal]): The price of each product, by product ID.
+
+        Returns:
+            None
+        """
+        await self.cache.set_product_prices({product_id: str(price) for product_id, price in prices.items()})
+        if self.near_cache is not None:
+            for product_id, price in prices.items():
+                self.near_cache.set(product_id, price)
+        await self.cache.publish_price_invalidation(list(prices), self._origin())
+
+    def stats(self) -> Optional[Dict[str, Any]]:
+        """
+        Return the near cache's hit and miss counters.
+
+        Returns:
+            Optional[Dict[str, Any]]: The counters, or None if there is no near cache.
+        """
+        return self.near_cache.stats() if self.near_cache is not None else None
+
+    def _origin(self) -> Optional[str]:
+        """The ID invalidations are published under, so the near cache can skip its own."""
+        return self.near_cache.instance_id if self.near_cache is not None else None
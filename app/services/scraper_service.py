@@ -1,16 +1,28 @@
+import asyncio
 import logging
 from decimal import Decimal
-from typing import List, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple, Union
 
+from app.constants import (
+    SCHEDULER_GLOBAL_CONCURRENCY,
+    STREAM_BATCH_SIZE,
+    UPDATED_PRODUCTS_SAMPLE_SIZE,
+)
 from app.exceptions.caching_exceptions import CacheException
 from app.exceptions.notification_exceptions import NotificationException
 from app.exceptions.scraper_exceptions import ScraperException
 from app.exceptions.storage_exceptions import StorageException
 from app.models.product import Product
+from app.models.site_config import SiteConfig, load_site_configs
+from app.parsers.parser_pool import ParserPool
 from app.services.caching_service import CachingService
 from app.services.notification_service import NotificationService
 from app.services.storage_service import StorageService
+from app.transports.base_transport import BaseTransport
+from app.utils.crawl_checkpoint import CrawlCheckpoint
+from app.utils.crawl_scheduler import CrawlScheduler, SiteShare
 from app.utils.scraper import Scraper
+from app.utils.store_api_scraper import StoreApiScraper
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +31,15 @@ class ScraperService:
     Service class for handling web scraping operations and managing product data.
     """
 
-    def __init__(self, storage_service: StorageService, caching_service: CachingService, notification_service: NotificationService):
+    def __init__(
+        self,
+        storage_service: StorageService,
+        caching_service: CachingService,
+        notification_service: NotificationService,
+        parser_pool: Optional[ParserPool] = None,
+        sites: Optional[List[SiteConfig]] = None,
+        transport: Optional[BaseTransport] = None,
+    ):
         """
         Initialize the ScraperService.
 
@@ -27,41 +47,183 @@ class ScraperService:
             storage_service (StorageService): Service for storing product data.
             caching_service (CachingService): Service for caching product prices.
             notification_service (NotificationService): Service for sending notifications.
+            parser_pool (Optional[ParserPool]): Process pool used to parse pages off the event loop.
+            sites (Optional[List[SiteConfig]]): The sites that can be crawled, the first being the default,
+                as loaded once at startup. If omitted, they are read from SITES_CONFIG_PATH, or TARGET_URL alone.
+            transport (Optional[BaseTransport]): An open HTTP transport shared by every crawl's
+                unproxied requests. If omitted, each scraper opens its own.
         """
         self.storage_service = storage_service
         self.caching_service = caching_service
         self.notification_service = notification_service
+        self.parser_pool = parser_pool
+        self.sites = sites or load_site_configs()
+        self.transport = transport
 
-    async def scrape_catalog(self, page_limit: Optional[int] = None, proxy: Optional[str] = None) -> Tuple[List[Product], List[Product]]:
+    def get_site(self, name: Optional[str] = None) -> SiteConfig:
         """
-        Scrape the product catalog and update changed products.
+        Look up a configured site by name.
 
         Args:
-            page_limit (Optional[int]): Maximum number of pages to scrape.
+            name (Optional[str]): The site name. Defaults to the first configured site.
+
+        Returns:
+            SiteConfig: The site config.
+
+        Raises:
+            ScraperException: If no site has the name.
+        """
+        if name is None:
+            return self.sites[0]
+        for site in self.sites:
+            if site.name == name:
+                return site
+        raise ScraperException(f"Unknown site: {name}")
+
+    async def scrape_catalog_streaming(
+        self,
+        page_limit: Optional[int] = None,
+        proxy: Optional[str] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        resume_token: Optional[str] = None,
+        proxies: Optional[List[str]] = None,
+        site_name: Optional[str] = None,
+        share: Optional[SiteShare] = None,
+        progress: Optional[Callable[[CrawlCheckpoint, int, int], None]] = None,
+        sample_size: int = UPDATED_PRODUCTS_SAMPLE_SIZE,
+    ) -> Tuple[int, int, List[Product], Optional[str]]:
+        """
+        Scrape the product catalog, updating changed products in micro-batches as they arrive.
+
+        Products are pulled from Scraper.iter_products and diffed, cached and persisted every
+        `batch_size` products, so memory stays bounded by the batch rather than the catalog
+        and the first products are written while the crawl is still running. The crawl is
+        held back while a batch is being written, and the batch is dropped once it is
+        persisted: only the update count and a sample of the first `sample_size` updated
+        products are kept.
+
+        Progress is checkpointed after every page, and the checkpoint notes how far the
+        recorded products have been persisted after every batch. If the crawl stops on a
+        failing page, it is resumed from the checkpoint under the scraper's retry policy, with
+        full-jitter backoff and from the crawl's retry budget; if it still can't finish, the
+        checkpoint is kept and its token returned so a later call can continue from it. A
+        resumed crawl first writes the recorded products the earlier call hadn't persisted,
+        and its counts cover the whole crawl, earlier calls included.
+
+        Args:
+            page_limit (Optional[int]): Maximum number of pages to scrape. Defaults to the site's page limit.
+                Ignored when resuming, where the page limit of the original crawl applies.
             proxy (Optional[str]): Proxy server to use for scraping.
+            batch_size (int): Number of products per update batch. Defaults to STREAM_BATCH_SIZE.
+            resume_token (Optional[str]): Token of an interrupted crawl to continue.
+            proxies (Optional[List[str]]): Proxy servers to rotate through. Defaults to PROXY_LIST.
+            site_name (Optional[str]): The site to crawl. Defaults to the first configured site, or when
+                resuming, the site of the original crawl.
+            share (Optional[SiteShare]): The site's share of a scheduler's global concurrency, if any.
+            progress (Optional[Callable[[CrawlCheckpoint, int, int], None]]): Called with the checkpoint,
+                the number of scraped products and the number of updated products as the crawl advances.
+            sample_size (int): Number of updated products to return as a sample.
+                Defaults to UPDATED_PRODUCTS_SAMPLE_SIZE.
 
         Returns:
-            Tuple[List[Product], List[Product]]: A tuple containing all scraped products and updated products.
+            Tuple[int, int, List[Product], Optional[str]]: The number of scraped products, the number of
+                updated products, a sample of the updated products of this call and the resume token if the
+                crawl is incomplete.
 
         Raises:
             ScraperException: If scraping fails after retries.
+            CheckpointException: If the resume token doesn't match a saved crawl.
+            ScraperException: If the site isn't configured.
             StorageException: If there's an error storing products.
             CacheException: If there's an error caching product prices.
             NotificationException: If there's an error sending notifications.
         """
-        logger.info(f"Starting catalog scrape with page_limit: {page_limit}, proxy: {proxy}")
+        logger.info(
+            f"Starting streaming catalog scrape with page_limit: {page_limit}, proxy: {proxy}, "
+            f"resume_token: {resume_token}, site: {site_name}"
+        )
+        if resume_token:
+            checkpoint = CrawlCheckpoint.load(resume_token)
+            site = self.get_site(checkpoint.site_name or site_name)
+        else:
+            site = self.get_site(site_name)
+            checkpoint = CrawlCheckpoint.create(page_limit=page_limit or site.page_limit, site_name=site.name)
+
         try:
-            scraper: Scraper = Scraper(proxy=proxy)
-            all_products: List[Product] = await scraper.scrape_catalog(page_limit=page_limit)
-            logger.info(f"Scraped {len(all_products)} products")
+            total_scraped = checkpoint.products_persisted
+            total_updated = checkpoint.products_updated
+            updated_sample: List[Product] = []
+            batch: List[Product] = []
+            # The position among the checkpoint's recorded products that the batch is persisted up to.
+            batch_end = checkpoint.products_persisted
+
+            def report_progress() -> None:
+                if progress is not None:
+                    progress(checkpoint, total_scraped, total_updated)
+
+            async def write_batch() -> None:
+                nonlocal batch, total_updated
+                updated = await self.update_changed_products(batch)
+                total_updated += len(updated)
+                updated_sample.extend(updated[:sample_size - len(updated_sample)])
+                checkpoint.record_persisted(batch_end, total_updated)
+                batch = []
 
-            updated_products = await self.update_changed_products(all_products)
+            async def add_product(product: Product, position: int) -> None:
+                nonlocal total_scraped, batch_end
+                batch.append(product)
+                batch_end = position + 1
+                total_scraped += 1
+                report_progress()
+                if len(batch) >= batch_size:
+                    await write_batch()
 
-            message: str = f"Scraping completed. {len(all_products)} products were scraped, {len(updated_products)} were updated in the database."
+            # Products of pages finished by the earlier call may not have been written before it stopped.
+            for position, product in checkpoint.iter_unpersisted_products():
+                await add_product(product, position)
+            # Scraped products are recorded in the checkpoint, in order, before they are yielded.
+            position = checkpoint.products_recorded
+
+            async with self._create_scraper(site, proxy, proxies, share) as scraper:
+                retry_policy = scraper.retry_policy
+                for attempt in range(1, retry_policy.max_attempts + 1):
+                    async for product in scraper.iter_products(page_limit=checkpoint.page_limit, checkpoint=checkpoint):
+                        await add_product(product, position)
+                        position += 1
+                    if checkpoint.completed or attempt == retry_policy.max_attempts:
+                        break
+                    if not retry_policy.budget.try_spend():
+                        logger.warning(f"Retry budget exhausted, not resuming crawl {checkpoint.token}")
+                        break
+                    delay = retry_policy.backoff(attempt)
+                    logger.warning(
+                        f"Crawl {checkpoint.token} stopped after page {checkpoint.pages_done}, "
+                        f"resuming in {delay:.2f}s (attempt {attempt + 1}/{retry_policy.max_attempts})"
+                    )
+                    await asyncio.sleep(delay)
+            if batch:
+                await write_batch()
+            report_progress()
+            logger.info(f"Scraped {total_scraped} products")
+
+            if checkpoint.completed:
+                checkpoint.delete()
+                message: str = (
+                    f"Scraping of {site.name} completed. {total_scraped} products were scraped, "
+                    f"{total_updated} were updated in the database."
+                )
+                next_token: Optional[str] = None
+            else:
+                message = (
+                    f"Scraping of {site.name} stopped after page {checkpoint.pages_done}. "
+                    f"{total_scraped} products were scraped, "
+                    f"{total_updated} were updated in the database. Resume with token {checkpoint.token}."
+                )
+                next_token = checkpoint.token
             logger.info(message)
             await self.notification_service.notify_all(message)
 
-            return all_products, updated_products
+            return total_scraped, total_updated, updated_sample, next_token
         except ScraperException as e:
             error_message: str = f"Scraping failed after retries: {str(e)}"
             logger.error(error_message)
@@ -76,10 +238,80 @@ class ScraperService:
             logger.error(f"Failed to send notification: {str(e)}")
             raise
 
+    async def scrape_sites(
+        self,
+        site_names: Optional[List[str]] = None,
+        page_limit: Optional[int] = None,
+        proxies: Optional[List[str]] = None,
+        batch_size: int = STREAM_BATCH_SIZE,
+        global_concurrency: int = SCHEDULER_GLOBAL_CONCURRENCY,
+    ) -> Dict[str, Union[Tuple[int, int, List[Product], Optional[str]], BaseException]]:
+        """
+        Crawl several sites at once, sharing one concurrency budget fairly between them.
+
+        Each site is crawled as by scrape_catalog_streaming, with its own checkpoint and
+        notifications, while a CrawlScheduler splits the global budget by site weight.
+
+        Args:
+            site_names (Optional[List[str]]): The sites to crawl. Defaults to every configured site.
+            page_limit (Optional[int]): Maximum number of pages per site. Defaults to each site's page limit.
+            proxies (Optional[List[str]]): Proxy servers to rotate through. Defaults to PROXY_LIST.
+            batch_size (int): Number of products per update batch. Defaults to STREAM_BATCH_SIZE.
+            global_concurrency (int): Page scrapes in flight across all sites.
+                Defaults to SCHEDULER_GLOBAL_CONCURRENCY.
+
+        Returns:
+            Dict[str, Union[Tuple[int, int, List[Product], Optional[str]], BaseException]]: Each site's result
+                as returned by scrape_catalog_streaming, or the exception its crawl failed with.
+
+        Raises:
+            ScraperException: If a site isn't configured.
+        """
+        sites = [self.get_site(name) for name in site_names] if site_names else self.sites
+        scheduler = CrawlScheduler(sites, global_concurrency)
+        return await scheduler.run(
+            lambda site, share: self.scrape_catalog_streaming(
+                page_limit=page_limit, batch_size=batch_size, proxies=proxies, site_name=site.name, share=share
+            )
+        )
+
+    def _create_scraper(
+        self,
+        site: SiteConfig,
+        proxy: Optional[str],
+        proxies: Optional[List[str]],
+        share: Optional[SiteShare] = None,
+    ) -> Scraper:
+        """
+        Create the scraper for a crawl: the Store API engine when the site enables it, HTML otherwise.
+
+        Args:
+            site (SiteConfig): The site to crawl.
+            proxy (Optional[str]): Proxy server to use for scraping.
+            proxies (Optional[List[str]]): Proxy servers to rotate through.
+            share (Optional[SiteShare]): The site's share of a scheduler's global concurrency, if any.
+
+        Returns:
+            Scraper: The scraper, to be used as an async context manager.
+        """
+        scraper_class = StoreApiScraper if site.store_api else Scraper
+        return scraper_class(
+            proxy=proxy,
+            proxies=proxies,
+            parser_pool=self.parser_pool,
+            site=site,
+            share=share,
+            transport=self.transport,
+        )
+
     async def update_changed_products(self, products: List[Product]) -> List[Product]:
         """
         Update products that have changed prices.
 
+        Cached prices are read for the whole list in one batch. The changed products are
+        then upserted into storage in batches, and their new prices written back to the
+        cache in one batch.
+
         Args:
             products (List[Product]): List of products to check and potentially update.
 
@@ -93,14 +325,21 @@ class ScraperService:
         logger.info(f"Updating changed products out of {len(products)} scraped products")
         updated_products: List[Product] = []
         try:
+            cached_prices = await self.caching_service.get_product_prices([product.id for product in products])
             for product in products:
-                cached_price: Optional[Decimal] = await self.caching_service.get_product_price(product.id)
+                cached_price: Optional[Decimal] = cached_prices.get(product.id)
                 if cached_price is None or cached_price != product.product_price:
                     logger.info(f"Updating product {product.id}: price changed from {cached_price} to {product.product_price}")
-                    await self.storage_service.save_product(product)
-                    await self.caching_service.set_product_price(product.id, product.product_price)
                     updated_products.append(product)
+            if updated_products:
+                await self.storage_service.save_products(updated_products)
+                await self.caching_service.set_product_prices(
+                    {product.id: product.product_price for product in updated_products}
+                )
             logger.info(f"Updated {len(updated_products)} products")
+            cache_stats = self.caching_service.stats()
+            if cache_stats is not None:
+                logger.info(f"Price cache stats: {cache_stats}")
             return updated_products
         except StorageException as e:
             logger.error(f"Error saving product to storage: {str(e)}")
@@ -0,0 +1,184 @@
+import asyncio
+import logging
+import ssl
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Mapping, Optional
+
+import aiohttp
+
+from app.constants import (
+    HTTP_CONNECT_TIMEOUT,
+    HTTP_CONNECTOR_LIMIT,
+    HTTP_CONNECTOR_LIMIT_PER_HOST,
+    HTTP_DEFAULT_TIMEOUT,
+    HTTP_DNS_CACHE_TTL,
+    HTTP_KEEPALIVE_TIMEOUT,
+)
+from app.exceptions.transport_exceptions import (
+    TransportException,
+    TransportProxyException,
+    TransportTimeoutException,
+)
+from app.transports.base_transport import BaseTransport, TransportResponse, accepted_encodings, create_ssl_context
+
+logger = logging.getLogger(__name__)
+
+
+class AiohttpResponse(TransportResponse):
+    """
+    A TransportResponse backed by an aiohttp.ClientResponse.
+
+    Attributes:
+        response (aiohttp.ClientResponse): The wrapped response.
+    """
+
+    def __init__(self, response: aiohttp.ClientResponse) -> None:
+        """
+        Initialize the AiohttpResponse.
+
+        Args:
+            response (aiohttp.ClientResponse): The wrapped response.
+        """
+        self.response = response
+
+    @property
+    def status(self) -> int:
+        """The HTTP status code."""
+        return self.response.status
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """The response headers, matched case-insensitively."""
+        return self.response.headers
+
+    @property
+    def http_version(self) -> str:
+        """The protocol version, always HTTP/1.x with aiohttp."""
+        return f"HTTP/{self.response.version.major}.{self.response.version.minor}"
+
+    async def text(self) -> str:
+        """Read and decode the whole body as text."""
+        return await self.response.text()
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream the decompressed body in chunks of at most `chunk_size` bytes."""
+        async for chunk in self.response.content.iter_chunked(chunk_size):
+            yield chunk
+
+
+class AiohttpTransport(BaseTransport):
+    """
+    HTTP/1.1 transport over a single pooled aiohttp.ClientSession.
+
+    Page fetches and image downloads share the same connector, so TCP/TLS
+    connections and DNS lookups are reused instead of being paid for per request.
+
+    Attributes:
+        limit (int): Maximum number of simultaneous connections.
+        limit_per_host (int): Maximum number of simultaneous connections to one host.
+        ttl_dns_cache (int): Seconds to cache resolved DNS entries.
+        keepalive_timeout (float): Seconds to keep idle connections open.
+        default_timeout (float): Total seconds allowed for a request that doesn't set its own timeout.
+        connect_timeout (float): Seconds allowed to connect, for requests without their own timeout.
+        ssl_context (ssl.SSLContext): SSL context shared by all connections.
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        limit: int = HTTP_CONNECTOR_LIMIT,
+        limit_per_host: int = HTTP_CONNECTOR_LIMIT_PER_HOST,
+        ttl_dns_cache: int = HTTP_DNS_CACHE_TTL,
+        keepalive_timeout: float = HTTP_KEEPALIVE_TIMEOUT,
+        default_timeout: float = HTTP_DEFAULT_TIMEOUT,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        """
+        Initialize the AiohttpTransport.
+
+        Args:
+            proxy (Optional[str]): The proxy every request goes through, if any.
+            limit (int): Maximum number of simultaneous connections.
+            limit_per_host (int): Maximum number of simultaneous connections to one host.
+            ttl_dns_cache (int): Seconds to cache resolved DNS entries.
+            keepalive_timeout (float): Seconds to keep idle connections open.
+            default_timeout (float): Total seconds allowed for a request that doesn't set its own timeout.
+            connect_timeout (float): Seconds allowed to connect, for requests without their own timeout.
+            ssl_context (Optional[ssl.SSLContext]): SSL context to use. Defaults to a non-verifying context.
+        """
+        super().__init__(proxy)
+        self.limit = limit
+        self.limit_per_host = limit_per_host
+        self.ttl_dns_cache = ttl_dns_cache
+        self.keepalive_timeout = keepalive_timeout
+        self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout
+        self.ssl_context = ssl_context or create_ssl_context()
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def open(self) -> None:
+        """
+        Create the pooled session if it hasn't been created yet.
+        """
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.limit,
+                limit_per_host=self.limit_per_host,
+                ttl_dns_cache=self.ttl_dns_cache,
+                keepalive_timeout=self.keepalive_timeout,
+                ssl=self.ssl_context,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector,
+                headers={"Accept-Encoding": accepted_encodings()},
+                timeout=aiohttp.ClientTimeout(total=self.default_timeout, sock_connect=self.connect_timeout),
+            )
+            logger.info(
+                f"aiohttp transport opened with limit: {self.limit}, limit_per_host: {self.limit_per_host}, "
+                f"ttl_dns_cache: {self.ttl_dns_cache}, keepalive_timeout: {self.keepalive_timeout}"
+            )
+
+    async def close(self) -> None:
+        """
+        Close the pooled session and release all connections.
+        """
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("aiohttp transport closed")
+        self._session = None
+
+    @asynccontextmanager
+    async def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> AsyncIterator[TransportResponse]:
+        """
+        Send a GET request and stream its response for the duration of an `async with` block.
+
+        Args:
+            url (str): The URL to request.
+            headers (Optional[Dict[str, str]]): Extra request headers.
+            timeout (Optional[float]): The total seconds allowed for the request. Defaults to `default_timeout`.
+
+        Yields:
+            TransportResponse: The response.
+
+        Raises:
+            RuntimeError: If the transport has not been opened.
+            TransportTimeoutException: If the request times out.
+            TransportProxyException: If the proxy can't be reached or rejects the request.
+            TransportException: If the request fails for another reason.
+        """
+        if self._session is None or self._session.closed:
+            raise RuntimeError("HTTP transport is not open; use 'async with' or call open() first")
+        # Without a timeout, the session's default ClientTimeout applies.
+        options = {"timeout": aiohttp.ClientTimeout(total=timeout)} if timeout is not None else {}
+        try:
+            async with self._session.get(url, headers=headers, proxy=self.proxy, **options) as response:
+                yield AiohttpResponse(response)
+        except asyncio.TimeoutError as e:
+            raise TransportTimeoutException(f"Timed out requesting {url}") from e
+        except (aiohttp.ClientProxyConnectionError, aiohttp.ClientHttpProxyError) as e:
+            raise TransportProxyException(f"Proxy {self.proxy} failed requesting {url}: {str(e)}") from e
+        except aiohttp.ClientError as e:
+            raise TransportException(f"Request to {url} failed: {str(e)}") from e
@@ -0,0 +1,165 @@
+import importlib.util
+import ssl
+from abc import ABC, abstractmethod
+from types import TracebackType
+from typing import AsyncContextManager, AsyncIterator, Dict, Mapping, Optional, Type
+
+
+def create_ssl_context() -> ssl.SSLContext:
+    """
+    Create a custom SSL context that doesn't verify certificates.
+
+    Returns:
+        ssl.SSLContext: The custom SSL context.
+    """
+    context = ssl.create_default_context()
+    context.check_hostname = False
+    context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def accepted_encodings() -> str:
+    """
+    Build the Accept-Encoding header from the content codings that can be decoded here.
+
+    Brotli is only offered when a brotli decoder is installed, since both transports
+    rely on it to decode "br" responses.
+
+    Returns:
+        str: The Accept-Encoding header value.
+    """
+    encodings = ["gzip", "deflate"]
+    if importlib.util.find_spec("brotli") or importlib.util.find_spec("brotlicffi"):
+        encodings.append("br")
+    return ", ".join(encodings)
+
+
+class TransportResponse(ABC):
+    """
+    A streaming HTTP response, independent of the client library.
+
+    Bodies are decompressed incrementally as they are read, whether read whole or in chunks.
+    """
+
+    @property
+    @abstractmethod
+    def status(self) -> int:
+        """The HTTP status code."""
+        pass
+
+    @property
+    @abstractmethod
+    def headers(self) -> Mapping[str, str]:
+        """The response headers, matched case-insensitively."""
+        pass
+
+    @property
+    @abstractmethod
+    def http_version(self) -> str:
+        """The protocol version the response was received over, e.g. "HTTP/1.1" or "HTTP/2"."""
+        pass
+
+    @property
+    def content_length(self) -> Optional[int]:
+        """The Content-Length of the encoded body, if the server sent one."""
+        value = self.headers.get("Content-Length")
+        return int(value) if value and value.isdigit() else None
+
+    @abstractmethod
+    async def text(self) -> str:
+        """
+        Read and decode the whole body as text.
+
+        Returns:
+            str: The decoded body.
+
+        Raises:
+            TransportException: If the connection fails while reading.
+        """
+        pass
+
+    @abstractmethod
+    def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """
+        Stream the decompressed body in chunks.
+
+        Args:
+            chunk_size (int): The maximum number of bytes per chunk.
+
+        Returns:
+            AsyncIterator[bytes]: The body chunks.
+        """
+        pass
+
+
+class BaseTransport(ABC):
+    """
+    Abstract base class for HTTP transports.
+
+    A transport owns a connection pool for its lifetime and sends every request through
+    the same proxy, if it has one, so pooled connections stay pinned to that proxy.
+    Library errors raised while a response is open, including while its body is read,
+    are raised as TransportException subclasses.
+
+    Attributes:
+        proxy (Optional[str]): The proxy every request goes through, if any.
+    """
+
+    def __init__(self, proxy: Optional[str] = None) -> None:
+        """
+        Initialize the transport.
+
+        Args:
+            proxy (Optional[str]): The proxy every request goes through, if any.
+        """
+        self.proxy = proxy
+
+    @abstractmethod
+    async def open(self) -> None:
+        """
+        Create the connection pool if it hasn't been created yet.
+        """
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """
+        Close the connection pool and release all connections.
+        """
+        pass
+
+    @abstractmethod
+    def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> AsyncContextManager[TransportResponse]:
+        """
+        Send a GET request and stream its response for the duration of an `async with` block.
+
+        Args:
+            url (str): The URL to request.
+            headers (Optional[Dict[str, str]]): Extra request headers.
+            timeout (Optional[float]): The seconds allowed for the request. Defaults to the transport's
+                default timeout, HTTP_DEFAULT_TIMEOUT with HTTP_CONNECT_TIMEOUT to connect.
+
+        Returns:
+            AsyncContextManager[TransportResponse]: The response, released when the block exits.
+
+        Raises:
+            RuntimeError: If the transport has not been opened.
+            TransportTimeoutException: If the request times out.
+            TransportProxyException: If the proxy can't be reached or rejects the request.
+            TransportException: If the request fails for another reason.
+        """
+        pass
+
+    async def __aenter__(self) -> "BaseTransport":
+        await self.open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
@@ -0,0 +1,238 @@
+"""
+Compare HTTP transports on the same workload.
+
+By default a local aiohttp server is started that serves synthetic catalog pages and
+images with negotiated compression, and every transport fetches the same mix of pages
+and images from it:
+
+    python -m app.transports.benchmark --requests 500 --concurrency 50
+
+The local server only speaks HTTP/1.1, so it measures pooling and decompression
+overhead. To measure HTTP/2 multiplexing, point the benchmark at an h2-capable
+HTTPS server instead:
+
+    python -m app.transports.benchmark --url https://example.com/shop/
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from aiohttp import web
+
+from app.exceptions.transport_exceptions import TransportException
+from app.transports.transport_factory import create_transport
+
+logger = logging.getLogger(__name__)
+
+TRANSPORTS = ("aiohttp", "httpx")
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The outcome of running one transport over the workload.
+
+    Attributes:
+        transport (str): The transport name.
+        requests (int): The number of requests sent.
+        seconds (float): The wall-clock time of the whole run.
+        body_bytes (int): The number of decompressed body bytes read.
+        errors (int): The number of requests that failed.
+        http_versions (Counter): How many responses arrived over each protocol version.
+    """
+
+    transport: str
+    requests: int
+    seconds: float
+    body_bytes: int = 0
+    errors: int = 0
+    http_versions: Counter = field(default_factory=Counter)
+
+    @property
+    def requests_per_second(self) -> float:
+        """The throughput of the run."""
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    def __str__(self) -> str:
+        versions = ", ".join(f"{version}: {count}" for version, count in sorted(self.http_versions.items()))
+        return (
+            f"{self.transport:<8} {self.requests} requests in {self.seconds:.2f}s "
+            f"({self.requests_per_second:.1f} req/s), {self.body_bytes / 1024:.0f} KiB, "
+            f"{self.errors} errors [{versions}]"
+        )
+
+
+def create_test_app(page_size: int, image_size: int) -> web.Application:
+    """
+    Create a server that serves synthetic catalog pages and images.
+
+    Pages are compressible HTML and are compressed with whatever coding the client
+    accepts; images are random bytes and are sent as-is, like real JPEGs.
+
+    Args:
+        page_size (int): The approximate size of each page in bytes.
+        image_size (int): The size of each image in bytes.
+
+    Returns:
+        web.Application: The server application.
+    """
+    product = '<li class="product"><h2>Product {n}</h2><span class="price">{n}.00</span></li>'
+    page_body = "".join(product.format(n=n) for n in range(max(page_size // len(product), 1)))
+    image_body = os.urandom(image_size)
+
+    async def page(request: web.Request) -> web.Response:
+        response = web.Response(text=f"<html><body><ul>{page_body}</ul></body></html>", content_type="text/html")
+        response.enable_compression()
+        return response
+
+    async def image(request: web.Request) -> web.Response:
+        return web.Response(body=image_body, content_type="image/jpeg")
+
+    app = web.Application()
+    app.router.add_get("/page/{number}", page)
+    app.router.add_get("/image/{number}", image)
+    return app
+
+
+def build_urls(base_url: str, count: int, image_ratio: float) -> List[str]:
+    """
+    Build the request mix: pages interleaved with a share of image downloads.
+
+    Args:
+        base_url (str): The server root, without a trailing slash.
+        count (int): The total number of requests.
+        image_ratio (float): The fraction of requests that are images.
+
+    Returns:
+        List[str]: The URLs to request, in order.
+    """
+    images = int(count * image_ratio)
+    pages = count - images
+    urls = [f"{base_url}/page/{n}" for n in range(pages)] + [f"{base_url}/image/{n}" for n in range(images)]
+    # Interleave so pages and images compete for the same connections.
+    return urls[::2] + urls[1::2]
+
+
+async def benchmark_transport(name: str, urls: Sequence[str], concurrency: int) -> BenchmarkResult:
+    """
+    Fetch every URL through one transport and measure the run.
+
+    Args:
+        name (str): The transport name, as accepted by create_transport.
+        urls (Sequence[str]): The URLs to fetch.
+        concurrency (int): The number of requests in flight at once.
+
+    Returns:
+        BenchmarkResult: The measurements of the run.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    result = BenchmarkResult(transport=name, requests=len(urls), seconds=0.0)
+
+    async def fetch(url: str) -> None:
+        async with semaphore:
+            try:
+                async with transport.get(url) as response:
+                    async for chunk in response.iter_chunks(64 * 1024):
+                        result.body_bytes += len(chunk)
+                    result.http_versions[response.http_version] += 1
+                    if response.status >= 400:
+                        result.errors += 1
+            except TransportException as e:
+                logger.warning(f"{name} request failed: {str(e)}")
+                result.errors += 1
+
+    async with create_transport(name) as transport:
+        # Warm up the pool so connection setup isn't charged to the first transport only.
+        await fetch(urls[0])
+        result.body_bytes = 0
+        result.http_versions.clear()
+        result.errors = 0
+        started = time.monotonic()
+        await asyncio.gather(*(fetch(url) for url in urls))
+        result.seconds = time.monotonic() - started
+    return result
+
+
+async def run_benchmark(
+    transports: Sequence[str],
+    requests: int,
+    concurrency: int,
+    url: Optional[str] = None,
+    page_size: int = 64 * 1024,
+    image_size: int = 128 * 1024,
+    image_ratio: float = 0.5,
+) -> Dict[str, BenchmarkResult]:
+    """
+    Run the workload through each transport in turn.
+
+    Args:
+        transports (Sequence[str]): The transport names to compare.
+        requests (int): The number of requests per transport.
+        concurrency (int): The number of requests in flight at once.
+        url (Optional[str]): A URL to request repeatedly instead of starting the local server.
+        page_size (int): The approximate size of each local page in bytes.
+        image_size (int): The size of each local image in bytes.
+        image_ratio (float): The fraction of local requests that are images.
+
+    Returns:
+        Dict[str, BenchmarkResult]: The result of each transport, by name.
+    """
+    runner = None
+    if url is not None:
+        urls = [url] * requests
+    else:
+        runner = web.AppRunner(create_test_app(page_size, image_size))
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", 0).start()
+        port = runner.addresses[0][1]
+        urls = build_urls(f"http://127.0.0.1:{port}", requests, image_ratio)
+    try:
+        results = {}
+        for name in transports:
+            results[name] = await benchmark_transport(name, urls, concurrency)
+            print(results[name])
+        return results
+    finally:
+        if runner is not None:
+            await runner.cleanup()
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """
+    Parse the command line and run the benchmark.
+
+    Args:
+        argv (Optional[Sequence[str]]): The arguments, defaulting to sys.argv.
+    """
+    parser = argparse.ArgumentParser(description="Compare HTTP transports on the same workload.")
+    parser.add_argument("--transports", nargs="+", choices=TRANSPORTS, default=list(TRANSPORTS))
+    parser.add_argument("--requests", type=int, default=200, help="Requests per transport.")
+    parser.add_argument("--concurrency", type=int, default=20, help="Requests in flight at once.")
+    parser.add_argument("--url", help="Benchmark against this URL instead of the local test server.")
+    parser.add_argument("--page-size", type=int, default=64 * 1024, help="Local page size in bytes.")
+    parser.add_argument("--image-size", type=int, default=128 * 1024, help="Local image size in bytes.")
+    parser.add_argument("--image-ratio", type=float, default=0.5, help="Fraction of local requests for images.")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(
+        run_benchmark(
+            args.transports,
+            args.requests,
+            args.concurrency,
+            args.url,
+            args.page_size,
+            args.image_size,
+            args.image_ratio,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
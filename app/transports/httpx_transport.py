@@ -0,0 +1,197 @@
+import asyncio
+import logging
+import ssl
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, Mapping, Optional
+
+import httpx
+
+from app.constants import HTTP_CONNECT_TIMEOUT, HTTP_CONNECTOR_LIMIT, HTTP_DEFAULT_TIMEOUT, HTTP_KEEPALIVE_TIMEOUT
+from app.exceptions.transport_exceptions import (
+    TransportException,
+    TransportProxyException,
+    TransportTimeoutException,
+)
+from app.transports.base_transport import BaseTransport, TransportResponse, accepted_encodings, create_ssl_context
+
+logger = logging.getLogger(__name__)
+
+
+class HttpxResponse(TransportResponse):
+    """
+    A TransportResponse backed by an httpx.Response opened in streaming mode.
+
+    Attributes:
+        response (httpx.Response): The wrapped response.
+    """
+
+    def __init__(self, response: httpx.Response) -> None:
+        """
+        Initialize the HttpxResponse.
+
+        Args:
+            response (httpx.Response): The wrapped response.
+        """
+        self.response = response
+
+    @property
+    def status(self) -> int:
+        """The HTTP status code."""
+        return self.response.status_code
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """The response headers, matched case-insensitively."""
+        return self.response.headers
+
+    @property
+    def http_version(self) -> str:
+        """The protocol version the response was received over."""
+        return self.response.http_version
+
+    async def text(self) -> str:
+        """Read and decode the whole body as text."""
+        await self.response.aread()
+        return self.response.text
+
+    async def iter_chunks(self, chunk_size: int) -> AsyncIterator[bytes]:
+        """Stream the decompressed body in chunks of at most `chunk_size` bytes."""
+        async for chunk in self.response.aiter_bytes(chunk_size):
+            yield chunk
+
+
+class HttpxTransport(BaseTransport):
+    """
+    HTTP/2-capable transport over a pooled httpx.AsyncClient.
+
+    Hosts that negotiate HTTP/2 over TLS get a single connection each, with page and
+    image requests multiplexed as concurrent streams on it; other hosts fall back to
+    pooled HTTP/1.1 connections. Requires the `h2` package for HTTP/2.
+
+    Attributes:
+        http2 (bool): Whether to offer HTTP/2 during the TLS handshake.
+        max_connections (int): Maximum number of simultaneous connections.
+        keepalive_expiry (float): Seconds to keep idle connections open.
+        default_timeout (float): Seconds allowed for each phase of a request that doesn't set its own timeout.
+        connect_timeout (float): Seconds allowed to connect, for requests without their own timeout.
+        ssl_context (ssl.SSLContext): SSL context shared by all connections.
+    """
+
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        http2: bool = True,
+        max_connections: int = HTTP_CONNECTOR_LIMIT,
+        keepalive_expiry: float = HTTP_KEEPALIVE_TIMEOUT,
+        default_timeout: float = HTTP_DEFAULT_TIMEOUT,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        ssl_context: Optional[ssl.SSLContext] = None,
+    ) -> None:
+        """
+        Initialize the HttpxTransport.
+
+        Args:
+            proxy (Optional[str]): The proxy every request goes through, if any.
+            http2 (bool): Whether to offer HTTP/2 during the TLS handshake.
+            max_connections (int): Maximum number of simultaneous connections.
+            keepalive_expiry (float): Seconds to keep idle connections open.
+            default_timeout (float): Seconds allowed for each phase of a request that doesn't set its own timeout.
+            connect_timeout (float): Seconds allowed to connect, for requests without their own timeout.
+            ssl_context (Optional[ssl.SSLContext]): SSL context to use. Defaults to a non-verifying context.
+        """
+        super().__init__(proxy)
+        self.http2 = http2
+        self.max_connections = max_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.default_timeout = default_timeout
+        self.connect_timeout = connect_timeout
+        self.ssl_context = ssl_context or create_ssl_context()
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def open(self) -> None:
+        """
+        Create the pooled client if it hasn't been created yet.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                verify=self.ssl_context,
+                proxy=self.proxy,
+                limits=httpx.Limits(max_connections=self.max_connections, keepalive_expiry=self.keepalive_expiry),
+                headers={"Accept-Encoding": accepted_encodings()},
+                follow_redirects=True,
+                timeout=httpx.Timeout(self.default_timeout, connect=self.connect_timeout),
+            )
+            logger.info(
+                f"httpx transport opened with http2: {self.http2}, max_connections: {self.max_connections}, "
+                f"keepalive_expiry: {self.keepalive_expiry}"
+            )
+
+    async def close(self) -> None:
+        """
+        Close the pooled client and release all connections.
+        """
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            logger.info("httpx transport closed")
+        self._client = None
+
+    @asynccontextmanager
+    async def get(
+        self, url: str, headers: Optional[Dict[str, str]] = None, timeout: Optional[float] = None
+    ) -> AsyncIterator[TransportResponse]:
+        """
+        Send a GET request and stream its response for the duration of an `async with` block.
+
+        httpx applies a timeout to each phase of the request separately, so a request's own
+        timeout is also enforced as a deadline on the whole block, body reads included, as
+        the aiohttp transport does: the task is cancelled when it passes, and the
+        cancellation is raised as a timeout.
+
+        Args:
+            url (str): The URL to request.
+            headers (Optional[Dict[str, str]]): Extra request headers.
+            timeout (Optional[float]): The seconds allowed for the whole request.
+                Defaults to `default_timeout` for each phase of the request.
+
+        Yields:
+            TransportResponse: The response.
+
+        Raises:
+            RuntimeError: If the transport has not been opened.
+            TransportTimeoutException: If the request times out.
+            TransportProxyException: If the proxy can't be reached or rejects the request.
+            TransportException: If the request fails for another reason.
+        """
+        if self._client is None or self._client.is_closed:
+            raise RuntimeError("HTTP transport is not open; use 'async with' or call open() first")
+        # Without a timeout, the client's default httpx.Timeout applies; None would disable timeouts altogether.
+        request_timeout = timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT
+        task = asyncio.current_task()
+        expired = False
+
+        def expire() -> None:
+            nonlocal expired
+            expired = True
+            task.cancel()
+
+        deadline = asyncio.get_running_loop().call_later(timeout, expire) if timeout is not None else None
+        try:
+            async with self._client.stream("GET", url, headers=headers, timeout=request_timeout) as response:
+                yield HttpxResponse(response)
+        except asyncio.CancelledError as e:
+            if not expired:
+                raise
+            # Python 3.11+ counts cancellation requests; this one has been handled.
+            if hasattr(task, "uncancel"):
+                task.uncancel()
+            raise TransportTimeoutException(f"Timed out requesting {url} after {timeout}s") from e
+        except httpx.TimeoutException as e:
+            raise TransportTimeoutException(f"Timed out requesting {url}") from e
+        except httpx.ProxyError as e:
+            raise TransportProxyException(f"Proxy {self.proxy} failed requesting {url}: {str(e)}") from e
+        except httpx.HTTPError as e:
+            raise TransportException(f"Request to {url} failed: {str(e)}") from e
+        finally:
+            if deadline is not None:
+                deadline.cancel()
@@ -0,0 +1,28 @@
+from typing import Optional
+
+from app.constants import HTTP_TRANSPORT
+from app.transports.base_transport import BaseTransport
+
+
+def create_transport(name: str = HTTP_TRANSPORT, proxy: Optional[str] = None) -> BaseTransport:
+    """
+    Create the configured HTTP transport.
+
+    Args:
+        name (str): The transport name, either "aiohttp" (HTTP/1.1) or "httpx" (HTTP/2-capable).
+            Defaults to HTTP_TRANSPORT.
+        proxy (Optional[str]): The proxy every request goes through, if any.
+
+    Returns:
+        BaseTransport: The transport, not yet opened.
+
+    Raises:
+        ValueError: If the transport name is unknown.
+    """
+    if name == "aiohttp":
+        from app.transports.aiohttp_transport import AiohttpTransport
+        return AiohttpTransport(proxy=proxy)
+    if name == "httpx":
+        from app.transports.httpx_transport import HttpxTransport
+        return HttpxTransport(proxy=proxy)
+    raise ValueError(f"Unknown HTTP transport: {name}")
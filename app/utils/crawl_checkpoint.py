@@ -0,0 +1,266 @@
+import json
+import logging
+import os
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from pydantic import ValidationError
+
+from app.constants import CHECKPOINT_DIR
+from app.exceptions.scraper_exceptions import CheckpointException
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+
+class CrawlCheckpoint:
+    """
+    The persisted progress of a catalog crawl, saved after every completed page.
+
+    The crawl state (pages done, frontier and pagination pattern) lives in a small JSON
+    file that is rewritten atomically per page, while extracted products are appended
+    to a JSON Lines file tagged with their page number, so checkpoint cost stays
+    proportional to the page rather than the catalog. The state also tracks how many
+    of those products the crawl has saved, so a resumed crawl only replays the rest.
+
+    Attributes:
+        token (str): The resume token identifying the crawl.
+        checkpoint_dir (str): The directory checkpoints are stored in.
+        page_limit (Optional[int]): The page limit of the crawl.
+        site_name (Optional[str]): The name of the site being crawled.
+        pages_done (int): The number of consecutive catalog pages completed, starting at page 1.
+        next_url (Optional[str]): The next page link of the last completed page.
+        page_url_template (Optional[str]): The numbered page URL template, if the catalog has one.
+        last_page_number (Optional[int]): The last page number shown in the pagination block, if any.
+        completed (bool): Whether the crawl reached the end of the catalog or its page limit.
+        products_recorded (int): The number of products recorded for the completed pages.
+        products_persisted (int): The number of recorded products, in catalog order, already saved.
+        products_updated (int): The number of products updated in the database by the crawl so far.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        checkpoint_dir: str = CHECKPOINT_DIR,
+        page_limit: Optional[int] = None,
+        site_name: Optional[str] = None,
+    ) -> None:
+        """
+        Initialize the CrawlCheckpoint.
+
+        Args:
+            token (str): The resume token identifying the crawl.
+            checkpoint_dir (str): The directory checkpoints are stored in.
+            page_limit (Optional[int]): The page limit of the crawl.
+            site_name (Optional[str]): The name of the site being crawled.
+        """
+        self.token = token
+        self.checkpoint_dir = checkpoint_dir
+        self.page_limit = page_limit
+        self.site_name = site_name
+        self.pages_done = 0
+        self.next_url: Optional[str] = None
+        self.page_url_template: Optional[str] = None
+        self.last_page_number: Optional[int] = None
+        self.completed = False
+        self.products_recorded = 0
+        self.products_persisted = 0
+        self.products_updated = 0
+
+    @property
+    def state_path(self) -> str:
+        """The path of the crawl state file."""
+        return os.path.join(self.checkpoint_dir, f"{self.token}.json")
+
+    @property
+    def products_path(self) -> str:
+        """The path of the extracted products file."""
+        return os.path.join(self.checkpoint_dir, f"{self.token}.products.jsonl")
+
+    @classmethod
+    def create(
+        cls,
+        page_limit: Optional[int] = None,
+        checkpoint_dir: str = CHECKPOINT_DIR,
+        site_name: Optional[str] = None,
+    ) -> "CrawlCheckpoint":
+        """
+        Start a new checkpoint with a fresh resume token.
+
+        Args:
+            page_limit (Optional[int]): The page limit of the crawl.
+            checkpoint_dir (str): The directory checkpoints are stored in.
+            site_name (Optional[str]): The name of the site being crawled.
+
+        Returns:
+            CrawlCheckpoint: The new checkpoint, already saved.
+        """
+        checkpoint = cls(uuid.uuid4().hex, checkpoint_dir, page_limit, site_name)
+        checkpoint.save()
+        return checkpoint
+
+    @classmethod
+    def load(cls, token: str, checkpoint_dir: str = CHECKPOINT_DIR) -> "CrawlCheckpoint":
+        """
+        Load the checkpoint of an earlier crawl.
+
+        Args:
+            token (str): The resume token returned by the earlier crawl.
+            checkpoint_dir (str): The directory checkpoints are stored in.
+
+        Returns:
+            CrawlCheckpoint: The saved checkpoint.
+
+        Raises:
+            CheckpointException: If no readable checkpoint exists for the token.
+        """
+        if not token.isalnum():
+            raise CheckpointException(f"Invalid resume token: {token}")
+        checkpoint = cls(token, checkpoint_dir)
+        try:
+            with open(checkpoint.state_path, "r") as f:
+                state: Dict[str, Any] = json.load(f)
+        except FileNotFoundError as e:
+            raise CheckpointException(f"Unknown resume token: {token}") from e
+        except (OSError, ValueError) as e:
+            raise CheckpointException(f"Unreadable checkpoint for resume token {token}: {str(e)}") from e
+
+        checkpoint.page_limit = state.get("page_limit")
+        checkpoint.site_name = state.get("site_name")
+        checkpoint.pages_done = state.get("pages_done", 0)
+        checkpoint.next_url = state.get("next_url")
+        checkpoint.page_url_template = state.get("page_url_template")
+        checkpoint.last_page_number = state.get("last_page_number")
+        checkpoint.completed = state.get("completed", False)
+        checkpoint.products_persisted = state.get("products_persisted", 0)
+        checkpoint.products_updated = state.get("products_updated", 0)
+        checkpoint._discard_unrecorded_products()
+        logger.info(f"Loaded checkpoint {token} with {checkpoint.pages_done} pages done")
+        return checkpoint
+
+    def save(self) -> None:
+        """
+        Persist the crawl state, replacing the previous state file atomically.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        state = {
+            "page_limit": self.page_limit,
+            "site_name": self.site_name,
+            "pages_done": self.pages_done,
+            "next_url": self.next_url,
+            "page_url_template": self.page_url_template,
+            "last_page_number": self.last_page_number,
+            "completed": self.completed,
+            "products_recorded": self.products_recorded,
+            "products_persisted": self.products_persisted,
+            "products_updated": self.products_updated,
+        }
+        temp_path = f"{self.state_path}.tmp"
+        with open(temp_path, "w") as f:
+            json.dump(state, f)
+        os.replace(temp_path, self.state_path)
+
+    def set_pagination(self, page_url_template: Optional[str], last_page_number: Optional[int]) -> None:
+        """
+        Record the pagination pattern discovered on the first page.
+
+        Args:
+            page_url_template (Optional[str]): The numbered page URL template, if any.
+            last_page_number (Optional[int]): The last page number shown in the pagination block, if any.
+        """
+        self.page_url_template = page_url_template
+        self.last_page_number = last_page_number
+        self.save()
+
+    def record_page(self, page_number: int, next_url: Optional[str], products: List[Product]) -> None:
+        """
+        Record a completed page: append its products, then advance the frontier.
+
+        Products are written before the state, so a crash in between only leaves lines
+        for a page that isn't counted as done; those lines are discarded on resume.
+
+        Args:
+            page_number (int): The catalog page number, which must follow the last completed page.
+            next_url (Optional[str]): The next page link of the page.
+            products (List[Product]): The products extracted from the page.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        with open(self.products_path, "a") as f:
+            for product in products:
+                f.write(json.dumps({"page": page_number, "product": product.dict()}, default=str) + "\n")
+        self.pages_done = page_number
+        self.next_url = next_url
+        self.products_recorded += len(products)
+        self.save()
+
+    def record_persisted(self, products_persisted: int, products_updated: int) -> None:
+        """
+        Record that the crawl has saved its recorded products up to a position.
+
+        Args:
+            products_persisted (int): The number of recorded products, in catalog order, now saved.
+            products_updated (int): The number of products updated in the database by the crawl so far.
+        """
+        self.products_persisted = products_persisted
+        self.products_updated = products_updated
+        self.save()
+
+    def mark_completed(self) -> None:
+        """
+        Mark the crawl as finished.
+        """
+        self.completed = True
+        self.save()
+
+    def iter_unpersisted_products(self) -> Iterator[Tuple[int, Product]]:
+        """
+        Read back the recorded products the crawl hasn't saved yet.
+
+        Products whose image file no longer exists are skipped.
+
+        Yields:
+            Tuple[int, Product]: The position of each product among the recorded products, and
+                the product, in catalog order.
+        """
+        if not os.path.exists(self.products_path):
+            return
+        with open(self.products_path, "r") as f:
+            for position, line in enumerate(f):
+                if position < self.products_persisted:
+                    continue
+                entry = json.loads(line)
+                try:
+                    yield position, Product(**entry["product"])
+                except ValidationError as e:
+                    logger.warning(f"Skipping checkpointed product {entry['product'].get('id')}: {str(e)}")
+
+    def _discard_unrecorded_products(self) -> None:
+        """
+        Drop product lines left behind by a page that was never counted as done.
+
+        Later pages are appended after the lines of earlier ones, so positions in the
+        products file only stay meaningful once those stray lines are gone.
+        """
+        if not os.path.exists(self.products_path):
+            return
+        with open(self.products_path, "r") as f:
+            all_lines = [line for line in f if line.strip()]
+        lines = [line for line in all_lines if json.loads(line)["page"] <= self.pages_done]
+        self.products_recorded = len(lines)
+        if len(lines) == len(all_lines):
+            return
+        logger.info(
+            f"Discarding {len(all_lines) - len(lines)} products of unfinished pages from checkpoint {self.token}"
+        )
+        temp_path = f"{self.products_path}.tmp"
+        with open(temp_path, "w") as f:
+            f.writelines(lines)
+        os.replace(temp_path, self.products_path)
+
+    def delete(self) -> None:
+        """
+        Remove the checkpoint files.
+        """
+        for path in (self.state_path, self.products_path):
+            if os.path.exists(path):
+                os.remove(path)
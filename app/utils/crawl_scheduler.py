@@ -0,0 +1,221 @@
+import asyncio
+import logging
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional, TypeVar, Union
+
+from app.constants import SCHEDULER_GLOBAL_CONCURRENCY
+from app.models.site_config import SiteConfig
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class FairShareLimiter:
+    """
+    A global concurrency budget shared between sites by weight.
+
+    When a slot is free and several sites are waiting, it goes to the waiting site
+    using the smallest share of the budget relative to its weight, i.e. the lowest
+    in-flight count divided by weight. Each site therefore gets slots in proportion
+    to its weight while it has work, and a large catalog can't starve small ones by
+    queueing more requests. With equal weights this is round-robin between sites.
+
+    Attributes:
+        limit (int): The total number of slots.
+        in_flight (Dict[str, int]): The slots held by each site.
+        served (Dict[str, int]): The slots granted to each site so far.
+    """
+
+    def __init__(self, limit: int = SCHEDULER_GLOBAL_CONCURRENCY) -> None:
+        """
+        Initialize the FairShareLimiter.
+
+        Args:
+            limit (int): The total number of slots. Defaults to SCHEDULER_GLOBAL_CONCURRENCY.
+        """
+        self.limit = limit
+        self.in_flight: Dict[str, int] = {}
+        self.served: Dict[str, int] = {}
+        self._weights: Dict[str, float] = {}
+        self._waiters: Dict[str, Deque[asyncio.Future]] = {}
+
+    def register(self, site: str, weight: float = 1.0) -> None:
+        """
+        Add a site to the limiter.
+
+        Args:
+            site (str): The site name.
+            weight (float): The site's share relative to other sites.
+        """
+        self._weights[site] = max(weight, 0.01)
+        self.in_flight.setdefault(site, 0)
+        self.served.setdefault(site, 0)
+        self._waiters.setdefault(site, deque())
+
+    def _total_in_flight(self) -> int:
+        """Return the number of slots held by all sites."""
+        return sum(self.in_flight.values())
+
+    def _grant(self, site: str) -> None:
+        """Give a slot to a site."""
+        self.in_flight[site] += 1
+        self.served[site] += 1
+
+    def _next_site(self) -> Optional[str]:
+        """Pick the waiting site with the smallest weighted share, breaking ties by slots served."""
+        waiting = [site for site, waiters in self._waiters.items() if waiters]
+        if not waiting:
+            return None
+        return min(
+            waiting,
+            key=lambda site: (
+                self.in_flight[site] / self._weights[site],
+                self.served[site] / self._weights[site],
+            ),
+        )
+
+    def _dispatch(self) -> None:
+        """Hand free slots to waiting sites."""
+        while self._total_in_flight() < self.limit:
+            site = self._next_site()
+            if site is None:
+                return
+            waiter = self._waiters[site].popleft()
+            if waiter.done():
+                continue
+            self._grant(site)
+            waiter.set_result(None)
+
+    async def acquire(self, site: str) -> None:
+        """
+        Wait for a slot for a site.
+
+        Args:
+            site (str): The registered site name.
+        """
+        if site not in self._weights:
+            self.register(site)
+        if self._total_in_flight() < self.limit and not any(self._waiters.values()):
+            self._grant(site)
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters[site].append(waiter)
+        self._dispatch()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self.release(site)
+            raise
+
+    def release(self, site: str) -> None:
+        """
+        Return a site's slot and hand it to the next waiting site.
+
+        Args:
+            site (str): The site name.
+        """
+        self.in_flight[site] -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, site: str) -> AsyncIterator[None]:
+        """
+        Hold a slot for a site for the duration of the block.
+
+        Args:
+            site (str): The site name.
+        """
+        await self.acquire(site)
+        try:
+            yield
+        finally:
+            self.release(site)
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """
+        Describe how the budget is shared, for logging.
+
+        Returns:
+            Dict[str, Dict[str, float]]: The weight, in-flight and served slots of each site.
+        """
+        return {
+            site: {"weight": weight, "in_flight": self.in_flight[site], "served": self.served[site]}
+            for site, weight in self._weights.items()
+        }
+
+
+class SiteShare:
+    """
+    A site's handle on the shared budget, passed to its scraper.
+
+    Attributes:
+        limiter (FairShareLimiter): The shared budget.
+        site (str): The site name.
+    """
+
+    def __init__(self, limiter: FairShareLimiter, site: str) -> None:
+        """
+        Initialize the SiteShare.
+
+        Args:
+            limiter (FairShareLimiter): The shared budget.
+            site (str): The registered site name.
+        """
+        self.limiter = limiter
+        self.site = site
+
+    def slot(self) -> AsyncContextManager[None]:
+        """Hold one of the site's slots for the duration of an `async with` block."""
+        return self.limiter.slot(self.site)
+
+
+class CrawlScheduler:
+    """
+    Runs the crawls of many sites at once under one global concurrency budget.
+
+    Every site's crawl starts immediately. Each page scrape then holds a slot of
+    the shared FairShareLimiter, so the budget bounds the total work in flight and
+    is split between sites by their weights.
+
+    Attributes:
+        sites (List[SiteConfig]): The sites to crawl.
+        limiter (FairShareLimiter): The budget shared by the sites.
+    """
+
+    def __init__(self, sites: List[SiteConfig], global_concurrency: int = SCHEDULER_GLOBAL_CONCURRENCY) -> None:
+        """
+        Initialize the CrawlScheduler.
+
+        Args:
+            sites (List[SiteConfig]): The sites to crawl.
+            global_concurrency (int): The number of page scrapes in flight across all sites.
+                Defaults to SCHEDULER_GLOBAL_CONCURRENCY.
+        """
+        self.sites = sites
+        self.limiter = FairShareLimiter(global_concurrency)
+        for site in sites:
+            self.limiter.register(site.name, site.weight)
+
+    async def run(
+        self, crawl: Callable[[SiteConfig, SiteShare], Awaitable[T]]
+    ) -> Dict[str, Union[T, BaseException]]:
+        """
+        Crawl every site concurrently.
+
+        Args:
+            crawl (Callable[[SiteConfig, SiteShare], Awaitable[T]]): Crawls one site, holding the
+                site's share around each page scrape.
+
+        Returns:
+            Dict[str, Union[T, BaseException]]: The result of each site's crawl by site name, or the
+                exception it failed with, so one failing site doesn't abort the others.
+        """
+        logger.info(f"Scheduling crawls of {len(self.sites)} sites with global concurrency {self.limiter.limit}")
+        results = await asyncio.gather(
+            *(crawl(site, SiteShare(self.limiter, site.name)) for site in self.sites), return_exceptions=True
+        )
+        logger.info(f"Scheduler state at end of crawls: {self.limiter.snapshot()}")
+        return {site.name: result for site, result in zip(self.sites, results)}
@@ -1,48 +1,151 @@
-import os
-import ssl
+import logging
+import time
 from typing import Optional
-from urllib.parse import urlparse
 
-import aiofiles
-import aiohttp
+from app.constants import IMAGE_DOWNLOAD_CHUNK_SIZE, IMAGE_MAX_SIZE
+from app.exceptions.scraper_exceptions import ImageTooLargeException
+from app.exceptions.transport_exceptions import (
+    TransportException,
+    TransportProxyException,
+    TransportTimeoutException,
+)
+from app.transports.base_transport import BaseTransport
+from app.transports.transport_factory import create_transport
+from app.utils.image_store import ImageStore
+from app.utils.proxy_pool import ProxyPool, ProxyState
+from app.utils.rate_limiter import AdaptiveRateLimiter, HostLimiter
 
+logger = logging.getLogger(__name__)
 
-async def download_image(url: str, save_dir: str) -> Optional[str]:
+
+async def download_image(
+    url: str,
+    save_dir: str,
+    transport: Optional[BaseTransport] = None,
+    image_store: Optional[ImageStore] = None,
+    chunk_size: int = IMAGE_DOWNLOAD_CHUNK_SIZE,
+    max_size: Optional[int] = IMAGE_MAX_SIZE,
+    rate_limiter: Optional[AdaptiveRateLimiter] = None,
+    proxy_pool: Optional[ProxyPool] = None,
+    proxy: Optional[ProxyState] = None,
+) -> Optional[str]:
     """
     Download an image from a URL and save it locally.
 
+    Images are kept in a content-addressed ImageStore. If the URL was downloaded before,
+    the request is sent with its stored validators and a 304 response reuses the local
+    file without reading the body. Otherwise the body is streamed to disk in chunks as the
+    transport decompresses it, so whole images are never held in memory.
+
     Args:
         url (str): The URL of the image to download.
         save_dir (str): The directory where the image should be saved.
+        transport (Optional[BaseTransport]): A pooled transport to reuse, which also decides the proxy.
+            If omitted, a short-lived transport is opened for this download only.
+        image_store (Optional[ImageStore]): The store to save into. If omitted, a store for
+            `save_dir` is opened and its index saved after this download.
+        chunk_size (int): The number of bytes read and written per chunk. Defaults to IMAGE_DOWNLOAD_CHUNK_SIZE.
+        max_size (Optional[int]): The maximum image size in bytes; larger downloads are aborted.
+            Defaults to IMAGE_MAX_SIZE.
+        rate_limiter (Optional[AdaptiveRateLimiter]): The per-host limiter shared with page fetches.
+            If omitted, the download isn't rate limited.
+        proxy_pool (Optional[ProxyPool]): The pool `proxy` was chosen from, told how the download went.
+        proxy (Optional[ProxyState]): The proxy `transport` is pinned to, if it came from `proxy_pool`.
 
     Returns:
         Optional[str]: The local path of the saved image if successful, None otherwise.
 
     Raises:
-        aiohttp.ClientError: If there's an error during the HTTP request.
         IOError: If there's an error writing the file.
     """
-    os.makedirs(save_dir, exist_ok=True)
-    filename = os.path.basename(urlparse(url).path)
-    local_path = os.path.join(save_dir, filename)
+    if transport is None:
+        async with create_transport() as transport:
+            return await download_image(
+                url, save_dir, transport, image_store, chunk_size, max_size, rate_limiter, proxy_pool, proxy
+            )
+    if image_store is None:
+        image_store = ImageStore(save_dir)
+        try:
+            return await download_image(
+                url, save_dir, transport, image_store, chunk_size, max_size, rate_limiter, proxy_pool, proxy
+            )
+        finally:
+            image_store.save()
+    if proxy_pool is None:
+        proxy = None
+    if rate_limiter is None:
+        return await _download_to_store(url, transport, image_store, chunk_size, max_size, None, proxy_pool, proxy)
+
+    host_limiter = rate_limiter.for_url(url)
+    async with host_limiter.slot():
+        return await _download_to_store(
+            url, transport, image_store, chunk_size, max_size, host_limiter, proxy_pool, proxy
+        )
 
-    # Create a custom SSL context that doesn't verify certificates
-    ssl_context = ssl.create_default_context()
-    ssl_context.check_hostname = False
-    ssl_context.verify_mode = ssl.CERT_NONE
 
+async def _download_to_store(
+    url: str,
+    transport: BaseTransport,
+    image_store: ImageStore,
+    chunk_size: int,
+    max_size: Optional[int],
+    host_limiter: Optional[HostLimiter],
+    proxy_pool: Optional[ProxyPool] = None,
+    proxy: Optional[ProxyState] = None,
+) -> Optional[str]:
+    """
+    Request an image and stream it into the store, reporting the outcome to the host limiter and proxy pool.
+
+    Args:
+        url (str): The URL of the image to download.
+        transport (BaseTransport): The transport to request the image with.
+        image_store (ImageStore): The store to save into.
+        chunk_size (int): The number of bytes read and written per chunk.
+        max_size (Optional[int]): The maximum image size in bytes, if any.
+        host_limiter (Optional[HostLimiter]): The limiter of the image's host, if any.
+        proxy_pool (Optional[ProxyPool]): The pool `proxy` was chosen from, if any.
+        proxy (Optional[ProxyState]): The proxy the request goes through, if chosen from `proxy_pool`.
+
+    Returns:
+        Optional[str]: The local path of the saved image if successful, None otherwise.
+    """
+    started = time.monotonic()
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url, ssl=ssl_context) as response:
-                if response.status == 200:
-                    async with aiofiles.open(local_path, mode='wb') as f:
-                        await f.write(await response.read())
-                    return local_path
-                else:
-                    print(f"Failed to download image. Status code: {response.status}")
-    except aiohttp.ClientError as e:
-        print(f"Error during HTTP request: {str(e)}")
+        async with transport.get(url, headers=image_store.conditional_headers(url)) as response:
+            latency = time.monotonic() - started
+            if host_limiter is not None:
+                host_limiter.record_response(response.status, latency, response.headers.get("Retry-After"))
+            if proxy is not None:
+                proxy_pool.record_response(proxy, response.status, latency)
+            if response.status == 304:
+                return image_store.get_cached_path(url)
+            if response.status == 200:
+                if max_size is not None and (response.content_length or 0) > max_size:
+                    logger.warning(f"Skipping image larger than {max_size} bytes: {url}")
+                    return None
+                return await image_store.write_stream(
+                    url,
+                    response.iter_chunks(chunk_size),
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    max_size,
+                )
+            logger.error(f"Failed to download image {url}. Status code: {response.status}")
+    except ImageTooLargeException as e:
+        logger.warning(f"Aborted image download: {str(e)}")
+    except TransportTimeoutException:
+        if host_limiter is not None:
+            host_limiter.record_throttle("timeout")
+        if proxy is not None:
+            proxy_pool.record_failure(proxy, "timeout")
+        logger.error(f"Timed out downloading image: {url}")
+    except TransportProxyException as e:
+        if proxy is not None:
+            proxy_pool.record_failure(proxy, str(e))
+        logger.error(f"Proxy failed downloading image {url}: {str(e)}")
+    except TransportException as e:
+        logger.error(f"Error during HTTP request: {str(e)}")
     except IOError as e:
-        print(f"Error writing file: {str(e)}")
+        logger.error(f"Error writing file: {str(e)}")
 
     return None
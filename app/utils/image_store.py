@@ -0,0 +1,227 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import uuid
+from typing import AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import aiofiles
+
+from app.exceptions.scraper_exceptions import ImageTooLargeException
+
+logger = logging.getLogger(__name__)
+
+
+class ImageStore:
+    """
+    A content-addressed store for downloaded images.
+
+    Images are saved under the SHA-256 of their bytes, so identical images are stored
+    once and different images sharing a basename never overwrite each other. A sidecar
+    index maps each source URL to its content hash and HTTP validators, which lets
+    downloads revalidate with If-None-Match / If-Modified-Since instead of re-fetching.
+
+    Several stores may share a directory, e.g. one per concurrent scraper. Each keeps
+    track of the entries it recorded and merges them into the index on disk when saving,
+    so one store's save doesn't drop the entries another saved before it.
+
+    Attributes:
+        save_dir (str): The directory images and the index are stored in.
+        index_path (str): The path of the sidecar index file.
+    """
+
+    INDEX_FILENAME = "index.json"
+
+    def __init__(self, save_dir: str) -> None:
+        """
+        Initialize the ImageStore.
+
+        Args:
+            save_dir (str): The directory images and the index are stored in.
+        """
+        self.save_dir = save_dir
+        self.index_path = os.path.join(save_dir, self.INDEX_FILENAME)
+        self._index: Optional[Dict[str, Dict[str, str]]] = None
+        self._changes: Dict[str, Dict[str, str]] = {}
+
+    @property
+    def index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Return the URL index, loading it from disk on first use.
+        """
+        if self._index is None:
+            self._index = self._read_index()
+        return self._index
+
+    def _read_index(self) -> Dict[str, Dict[str, str]]:
+        """
+        Read the index file as currently on disk.
+
+        Returns:
+            Dict[str, Dict[str, str]]: The index, empty if the file is missing or unreadable.
+        """
+        if not os.path.exists(self.index_path):
+            return {}
+        try:
+            with open(self.index_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable image index {self.index_path}: {str(e)}")
+            return {}
+
+    def path_for(self, content_hash: str, url: str) -> str:
+        """
+        Build the local path of an image from its content hash and source URL extension.
+
+        Args:
+            content_hash (str): The SHA-256 hex digest of the image bytes.
+            url (str): The source URL of the image.
+
+        Returns:
+            str: The local path of the image.
+        """
+        extension = os.path.splitext(urlparse(url).path)[1]
+        return os.path.join(self.save_dir, f"{content_hash}{extension}")
+
+    def get_cached_path(self, url: str) -> Optional[str]:
+        """
+        Return the local path stored for a URL, if the file is still present.
+
+        Args:
+            url (str): The source URL of the image.
+
+        Returns:
+            Optional[str]: The local path, or None if the URL is unknown or its file is gone.
+        """
+        entry = self.index.get(url)
+        if not entry:
+            return None
+        local_path = self.path_for(entry["hash"], url)
+        return local_path if os.path.isfile(local_path) else None
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """
+        Build revalidation headers for a URL that is already stored.
+
+        Args:
+            url (str): The source URL of the image.
+
+        Returns:
+            Dict[str, str]: If-None-Match / If-Modified-Since headers, empty if nothing is cached.
+        """
+        if self.get_cached_path(url) is None:
+            return {}
+        entry = self.index[url]
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def record(self, url: str, content_hash: str, etag: Optional[str], last_modified: Optional[str]) -> str:
+        """
+        Record the content hash and validators of a URL in the index.
+
+        Args:
+            url (str): The source URL of the image.
+            content_hash (str): The SHA-256 hex digest of the image bytes.
+            etag (Optional[str]): The ETag response header, if any.
+            last_modified (Optional[str]): The Last-Modified response header, if any.
+
+        Returns:
+            str: The local path of the image.
+        """
+        entry = {"hash": content_hash}
+        if etag:
+            entry["etag"] = etag
+        if last_modified:
+            entry["last_modified"] = last_modified
+        if self.index.get(url) != entry:
+            self.index[url] = entry
+            self._changes[url] = entry
+        return self.path_for(content_hash, url)
+
+    async def write_stream(
+        self,
+        url: str,
+        chunks: AsyncIterator[bytes],
+        etag: Optional[str],
+        last_modified: Optional[str],
+        max_size: Optional[int] = None,
+    ) -> str:
+        """
+        Stream image bytes to disk and store them under their content hash.
+
+        Chunks are hashed as they are written to a temporary file in the store directory,
+        which is then atomically renamed into place, so a partial download never appears
+        at a final path. If the content is already stored the temporary file is discarded.
+
+        Args:
+            url (str): The source URL of the image.
+            chunks (AsyncIterator[bytes]): The response body chunks.
+            etag (Optional[str]): The ETag response header, if any.
+            last_modified (Optional[str]): The Last-Modified response header, if any.
+            max_size (Optional[int]): The maximum number of bytes to accept, if any.
+
+        Returns:
+            str: The local path of the image.
+
+        Raises:
+            ImageTooLargeException: If the body exceeds `max_size`.
+            IOError: If there's an error writing the file.
+        """
+        os.makedirs(self.save_dir, exist_ok=True)
+        temp_path = os.path.join(self.save_dir, f"{uuid.uuid4().hex}.part")
+        digest = hashlib.sha256()
+        size = 0
+        try:
+            async with aiofiles.open(temp_path, mode='wb') as f:
+                async for chunk in chunks:
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise ImageTooLargeException(f"Image exceeds {max_size} bytes: {url}")
+                    digest.update(chunk)
+                    await f.write(chunk)
+
+            local_path = self.record(url, digest.hexdigest(), etag, last_modified)
+            if os.path.isfile(local_path):
+                os.remove(temp_path)
+            else:
+                os.replace(temp_path, local_path)
+            return local_path
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def save(self) -> None:
+        """
+        Merge the entries recorded since the last save into the index on disk.
+
+        The file is re-read first, so entries saved meanwhile by other stores sharing the
+        directory are kept, and written to a uniquely named temporary file that atomically
+        replaces the previous index.
+        """
+        if not self._changes:
+            return
+        os.makedirs(self.save_dir, exist_ok=True)
+        merged = self._read_index()
+        merged.update(self._changes)
+        temp_path: Optional[str] = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                mode="w", dir=self.save_dir, prefix=f"{self.INDEX_FILENAME}.", suffix=".tmp", delete=False
+            ) as f:
+                temp_path = f.name
+                json.dump(merged, f)
+            os.replace(temp_path, self.index_path)
+        except BaseException:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._index = merged
+        self._changes = {}
+        logger.info(f"Saved image index with {len(merged)} entries to {self.index_path}")
@@ -0,0 +1,260 @@
+import asyncio
+import logging
+import time
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from app.constants import (
+    SCRAPE_JOB_HISTORY,
+    SCRAPE_JOB_MAX_PENDING,
+    SCRAPE_JOB_WORKERS,
+    SCRAPE_RESULT_REUSE_SECONDS,
+)
+from app.exceptions.job_exceptions import JobNotFoundException, JobQueueFullException
+from app.utils.crawl_checkpoint import CrawlCheckpoint
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_COMPLETED = "completed"
+JOB_FAILED = "failed"
+JOB_CANCELLED = "cancelled"
+
+
+@dataclass
+class ScrapeJob:
+    """
+    A scrape submitted to the job queue, with its progress and outcome.
+
+    Attributes:
+        id (str): The job ID.
+        params (Dict[str, Any]): The parameters the job was submitted with.
+        key (Optional[str]): The normalized request the job runs, which identical submissions coalesce on.
+        submissions (int): The number of submissions served by this job, including the first.
+        status (str): "queued", "running", "completed", "failed" or "cancelled".
+        created_at (float): When the job was submitted, as a Unix timestamp.
+        started_at (Optional[float]): When a worker picked the job up.
+        finished_at (Optional[float]): When the job finished.
+        pages_done (int): The number of catalog pages finished so far.
+        products_scraped (int): The number of products scraped so far.
+        products_updated (int): The number of products updated in the database so far.
+        resume_token (Optional[str]): The token of the job's crawl checkpoint, while one exists.
+        result (Any): The job's result summary once it has completed.
+        error (Optional[str]): The error the job failed with, if any.
+    """
+    id: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    key: Optional[str] = None
+    submissions: int = 1
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    pages_done: int = 0
+    products_scraped: int = 0
+    products_updated: int = 0
+    resume_token: Optional[str] = None
+    result: Any = None
+    error: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        """Whether the job has stopped, successfully or not."""
+        return self.status in (JOB_COMPLETED, JOB_FAILED, JOB_CANCELLED)
+
+    def record_progress(self, checkpoint: CrawlCheckpoint, products_scraped: int, products_updated: int) -> None:
+        """
+        Update the job's progress from its crawl.
+
+        Args:
+            checkpoint (CrawlCheckpoint): The checkpoint of the crawl.
+            products_scraped (int): The number of products scraped so far.
+            products_updated (int): The number of products updated so far.
+        """
+        self.pages_done = checkpoint.pages_done
+        self.products_scraped = products_scraped
+        self.products_updated = products_updated
+        self.resume_token = None if checkpoint.completed else checkpoint.token
+
+
+JobRunner = Callable[[ScrapeJob], Awaitable[Any]]
+
+
+class ScrapeJobQueue:
+    """
+    A bounded queue of scrape jobs run by a fixed pool of worker tasks.
+
+    At most `workers` jobs run at once; up to `max_pending` more wait in the queue and
+    further submissions are rejected. Finished jobs are kept for status queries until
+    `history` jobs are known, after which the oldest finished ones are forgotten.
+
+    Submissions with the same key are coalesced: while a job for the key is queued or
+    running, later submissions attach to it instead of starting another, and a job that
+    completed less than `reuse_seconds` ago is served as is. Failed and cancelled jobs
+    are never reused.
+
+    Attributes:
+        workers (int): The number of jobs run in parallel.
+        max_pending (int): The number of jobs that may wait for a worker.
+        history (int): The number of jobs kept for status queries.
+        reuse_seconds (float): How long a completed job's result is served to identical submissions.
+    """
+
+    def __init__(
+        self,
+        workers: int = SCRAPE_JOB_WORKERS,
+        max_pending: int = SCRAPE_JOB_MAX_PENDING,
+        history: int = SCRAPE_JOB_HISTORY,
+        reuse_seconds: float = SCRAPE_RESULT_REUSE_SECONDS,
+    ) -> None:
+        """
+        Initialize the ScrapeJobQueue.
+
+        Args:
+            workers (int): The number of jobs run in parallel. Defaults to SCRAPE_JOB_WORKERS.
+            max_pending (int): The number of jobs that may wait for a worker. Defaults to SCRAPE_JOB_MAX_PENDING.
+            history (int): The number of jobs kept for status queries. Defaults to SCRAPE_JOB_HISTORY.
+            reuse_seconds (float): How long a completed job's result is served to identical submissions.
+                Defaults to SCRAPE_RESULT_REUSE_SECONDS.
+        """
+        self.workers = workers
+        self.max_pending = max_pending
+        self.history = history
+        self.reuse_seconds = reuse_seconds
+        self._jobs: "OrderedDict[str, ScrapeJob]" = OrderedDict()
+        self._jobs_by_key: Dict[str, ScrapeJob] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._tasks: List[asyncio.Task] = []
+
+    def start(self) -> None:
+        """
+        Start the worker tasks.
+        """
+        if self._tasks:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._tasks = [asyncio.create_task(self._work(number)) for number in range(self.workers)]
+        logger.info(f"Scrape job queue started with {self.workers} workers")
+
+    async def stop(self) -> None:
+        """
+        Stop the worker tasks, cancelling running jobs and dropping queued ones.
+
+        Cancelled crawls keep their checkpoints, so they can be resumed with the job's resume token.
+        """
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+        for job in self._jobs.values():
+            if not job.finished:
+                job.status = JOB_CANCELLED
+                job.finished_at = time.time()
+        logger.info("Scrape job queue stopped")
+
+    def submit(self, run: JobRunner, params: Optional[Dict[str, Any]] = None, key: Optional[str] = None) -> ScrapeJob:
+        """
+        Queue a job, or attach to the job already serving the same key.
+
+        Args:
+            run (JobRunner): The coroutine function that performs the job and returns its result summary.
+                It is given the job, to report progress on.
+            params (Optional[Dict[str, Any]]): The parameters the job was submitted with, kept for reporting.
+            key (Optional[str]): The normalized request, to coalesce identical submissions on.
+                If omitted, the job is never coalesced.
+
+        Returns:
+            ScrapeJob: The queued job, or the in-flight or recently completed job with the same key.
+
+        Raises:
+            JobQueueFullException: If `max_pending` jobs are already waiting.
+            RuntimeError: If the queue hasn't been started.
+        """
+        if self._queue is None:
+            raise RuntimeError("Scrape job queue is not started")
+        existing = self._jobs_by_key.get(key) if key is not None else None
+        if existing is not None and self._can_serve(existing):
+            existing.submissions += 1
+            logger.info(f"Coalesced scrape submission into job {existing.id} ({existing.status})")
+            return existing
+        job = ScrapeJob(id=uuid.uuid4().hex, params=params or {}, key=key)
+        try:
+            self._queue.put_nowait((job, run))
+        except asyncio.QueueFull:
+            raise JobQueueFullException(f"{self.max_pending} scrape jobs are already pending")
+        self._jobs[job.id] = job
+        if key is not None:
+            self._jobs_by_key[key] = job
+        self._forget_old_jobs()
+        logger.info(f"Queued scrape job {job.id}")
+        return job
+
+    def get(self, job_id: str) -> ScrapeJob:
+        """
+        Look up a job by ID.
+
+        Args:
+            job_id (str): The job ID.
+
+        Returns:
+            ScrapeJob: The job.
+
+        Raises:
+            JobNotFoundException: If no job has the ID, or it has been forgotten.
+        """
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise JobNotFoundException(f"No scrape job with ID {job_id}")
+        return job
+
+    def _can_serve(self, job: ScrapeJob) -> bool:
+        """
+        Whether a new submission with the same key can be given this job.
+
+        Args:
+            job (ScrapeJob): The latest job for the key.
+
+        Returns:
+            bool: True if the job is still queued or running, or completed within `reuse_seconds`.
+        """
+        if not job.finished:
+            return True
+        return job.status == JOB_COMPLETED and time.time() - job.finished_at <= self.reuse_seconds
+
+    async def _work(self, number: int) -> None:
+        """
+        Run queued jobs one at a time until cancelled.
+
+        Args:
+            number (int): The worker number, for logging.
+        """
+        while True:
+            job, run = await self._queue.get()
+            job.status = JOB_RUNNING
+            job.started_at = time.time()
+            logger.info(f"Worker {number} started scrape job {job.id}")
+            try:
+                job.result = await run(job)
+                job.status = JOB_COMPLETED
+                logger.info(f"Scrape job {job.id} completed")
+            except asyncio.CancelledError:
+                job.status = JOB_CANCELLED
+                raise
+            except Exception as e:
+                job.status = JOB_FAILED
+                job.error = str(e)
+                logger.error(f"Scrape job {job.id} failed: {str(e)}")
+            finally:
+                job.finished_at = time.time()
+                self._queue.task_done()
+
+    def _forget_old_jobs(self) -> None:
+        """Drop the oldest finished jobs while more than `history` jobs are kept."""
+        excess = len(self._jobs) - self.history
+        for job_id in [job.id for job in self._jobs.values() if job.finished][:max(excess, 0)]:
+            job = self._jobs.pop(job_id)
+            if job.key is not None and self._jobs_by_key.get(job.key) is job:
+                del self._jobs_by_key[job.key]
@@ -0,0 +1,201 @@
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from urllib.parse import urlparse
+
+from app.constants import (
+    ADAPTIVE_TIMEOUT_MIN,
+    ADAPTIVE_TIMEOUT_MULTIPLIER,
+    ADAPTIVE_TIMEOUT_PERCENTILE,
+    HEDGE_MAX_RATE,
+    HEDGE_PERCENTILE,
+    HTTP_REQUEST_TIMEOUT,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_WINDOW,
+)
+
+
+class HostLatency:
+    """
+    Rolling latency percentiles for a single host, used to size timeouts and hedges.
+
+    Until `min_samples` requests have completed, requests get the fixed maximum timeout
+    and are never hedged. After that the timeout is the timeout percentile times a
+    safety multiplier, kept between `min_timeout` and `max_timeout`, and a hedge is
+    sent once a request is slower than the hedge percentile. Hedges are capped at
+    `hedge_max_rate` of completed requests, so a host that slows down as a whole
+    doesn't receive a burst of duplicates.
+
+    Attributes:
+        host (str): The host being tracked.
+        samples (Deque[float]): The most recent request latencies in seconds.
+        requests (int): The number of requests recorded.
+        hedges (int): The number of hedged requests sent.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        window: int = LATENCY_WINDOW,
+        min_samples: int = LATENCY_MIN_SAMPLES,
+        timeout_percentile: float = ADAPTIVE_TIMEOUT_PERCENTILE,
+        timeout_multiplier: float = ADAPTIVE_TIMEOUT_MULTIPLIER,
+        min_timeout: float = ADAPTIVE_TIMEOUT_MIN,
+        max_timeout: float = HTTP_REQUEST_TIMEOUT,
+        hedge_percentile: float = HEDGE_PERCENTILE,
+        hedge_max_rate: float = HEDGE_MAX_RATE,
+    ) -> None:
+        """
+        Initialize the HostLatency.
+
+        Args:
+            host (str): The host being tracked.
+            window (int): The number of recent latencies the percentiles are computed over.
+            min_samples (int): The number of latencies needed before the percentiles are trusted.
+            timeout_percentile (float): The percentile the timeout is derived from, between 0 and 1.
+            timeout_multiplier (float): The factor applied to the timeout percentile.
+            min_timeout (float): The shortest timeout in seconds.
+            max_timeout (float): The longest timeout in seconds, also used until enough samples exist.
+            hedge_percentile (float): The percentile after which a hedge is sent, between 0 and 1.
+            hedge_max_rate (float): The largest fraction of requests that may be hedged.
+        """
+        self.host = host
+        self.samples: Deque[float] = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.timeout_percentile = timeout_percentile
+        self.timeout_multiplier = timeout_multiplier
+        self.min_timeout = min_timeout
+        self.max_timeout = max_timeout
+        self.hedge_percentile = hedge_percentile
+        self.hedge_max_rate = hedge_max_rate
+        self.requests = 0
+        self.hedges = 0
+
+    def percentile(self, quantile: float) -> Optional[float]:
+        """
+        Compute a latency percentile over the window by the nearest-rank method.
+
+        Args:
+            quantile (float): The percentile as a fraction, e.g. 0.95.
+
+        Returns:
+            Optional[float]: The latency in seconds, or None if there are too few samples.
+        """
+        if len(self.samples) < self.min_samples:
+            return None
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(quantile * len(ordered)))
+        return ordered[rank - 1]
+
+    def timeout(self) -> float:
+        """
+        The timeout for the next request to the host.
+
+        Returns:
+            float: The timeout in seconds.
+        """
+        latency = self.percentile(self.timeout_percentile)
+        if latency is None:
+            return self.max_timeout
+        return min(self.max_timeout, max(self.min_timeout, latency * self.timeout_multiplier))
+
+    def hedge_delay(self) -> Optional[float]:
+        """
+        How long to wait for a request before sending a hedge.
+
+        Returns:
+            Optional[float]: The delay in seconds, or None if requests to the host shouldn't be hedged yet.
+        """
+        return self.percentile(self.hedge_percentile)
+
+    def try_hedge(self) -> bool:
+        """
+        Reserve a hedge if the host is under its hedge rate.
+
+        Returns:
+            bool: Whether a hedge may be sent.
+        """
+        if self.hedges + 1 > self.hedge_max_rate * self.requests:
+            return False
+        self.hedges += 1
+        return True
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        Args:
+            latency (float): The seconds until the response was read.
+        """
+        self.samples.append(latency)
+        self.requests += 1
+
+    def record_timeout(self, timeout: float) -> None:
+        """
+        Record a request that timed out.
+
+        The timeout is recorded as its latency, a lower bound of the real one, so a host
+        that slows down pushes its own timeout up instead of timing out forever.
+
+        Args:
+            timeout (float): The timeout the request was given.
+        """
+        self.record(timeout)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current latency state of the host.
+
+        Returns:
+            Dict[str, Any]: The p50/p95/p99 latencies, the current timeout and the request and hedge counts.
+        """
+        p50, p95, p99 = (self.percentile(quantile) for quantile in (0.5, 0.95, 0.99))
+        return {
+            "p50": round(p50, 3) if p50 is not None else None,
+            "p95": round(p95, 3) if p95 is not None else None,
+            "p99": round(p99, 3) if p99 is not None else None,
+            "timeout": round(self.timeout(), 3),
+            "requests": self.requests,
+            "hedges": self.hedges,
+        }
+
+
+class LatencyTracker:
+    """
+    Per-host latency percentiles shared by all page fetches of a crawl.
+    """
+
+    def __init__(self, **host_options: Any) -> None:
+        """
+        Initialize the LatencyTracker.
+
+        Args:
+            **host_options: Options passed to every HostLatency, such as `window` or `hedge_max_rate`.
+        """
+        self._host_options = host_options
+        self._hosts: Dict[str, HostLatency] = {}
+
+    def for_url(self, url: str) -> HostLatency:
+        """
+        Return the latency state for the host of a URL, creating it on first use.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Returns:
+            HostLatency: The latency state of the URL's host.
+        """
+        host = urlparse(url).netloc
+        latency = self._hosts.get(host)
+        if latency is None:
+            latency = self._hosts[host] = HostLatency(host, **self._host_options)
+        return latency
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the latency state of every host.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The state of each host, keyed by host.
+        """
+        return {host: latency.snapshot() for host, latency in self._hosts.items()}
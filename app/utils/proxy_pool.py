@@ -0,0 +1,215 @@
+import logging
+import random
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from app.constants import (
+    PROXY_FAILURE_STATUSES,
+    PROXY_FAILURE_THRESHOLD,
+    PROXY_HEALTH_WINDOW,
+    PROXY_LATENCY_FLOOR,
+    PROXY_QUARANTINE_SECONDS,
+)
+from app.exceptions.scraper_exceptions import ProxyException
+from app.transports.base_transport import BaseTransport
+from app.transports.transport_factory import create_transport
+
+logger = logging.getLogger(__name__)
+
+
+class ProxyState:
+    """
+    The rolling health of a single proxy.
+
+    Attributes:
+        url (str): The proxy URL.
+        outcomes (Deque[Tuple[bool, float]]): The most recent (success, latency) samples.
+        consecutive_failures (int): Failures since the last success.
+        quarantined_until (float): When the quarantine ends, on the monotonic clock.
+        transport (BaseTransport): The connection pool pinned to this proxy.
+    """
+
+    def __init__(self, url: str, window: int = PROXY_HEALTH_WINDOW) -> None:
+        """
+        Initialize the ProxyState.
+
+        Args:
+            url (str): The proxy URL.
+            window (int): The number of recent requests the health score is computed over.
+        """
+        self.url = url
+        self.outcomes: Deque[Tuple[bool, float]] = deque(maxlen=window)
+        self.consecutive_failures = 0
+        self.quarantined_until = 0.0
+        self.transport = create_transport(proxy=url)
+
+    @property
+    def success_rate(self) -> float:
+        """The rolling success rate, smoothed so new proxies start at 0.5 rather than 0 or 1."""
+        successes = sum(1 for success, _ in self.outcomes if success)
+        return (successes + 1) / (len(self.outcomes) + 2)
+
+    @property
+    def average_latency(self) -> Optional[float]:
+        """The mean latency of recent successful requests in seconds, if there are any."""
+        latencies = [latency for success, latency in self.outcomes if success]
+        if not latencies:
+            return None
+        return sum(latencies) / len(latencies)
+
+    def weight(self, latency_floor: float = PROXY_LATENCY_FLOOR) -> float:
+        """
+        Compute the selection weight: the success rate divided by the average latency.
+
+        Args:
+            latency_floor (float): The smallest latency used, so one very fast sample can't dominate.
+
+        Returns:
+            float: The relative weight of the proxy.
+        """
+        latency = self.average_latency
+        if latency is None:
+            latency = 1.0
+        return self.success_rate / max(latency, latency_floor)
+
+    def is_quarantined(self, now: float) -> bool:
+        """Whether the proxy is still cooling down at `now`."""
+        return now < self.quarantined_until
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Describe the proxy's health for logging.
+
+        Returns:
+            Dict[str, Any]: The success rate, average latency, sample count and quarantine state.
+        """
+        return {
+            "success_rate": round(self.success_rate, 3),
+            "average_latency": round(self.average_latency, 3) if self.average_latency is not None else None,
+            "samples": len(self.outcomes),
+            "quarantined": self.is_quarantined(time.monotonic()),
+        }
+
+
+class ProxyPool:
+    """
+    A pool of proxies rotated by weighted selection on their rolling health.
+
+    Each request picks a proxy at random with probability proportional to its success
+    rate over latency. A proxy that fails `failure_threshold` times in a row is
+    quarantined for `quarantine_seconds`; when it comes back a single further failure
+    sends it straight back. Every proxy has its own pooled transport, so
+    keep-alive connections to a proxy are only ever reused through that proxy.
+
+    Attributes:
+        proxies (Dict[str, ProxyState]): The proxies in the pool, by URL.
+        failure_threshold (int): Consecutive failures that quarantine a proxy.
+        quarantine_seconds (float): How long a quarantined proxy is left out of rotation.
+    """
+
+    def __init__(
+        self,
+        proxy_urls: List[str],
+        window: int = PROXY_HEALTH_WINDOW,
+        failure_threshold: int = PROXY_FAILURE_THRESHOLD,
+        quarantine_seconds: float = PROXY_QUARANTINE_SECONDS,
+    ) -> None:
+        """
+        Initialize the ProxyPool.
+
+        Args:
+            proxy_urls (List[str]): The proxy URLs to rotate through. Duplicates are ignored.
+            window (int): The number of recent requests each proxy's health is computed over.
+            failure_threshold (int): Consecutive failures that quarantine a proxy.
+            quarantine_seconds (float): How long a quarantined proxy is left out of rotation.
+
+        Raises:
+            ProxyException: If no proxy URLs are given.
+        """
+        if not proxy_urls:
+            raise ProxyException("A proxy pool needs at least one proxy")
+        self.proxies: Dict[str, ProxyState] = {url: ProxyState(url, window) for url in proxy_urls}
+        self.failure_threshold = failure_threshold
+        self.quarantine_seconds = quarantine_seconds
+        logger.info(f"Proxy pool initialized with {len(self.proxies)} proxies")
+
+    def choose(self) -> ProxyState:
+        """
+        Pick a proxy for the next request.
+
+        Returns:
+            ProxyState: A proxy outside quarantine, chosen by weight.
+
+        Raises:
+            ProxyException: If every proxy is quarantined.
+        """
+        now = time.monotonic()
+        available = [proxy for proxy in self.proxies.values() if not proxy.is_quarantined(now)]
+        if not available:
+            raise ProxyException(f"All {len(self.proxies)} proxies are quarantined")
+        return random.choices(available, weights=[proxy.weight() for proxy in available])[0]
+
+    async def transport_for(self, proxy: ProxyState) -> BaseTransport:
+        """
+        Get the connection pool pinned to a proxy, opening it on first use.
+
+        Args:
+            proxy (ProxyState): The proxy chosen for the request.
+
+        Returns:
+            BaseTransport: The proxy's pooled transport.
+        """
+        await proxy.transport.open()
+        return proxy.transport
+
+    def record_response(self, proxy: ProxyState, status: int, latency: float) -> None:
+        """
+        Record a response received through a proxy.
+
+        Statuses in PROXY_FAILURE_STATUSES, such as 407 or a 403/429 block of the
+        egress IP, count against the proxy; any other response counts as a success.
+
+        Args:
+            proxy (ProxyState): The proxy the request went through.
+            status (int): The HTTP status of the response.
+            latency (float): The seconds until the response headers arrived.
+        """
+        if status in PROXY_FAILURE_STATUSES:
+            self.record_failure(proxy, f"status {status}")
+            return
+        proxy.outcomes.append((True, latency))
+        proxy.consecutive_failures = 0
+
+    def record_failure(self, proxy: ProxyState, reason: str) -> None:
+        """
+        Record a failed request through a proxy, quarantining it at the threshold.
+
+        Args:
+            proxy (ProxyState): The proxy the request went through.
+            reason (str): What went wrong, for logging.
+        """
+        now = time.monotonic()
+        proxy.outcomes.append((False, 0.0))
+        proxy.consecutive_failures += 1
+        if proxy.consecutive_failures >= self.failure_threshold and not proxy.is_quarantined(now):
+            proxy.quarantined_until = now + self.quarantine_seconds
+            # On release, the next failure re-quarantines the proxy.
+            proxy.consecutive_failures = self.failure_threshold - 1
+            logger.warning(f"Quarantined proxy {proxy.url} for {self.quarantine_seconds}s after {reason}")
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Describe the health of every proxy for logging.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The snapshot of each proxy, by URL.
+        """
+        return {url: proxy.snapshot() for url, proxy in self.proxies.items()}
+
+    async def close(self) -> None:
+        """
+        Close the connection pools of every proxy.
+        """
+        for proxy in self.proxies.values():
+            await proxy.transport.close()
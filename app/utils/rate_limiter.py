@@ -0,0 +1,286 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+from urllib.parse import urlparse
+
+from app.constants import (
+    ADAPTIVE_DECREASE_FACTOR,
+    ADAPTIVE_INITIAL_CONCURRENCY,
+    ADAPTIVE_LATENCY_TARGET,
+    ADAPTIVE_MAX_CONCURRENCY,
+    ADAPTIVE_MIN_CONCURRENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+THROTTLE_STATUSES = (429, 503)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header given either as seconds or as an HTTP date.
+
+    Args:
+        value (Optional[str]): The header value.
+
+    Returns:
+        Optional[float]: The number of seconds to wait, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class LimiterDecision:
+    """
+    A change made by the adaptive limiter to a host's concurrency window.
+
+    Attributes:
+        timestamp (float): The wall-clock time of the decision.
+        host (str): The host the decision applies to.
+        action (str): "increase", "decrease" or "pause".
+        old_limit (int): The window before the decision.
+        new_limit (int): The window after the decision.
+        reason (str): Why the window changed, e.g. "status 429" or "timeout".
+    """
+    timestamp: float
+    host: str
+    action: str
+    old_limit: int
+    new_limit: int
+    reason: str
+
+
+class HostLimiter:
+    """
+    AIMD concurrency control for a single host.
+
+    The window grows by roughly one slot per window's worth of requests answered
+    within the latency target, and is multiplied by the decrease factor on a
+    429/503 response or a timeout. A Retry-After header pauses the host entirely
+    until it expires.
+
+    Attributes:
+        host (str): The host being limited.
+        limit (float): The current concurrency window.
+        in_flight (int): The number of requests currently holding a slot.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        decisions: Deque[LimiterDecision],
+        initial: int = ADAPTIVE_INITIAL_CONCURRENCY,
+        minimum: int = ADAPTIVE_MIN_CONCURRENCY,
+        maximum: int = ADAPTIVE_MAX_CONCURRENCY,
+        latency_target: float = ADAPTIVE_LATENCY_TARGET,
+        decrease_factor: float = ADAPTIVE_DECREASE_FACTOR,
+    ) -> None:
+        """
+        Initialize the HostLimiter.
+
+        Args:
+            host (str): The host being limited.
+            decisions (Deque[LimiterDecision]): The shared log decisions are appended to.
+            initial (int): The starting concurrency window.
+            minimum (int): The smallest window the limiter will shrink to.
+            maximum (int): The largest window the limiter will grow to.
+            latency_target (float): Responses slower than this many seconds don't grow the window.
+            decrease_factor (float): The factor the window is multiplied by on throttling.
+        """
+        self.host = host
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.latency_target = latency_target
+        self.decrease_factor = decrease_factor
+        self.in_flight = 0
+        self.blocked_until = 0.0
+        self._last_decrease = 0.0
+        self._decisions = decisions
+        self._condition: Optional[asyncio.Condition] = None
+
+    @property
+    def window(self) -> int:
+        """The number of requests currently allowed in flight."""
+        return max(self.minimum, int(self.limit))
+
+    def _get_condition(self) -> asyncio.Condition:
+        """Create the condition lazily so it binds to the running event loop."""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        return self._condition
+
+    async def acquire(self) -> None:
+        """
+        Wait for a free slot in the window and for any Retry-After pause to expire.
+        """
+        condition = self._get_condition()
+        async with condition:
+            while True:
+                pause = self.blocked_until - time.monotonic()
+                if pause > 0:
+                    try:
+                        await asyncio.wait_for(condition.wait(), pause)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.in_flight < self.window:
+                    break
+                await condition.wait()
+            self.in_flight += 1
+
+    async def release(self) -> None:
+        """
+        Give back a slot and wake up waiting requests.
+        """
+        condition = self._get_condition()
+        async with condition:
+            self.in_flight -= 1
+            condition.notify_all()
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """
+        Hold a slot in the window for the duration of a request.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            await self.release()
+
+    def record_response(self, status: int, latency: float, retry_after: Optional[str] = None) -> None:
+        """
+        Adjust the window from a response.
+
+        Args:
+            status (int): The HTTP status code.
+            latency (float): The time in seconds until the response headers arrived.
+            retry_after (Optional[str]): The Retry-After header, if any.
+        """
+        if status in THROTTLE_STATUSES:
+            self.record_throttle(f"status {status}", parse_retry_after(retry_after))
+        elif latency <= self.latency_target:
+            self._increase(f"latency {latency:.2f}s")
+
+    def record_throttle(self, reason: str, retry_after: Optional[float] = None) -> None:
+        """
+        Shrink the window after throttling, and pause the host if a Retry-After was given.
+
+        Throttling signals that arrive together from requests that were already in flight
+        count as one congestion event, so the window is cut at most once per cooldown.
+
+        Args:
+            reason (str): Why the host is considered throttled, e.g. "status 429" or "timeout".
+            retry_after (Optional[float]): Seconds to pause the host for, if any.
+        """
+        now = time.monotonic()
+        if retry_after:
+            self.blocked_until = max(self.blocked_until, now + retry_after)
+            self._record("pause", self.window, self.window, f"{reason}, Retry-After {retry_after:.0f}s")
+        if now - self._last_decrease < self.latency_target:
+            return
+        self._last_decrease = now
+        old_window = self.window
+        self.limit = max(float(self.minimum), self.limit * self.decrease_factor)
+        self._record("decrease", old_window, self.window, reason)
+
+    def _increase(self, reason: str) -> None:
+        """Grow the window additively, logging when it crosses a whole slot."""
+        old_window = self.window
+        self.limit = min(float(self.maximum), self.limit + 1.0 / self.window)
+        if self.window != old_window:
+            self._record("increase", old_window, self.window, reason)
+
+    def _record(self, action: str, old_limit: int, new_limit: int, reason: str) -> None:
+        """Append a decision to the shared log."""
+        self._decisions.append(LimiterDecision(time.time(), self.host, action, old_limit, new_limit, reason))
+        logger.info(f"Rate limiter {action} for {self.host}: {old_limit} -> {new_limit} ({reason})")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the current state of the host limiter.
+
+        Returns:
+            Dict[str, Any]: The window, requests in flight and remaining pause in seconds.
+        """
+        return {
+            "window": self.window,
+            "in_flight": self.in_flight,
+            "paused_for": max(0.0, self.blocked_until - time.monotonic()),
+        }
+
+
+class AdaptiveRateLimiter:
+    """
+    Per-host AIMD rate limiter shared by page fetches and image downloads.
+
+    Attributes:
+        decisions (Deque[LimiterDecision]): The most recent window changes across all hosts.
+    """
+
+    def __init__(self, max_decisions: int = 1000, **host_options: Any) -> None:
+        """
+        Initialize the AdaptiveRateLimiter.
+
+        Args:
+            max_decisions (int): The number of recent decisions to keep.
+            **host_options: Options passed to every HostLimiter, such as `initial` or `maximum`.
+        """
+        self.decisions: Deque[LimiterDecision] = deque(maxlen=max_decisions)
+        self._host_options = host_options
+        self._hosts: Dict[str, HostLimiter] = {}
+
+    def for_url(self, url: str) -> HostLimiter:
+        """
+        Return the limiter for the host of a URL, creating it on first use.
+
+        Args:
+            url (str): The URL about to be requested.
+
+        Returns:
+            HostLimiter: The limiter for the URL's host.
+        """
+        host = urlparse(url).netloc
+        limiter = self._hosts.get(host)
+        if limiter is None:
+            limiter = self._hosts[host] = HostLimiter(host, self.decisions, **self._host_options)
+        return limiter
+
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the current state of every host limiter.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: The state of each host, keyed by host.
+        """
+        return {host: limiter.snapshot() for host, limiter in self._hosts.items()}
+
+    def recent_decisions(self, limit: int = 50) -> List[LimiterDecision]:
+        """
+        Return the most recent window changes.
+
+        Args:
+            limit (int): The maximum number of decisions to return.
+
+        Returns:
+            List[LimiterDecision]: The decisions, oldest first.
+        """
+        return list(self.decisions)[-limit:]
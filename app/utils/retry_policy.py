@@ -0,0 +1,306 @@
+import asyncio
+import logging
+import random
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple, Type, TypeVar
+from urllib.parse import urlparse
+
+from app.constants import (
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    CIRCUIT_BREAKER_RESET_TIMEOUT,
+    MAX_RETRY_ATTEMPTS,
+    RETRY_BASE_DELAY,
+    RETRY_BUDGET,
+    RETRY_MAX_DELAY,
+)
+from app.exceptions.scraper_exceptions import (
+    CircuitOpenException,
+    ClientErrorException,
+    NetworkException,
+    ScraperException,
+)
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class RetryBudget:
+    """
+    A cap on the total number of retries spent across a crawl.
+
+    Once a crawl has used up its budget, failures are raised on their first attempt,
+    so a struggling target can't turn every page into a full series of retries.
+
+    Attributes:
+        max_retries (Optional[int]): The number of retries allowed, or None for no limit.
+        spent (int): The number of retries spent so far.
+    """
+
+    def __init__(self, max_retries: Optional[int] = RETRY_BUDGET) -> None:
+        """
+        Initialize the RetryBudget.
+
+        Args:
+            max_retries (Optional[int]): The number of retries allowed, or None for no limit.
+        """
+        self.max_retries = max_retries
+        self.spent = 0
+
+    @property
+    def remaining(self) -> Optional[int]:
+        """The number of retries left, or None if the budget is unlimited."""
+        if self.max_retries is None:
+            return None
+        return max(0, self.max_retries - self.spent)
+
+    def try_spend(self) -> bool:
+        """
+        Take one retry from the budget.
+
+        Returns:
+            bool: True if the retry may go ahead, False if the budget is exhausted.
+        """
+        if self.max_retries is not None and self.spent >= self.max_retries:
+            return False
+        self.spent += 1
+        return True
+
+
+class CircuitBreaker:
+    """
+    A circuit breaker for one host.
+
+    The breaker opens after `failure_threshold` consecutive retryable failures and
+    rejects calls until `reset_timeout` seconds have passed. It then lets a single
+    trial call through: a success closes it, a failure opens it again.
+
+    Attributes:
+        host (str): The host the breaker guards.
+        failure_threshold (int): Consecutive failures that open the breaker.
+        reset_timeout (float): Seconds the breaker stays open before a trial call.
+        state (str): "closed", "open" or "half_open".
+        failures (int): The current number of consecutive failures.
+        opened_at (float): When the breaker last opened, on the monotonic clock.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        host: str,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the CircuitBreaker.
+
+        Args:
+            host (str): The host the breaker guards.
+            failure_threshold (int): Consecutive failures that open the breaker.
+            reset_timeout (float): Seconds the breaker stays open before a trial call.
+        """
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_in_flight = False
+
+    def before_call(self) -> None:
+        """
+        Check that a call may go ahead.
+
+        Raises:
+            CircuitOpenException: If the breaker is open, or half open with a trial call in flight.
+        """
+        if self.state == self.OPEN:
+            if time.monotonic() - self.opened_at < self.reset_timeout:
+                raise CircuitOpenException(f"Circuit breaker open for host: {self.host}")
+            logger.info(f"Circuit breaker for {self.host} half open, allowing a trial request")
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._trial_in_flight:
+                raise CircuitOpenException(f"Circuit breaker half open for host: {self.host}")
+            self._trial_in_flight = True
+
+    def record_success(self) -> None:
+        """
+        Record a call that reached the host, closing the breaker.
+        """
+        if self.state != self.CLOSED:
+            logger.info(f"Circuit breaker for {self.host} closed")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._trial_in_flight = False
+
+    def release(self) -> None:
+        """
+        End a call that says nothing about the host's health, such as one failed by its proxy.
+        """
+        self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        """
+        Record a retryable failure, opening the breaker at the threshold or after a failed trial call.
+        """
+        self._trial_in_flight = False
+        self.failures += 1
+        if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                logger.warning(f"Circuit breaker for {self.host} opened after {self.failures} consecutive failures")
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+
+
+class RetryPolicy:
+    """
+    An async retry engine with full-jitter exponential backoff, a retry budget and per-host circuit breakers.
+
+    Exceptions are classified into fatal ones, which are raised at once, and retryable
+    ones, which are retried while attempts and budget remain. Retryable network failures
+    count towards the host's circuit breaker; while it is open calls fail fast with
+    CircuitOpenException instead of sleeping through retries against a host that is down.
+
+    Attributes:
+        max_attempts (int): The maximum number of attempts per call.
+        base_delay (float): The backoff ceiling of the first retry in seconds.
+        max_delay (float): The upper bound of the backoff ceiling in seconds.
+        retryable_exceptions (Tuple[Type[BaseException], ...]): Exceptions worth retrying.
+        fatal_exceptions (Tuple[Type[BaseException], ...]): Exceptions raised without retrying,
+            checked before the retryable ones.
+        breaker_exceptions (Tuple[Type[BaseException], ...]): Retryable exceptions that count as
+            failures of the host, as opposed to e.g. a failing proxy or an unparseable page.
+        budget (RetryBudget): The retry budget shared by every call made through the policy.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = MAX_RETRY_ATTEMPTS,
+        base_delay: float = RETRY_BASE_DELAY,
+        max_delay: float = RETRY_MAX_DELAY,
+        retryable_exceptions: Tuple[Type[BaseException], ...] = (ScraperException,),
+        fatal_exceptions: Tuple[Type[BaseException], ...] = (ClientErrorException, CircuitOpenException),
+        breaker_exceptions: Tuple[Type[BaseException], ...] = (NetworkException,),
+        budget: Optional[RetryBudget] = None,
+        failure_threshold: int = CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_BREAKER_RESET_TIMEOUT,
+    ) -> None:
+        """
+        Initialize the RetryPolicy.
+
+        Args:
+            max_attempts (int): The maximum number of attempts per call.
+            base_delay (float): The backoff ceiling of the first retry in seconds.
+            max_delay (float): The upper bound of the backoff ceiling in seconds.
+            retryable_exceptions (Tuple[Type[BaseException], ...]): Exceptions worth retrying.
+            fatal_exceptions (Tuple[Type[BaseException], ...]): Exceptions raised without retrying.
+            breaker_exceptions (Tuple[Type[BaseException], ...]): Retryable exceptions that count
+                towards the host's circuit breaker.
+            budget (Optional[RetryBudget]): The retry budget to share. Defaults to a new RetryBudget.
+            failure_threshold (int): Consecutive failures that open a host's circuit breaker.
+            reset_timeout (float): Seconds a circuit breaker stays open before a trial call.
+        """
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.retryable_exceptions = retryable_exceptions
+        self.fatal_exceptions = fatal_exceptions
+        self.breaker_exceptions = breaker_exceptions
+        self.budget = budget or RetryBudget()
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._breakers: Dict[str, CircuitBreaker] = {}
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        """
+        Get the circuit breaker of a URL's host, creating it on first use.
+
+        Args:
+            url (str): The URL being requested.
+
+        Returns:
+            CircuitBreaker: The breaker for the URL's host.
+        """
+        host = urlparse(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, self.failure_threshold, self.reset_timeout)
+            self._breakers[host] = breaker
+        return breaker
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Compute the full-jitter delay before a retry.
+
+        Args:
+            attempt (int): The number of the attempt that just failed, starting at 1.
+
+        Returns:
+            float: A delay drawn uniformly between zero and the exponential ceiling.
+        """
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    async def run(self, func: Callable[..., Awaitable[T]], *args: Any, url: Optional[str] = None, **kwargs: Any) -> T:
+        """
+        Call an async function under the policy.
+
+        Args:
+            func (Callable[..., Awaitable[T]]): The function to call.
+            *args: Positional arguments for the function.
+            url (Optional[str]): The URL the call requests, whose host's circuit breaker guards it.
+                Calls without a URL are retried without a breaker.
+            **kwargs: Keyword arguments for the function.
+
+        Returns:
+            T: The return value of the function.
+
+        Raises:
+            CircuitOpenException: If the host's circuit breaker is open.
+            asyncio.CancelledError: If the call is cancelled, after releasing the breaker's trial slot.
+        """
+        breaker = self.breaker_for(url) if url else None
+        name = getattr(func, "__name__", repr(func))
+        attempt = 1
+        while True:
+            if breaker:
+                breaker.before_call()
+            try:
+                result = await func(*args, **kwargs)
+            except self.fatal_exceptions as e:
+                if breaker and not isinstance(e, CircuitOpenException):
+                    breaker.record_success()
+                raise
+            except self.retryable_exceptions as e:
+                if breaker and isinstance(e, self.breaker_exceptions):
+                    breaker.record_failure()
+                elif breaker:
+                    breaker.release()
+                if attempt >= self.max_attempts:
+                    logger.error(f"Max retry attempts reached for {name}. Error: {str(e)}")
+                    raise
+                if not self.budget.try_spend():
+                    logger.error(f"Retry budget exhausted, not retrying {name}. Error: {str(e)}")
+                    raise
+                if breaker and breaker.state == CircuitBreaker.OPEN:
+                    raise CircuitOpenException(f"Circuit breaker open for host: {breaker.host}") from e
+                delay = self.backoff(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Retrying {name} in {delay:.2f}s (attempt {attempt}/{self.max_attempts}). Error: {str(e)}"
+                )
+                await asyncio.sleep(delay)
+            except BaseException:
+                # Cancelled (e.g. the losing side of a hedge) or unclassified: nothing was learnt about
+                # the host, but a half-open trial must not stay in flight forever.
+                if breaker:
+                    breaker.release()
+                raise
+            else:
+                if breaker:
+                    breaker.record_success()
+                return result
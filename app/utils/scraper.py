@@ -1,106 +1,428 @@
+import asyncio
 import logging
-import os
-import ssl
-from decimal import Decimal
-from typing import List, Optional
-from urllib.parse import urljoin, urlparse
-
-import aiohttp
-from bs4 import BeautifulSoup, Tag
+import re
+import time
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Dict, List, Mapping, Optional
+from urllib.parse import urlparse
 
+from app.cache.page_cache import PageCache, hash_body
 from app.constants import (
+    HEDGE_ENABLED,
+    IMAGE_DOWNLOAD_CONCURRENCY,
+    IMAGE_DOWNLOAD_CONCURRENCY_PER_HOST,
     IMAGE_SAVE_DIR,
-    MAX_RETRY_ATTEMPTS,
-    NEXT_PAGE_CLASS,
-    PRODUCT_CLASS,
-    PRODUCT_IMAGE_CLASS,
-    PRODUCT_PRICE_CLASS,
-    PRODUCT_TITLE_CLASS,
-    RETRY_DELAY,
-    TARGET_URL,
+    PAGE_CACHE_ENABLED,
+    PROXY_LIST,
+    SCRAPER_PAGE_CONCURRENCY,
 )
 from app.exceptions.scraper_exceptions import (
+    ClientErrorException,
     DataExtractionException,
     NetworkException,
+    PageNotFoundException,
     PaginationException,
     ParsingException,
     ProxyException,
     ScraperException,
 )
+from app.exceptions.transport_exceptions import (
+    TransportException,
+    TransportProxyException,
+    TransportTimeoutException,
+)
 from app.models.product import Product
+from app.models.site_config import SiteConfig, default_site_config
+from app.parsers.base_parser import BaseParser, ParsedPage, ProductRecord
+from app.parsers.parser_factory import create_parser
+from app.parsers.parser_pool import ParserPool
+from app.transports.base_transport import BaseTransport
+from app.transports.transport_factory import create_transport
+from app.utils.crawl_checkpoint import CrawlCheckpoint
+from app.utils.crawl_scheduler import SiteShare
 from app.utils.image_downloader import download_image
-from app.utils.retry_decorator import retry_async
+from app.utils.image_store import ImageStore
+from app.utils.latency_tracker import HostLatency, LatencyTracker
+from app.utils.proxy_pool import ProxyPool
+from app.utils.rate_limiter import AdaptiveRateLimiter
+from app.utils.retry_policy import RetryPolicy
 
 logger = logging.getLogger(__name__)
 
+PAGE_NUMBER_PATTERN = re.compile(r'/page/(\d+)/?(?:[?#]|$)')
+
+# Client errors that can succeed on a later attempt: request timeout and rate limiting.
+RETRYABLE_CLIENT_STATUSES = (408, 429)
+
+
+@dataclass
+class PageResult:
+    """
+    The result of fetching and parsing a single catalog page once.
+
+    Attributes:
+        url (str): The URL of the page.
+        product_records (List[ProductRecord]): The product records extracted by the parser engine.
+        next_page_url (Optional[str]): The URL of the next page, if any.
+        last_page_number (Optional[int]): The highest page number shown in the pagination block, if any.
+        products (List[Product]): The products extracted from the page.
+    """
+    url: str
+    product_records: List[ProductRecord]
+    next_page_url: Optional[str]
+    last_page_number: Optional[int] = None
+    products: List[Product] = field(default_factory=list)
+
+    @classmethod
+    def from_parsed(cls, url: str, parsed: ParsedPage) -> "PageResult":
+        """Build a page result from the output of a parser engine."""
+        return cls(
+            url=url,
+            product_records=parsed.product_records,
+            next_page_url=parsed.next_page_url,
+            last_page_number=parsed.last_page_number,
+        )
+
+    def to_parsed(self) -> ParsedPage:
+        """Return the parser output this page result was built from."""
+        return ParsedPage(
+            product_records=self.product_records,
+            next_page_url=self.next_page_url,
+            last_page_number=self.last_page_number,
+        )
+
+
+@dataclass
+class FetchedPage:
+    """
+    The body and validators of a fetched page.
+
+    Attributes:
+        html (Optional[str]): The HTML content, or None if the server answered 304 Not Modified.
+        etag (Optional[str]): The ETag response header, if any.
+        last_modified (Optional[str]): The Last-Modified response header, if any.
+        headers (Mapping[str, str]): All response headers, matched case-insensitively.
+    """
+    html: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    headers: Mapping[str, str] = field(default_factory=dict)
+
+
 class Scraper:
     """
     A class for scraping product information from a website.
 
+    The scraper owns a pooled HTTP transport for its lifetime and must be used as an
+    async context manager, so that page fetches and image downloads share connections.
+
     Attributes:
-        proxy (Optional[str]): The proxy server to use for requests.
+        site (SiteConfig): The site being crawled.
+        source (str): The scheme and domain of the site, used as the source of its products.
+        share (Optional[SiteShare]): The site's share of a scheduler's global concurrency, if any.
+        proxy_pool (Optional[ProxyPool]): The proxies requests are rotated through, if any.
         image_save_dir (str): The directory to save downloaded images.
-        ssl_context (ssl.SSLContext): A custom SSL context for requests.
+        transport (BaseTransport): The pooled HTTP transport shared by all requests made without a proxy.
+        page_concurrency (int): The default maximum number of catalog pages in flight.
+        parser (BaseParser): The HTML parser engine used to extract products and pagination.
+        parser_pool (Optional[ParserPool]): The process pool pages are parsed in, if any.
+        image_concurrency (int): The maximum number of image downloads in flight across all pages.
+        image_concurrency_per_host (int): The maximum number of image downloads in flight per host.
+        image_store (ImageStore): The content-addressed store downloaded images are saved in.
+        page_cache (Optional[PageCache]): The cache used to revalidate catalog pages, if any.
+        rate_limiter (AdaptiveRateLimiter): The per-host AIMD limiter shared by page fetches and image downloads.
+        retry_policy (RetryPolicy): The retry policy for page scrapes, whose retry budget spans the crawl.
+        latency_tracker (LatencyTracker): The per-host latency percentiles page timeouts and hedges are sized from.
+        hedging (bool): Whether slow page fetches are hedged with a duplicate request.
     """
 
-    def __init__(self, proxy: Optional[str] = None, image_save_dir: str = IMAGE_SAVE_DIR):
+    def __init__(
+        self,
+        proxy: Optional[str] = None,
+        image_save_dir: str = IMAGE_SAVE_DIR,
+        transport: Optional[BaseTransport] = None,
+        page_concurrency: int = SCRAPER_PAGE_CONCURRENCY,
+        parser: Optional[BaseParser] = None,
+        parser_pool: Optional[ParserPool] = None,
+        image_concurrency: int = IMAGE_DOWNLOAD_CONCURRENCY,
+        image_concurrency_per_host: int = IMAGE_DOWNLOAD_CONCURRENCY_PER_HOST,
+        page_cache: Optional[PageCache] = None,
+        rate_limiter: Optional[AdaptiveRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        proxies: Optional[List[str]] = None,
+        proxy_pool: Optional[ProxyPool] = None,
+        site: Optional[SiteConfig] = None,
+        share: Optional[SiteShare] = None,
+        latency_tracker: Optional[LatencyTracker] = None,
+        hedging: bool = HEDGE_ENABLED,
+    ):
         """
         Initialize the Scraper.
 
         Args:
-            proxy (Optional[str]): The proxy server to use for requests.
+            proxy (Optional[str]): A proxy server to use for requests, added to `proxies`.
             image_save_dir (str): The directory to save downloaded images.
+            transport (Optional[BaseTransport]): A shared HTTP transport to use. If omitted, the scraper
+                creates one of the configured HTTP_TRANSPORT type and closes it on exit.
+            page_concurrency (int): The default maximum number of catalog pages in flight.
+            parser (Optional[BaseParser]): The HTML parser engine. Defaults to the configured engine.
+            parser_pool (Optional[ParserPool]): A running process pool to parse pages in.
+                If omitted, pages are parsed inline with `parser`.
+            image_concurrency (int): The maximum number of image downloads in flight across all pages.
+            image_concurrency_per_host (int): The maximum number of image downloads in flight per host.
+            page_cache (Optional[PageCache]): The cache used to revalidate catalog pages.
+                Defaults to a PageCache under STORAGE_PATH when PAGE_CACHE_ENABLED is set.
+            rate_limiter (Optional[AdaptiveRateLimiter]): The per-host AIMD limiter for all requests.
+            retry_policy (Optional[RetryPolicy]): The retry policy for page scrapes. Defaults to a new
+                RetryPolicy, so each scraper gets its own retry budget and circuit breakers.
+            proxies (Optional[List[str]]): Proxy servers to rotate requests through. Defaults to PROXY_LIST.
+            proxy_pool (Optional[ProxyPool]): A shared proxy pool to use instead of `proxy` and `proxies`.
+                If omitted and proxies are configured, the scraper creates its own pool and closes it on exit.
+            site (Optional[SiteConfig]): The site to crawl. Defaults to TARGET_URL with the default selectors.
+            share (Optional[SiteShare]): The site's share of a scheduler's global concurrency. Each page
+                scrape attempt holds one of its slots.
+            latency_tracker (Optional[LatencyTracker]): The per-host latency percentiles for page fetches.
+            hedging (bool): Whether slow page fetches are hedged with a duplicate request. Defaults to HEDGE_ENABLED.
         """
-        self.proxy = proxy
+        self.site = site or default_site_config()
+        self.source = self.site.source
+        self.share = share
+        proxy_urls = ([proxy] if proxy else []) + list(proxies if proxies is not None else PROXY_LIST)
+        self.proxy_pool = proxy_pool or (ProxyPool(proxy_urls) if proxy_urls else None)
+        self._owns_proxy_pool = proxy_pool is None
         self.image_save_dir = image_save_dir
-        self.ssl_context = self._create_ssl_context()
-        logger.info(f"Scraper initialized with proxy: {proxy}, image_save_dir: {image_save_dir}")
+        self.transport = transport or create_transport()
+        self._owns_transport = transport is None
+        self.page_concurrency = page_concurrency
+        self.parser = parser or create_parser(selectors=self.site.selectors)
+        self.parser_pool = parser_pool
+        self.image_concurrency = image_concurrency
+        self.image_concurrency_per_host = image_concurrency_per_host
+        self._image_semaphore = asyncio.Semaphore(image_concurrency)
+        self._image_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.image_store = ImageStore(image_save_dir)
+        self.page_cache = page_cache or (PageCache() if PAGE_CACHE_ENABLED else None)
+        self.rate_limiter = rate_limiter or AdaptiveRateLimiter()
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.latency_tracker = latency_tracker or LatencyTracker()
+        self.hedging = hedging
+        logger.info(
+            f"Scraper initialized for site {self.site.name} with "
+            f"{len(self.proxy_pool.proxies) if self.proxy_pool else 0} proxies, "
+            f"image_save_dir: {image_save_dir}"
+        )
+
+    async def __aenter__(self) -> "Scraper":
+        await self.transport.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        logger.info(f"Rate limiter state at end of crawl: {self.rate_limiter.snapshot()}")
+        logger.info(f"Page latency at end of crawl: {self.latency_tracker.snapshot()}")
+        self.image_store.save()
+        if self.proxy_pool is not None:
+            logger.info(f"Proxy pool state at end of crawl: {self.proxy_pool.snapshot()}")
+            if self._owns_proxy_pool:
+                await self.proxy_pool.close()
+        if self._owns_transport:
+            await self.transport.close()
 
-    @staticmethod
-    def _create_ssl_context() -> ssl.SSLContext:
+    async def fetch_page(self, url: str) -> str:
         """
-        Create a custom SSL context that doesn't verify certificates.
+        Fetch the HTML content of a given URL.
+
+        Args:
+            url (str): The URL to fetch.
 
         Returns:
-            ssl.SSLContext: The custom SSL context.
+            str: The HTML content of the page.
+
+        Raises:
+            NetworkException: If there's an error fetching the page.
         """
-        context = ssl.create_default_context()
-        context.check_hostname = False
-        context.verify_mode = ssl.CERT_NONE
-        return context
+        fetched = await self.fetch_page_conditional(url)
+        return fetched.html
 
-    async def fetch_page(self, url: str) -> str:
+    async def fetch_page_conditional(self, url: str, headers: Optional[Dict[str, str]] = None) -> FetchedPage:
         """
-        Fetch the HTML content of a given URL.
+        Fetch a page, optionally revalidating it with conditional request headers.
+
+        The timeout comes from the host's rolling latency percentiles. With hedging enabled,
+        a request still unanswered at the host's hedge percentile is duplicated, within the
+        hedge rate cap, and whichever response arrives first is used.
 
         Args:
             url (str): The URL to fetch.
+            headers (Optional[Dict[str, str]]): Extra request headers, such as If-None-Match.
 
         Returns:
-            str: The HTML content of the page.
+            FetchedPage: The body and validators of the page, with no body on a 304 response.
 
         Raises:
+            PageNotFoundException: If the page doesn't exist.
+            ClientErrorException: If the server rejects the request with another client error.
+            ProxyException: If no proxy is available or the proxy fails.
+            NetworkException: If there's an error fetching the page.
+        """
+        host_latency = self.latency_tracker.for_url(url)
+        hedge_delay = host_latency.hedge_delay() if self.hedging else None
+        if hedge_delay is None:
+            return await self._fetch_page_once(url, headers, host_latency)
+        return await self._fetch_page_hedged(url, headers, host_latency, hedge_delay)
+
+    async def _fetch_page_hedged(
+        self, url: str, headers: Optional[Dict[str, str]], host_latency: HostLatency, hedge_delay: float
+    ) -> FetchedPage:
+        """
+        Fetch a page, sending a second request if the first is slower than `hedge_delay`.
+
+        The hedge delay is counted from when the first request gets its rate limiter slot,
+        so time spent queued behind a throttled host never triggers a hedge. The first
+        successful response wins and the other request is cancelled. A client error is
+        final, since a duplicate would get the same answer; any other failure waits for
+        the other request before being raised.
+
+        Args:
+            url (str): The URL to fetch.
+            headers (Optional[Dict[str, str]]): Extra request headers.
+            host_latency (HostLatency): The latency state of the URL's host.
+            hedge_delay (float): The seconds to wait before hedging.
+
+        Returns:
+            FetchedPage: The page from whichever request succeeded first.
+
+        Raises:
+            ScraperException: The error of the last request to fail, if none succeeded.
+        """
+        slot_acquired = asyncio.Event()
+        tasks = [asyncio.ensure_future(self._fetch_page_once(url, headers, host_latency, slot_acquired))]
+        slot_waiter = asyncio.ensure_future(slot_acquired.wait())
+        try:
+            await asyncio.wait([tasks[0], slot_waiter], return_when=asyncio.FIRST_COMPLETED)
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if not done and host_latency.try_hedge():
+                logger.info(f"Hedging request for {url} after {hedge_delay:.2f}s")
+                tasks.append(asyncio.ensure_future(self._fetch_page_once(url, headers, host_latency)))
+            error: Optional[ScraperException] = None
+            for next_done in asyncio.as_completed(tasks):
+                try:
+                    return await next_done
+                except ClientErrorException:
+                    raise
+                except ScraperException as e:
+                    error = e
+            raise error
+        finally:
+            slot_waiter.cancel()
+            for task in tasks:
+                task.cancel()
+
+    async def _fetch_page_once(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]],
+        host_latency: HostLatency,
+        slot_acquired: Optional[asyncio.Event] = None,
+    ) -> FetchedPage:
+        """
+        Send a single request for a page with the host's adaptive timeout.
+
+        With a proxy pool, the request goes through a proxy chosen by its health and
+        that proxy's own connection pool, and the outcome is fed back into its score.
+
+        Args:
+            url (str): The URL to fetch.
+            headers (Optional[Dict[str, str]]): Extra request headers.
+            host_latency (HostLatency): The latency state of the URL's host.
+            slot_acquired (Optional[asyncio.Event]): Set once the request has its rate limiter slot.
+
+        Returns:
+            FetchedPage: The body and validators of the page, with no body on a 304 response.
+
+        Raises:
+            PageNotFoundException: If the page doesn't exist.
+            ClientErrorException: If the server rejects the request with another client error.
+            ProxyException: If no proxy is available or the proxy fails.
             NetworkException: If there's an error fetching the page.
         """
         logger.info(f"Fetching page: {url}")
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.get(url, proxy=self.proxy, timeout=10, ssl=self.ssl_context) as response:
-                    response.raise_for_status()
-                    content = await response.text()
-                    logger.info(f"Successfully fetched page: {url}")
-                    return content
-            except aiohttp.ClientError as e:
-                logger.error(f"Error fetching page {url}: {str(e)}")
-                raise NetworkException(f"Failed to fetch page: {str(e)}") from e
+        proxy = self.proxy_pool.choose() if self.proxy_pool else None
+        transport = await self.proxy_pool.transport_for(proxy) if proxy else self.transport
+        host_limiter = self.rate_limiter.for_url(url)
+        timeout = host_latency.timeout()
+        try:
+            async with host_limiter.slot():
+                if slot_acquired is not None:
+                    slot_acquired.set()
+                started = time.monotonic()
+                async with transport.get(url, headers=headers, timeout=timeout) as response:
+                    latency = time.monotonic() - started
+                    host_limiter.record_response(response.status, latency, response.headers.get("Retry-After"))
+                    if proxy:
+                        self.proxy_pool.record_response(proxy, response.status, latency)
+                    self._raise_for_status(url, response.status)
+                    if response.status == 304:
+                        logger.info(f"Page not modified: {url}")
+                        content = None
+                    else:
+                        content = await response.text()
+                        logger.info(f"Successfully fetched page over {response.http_version}: {url}")
+                    fetched = FetchedPage(
+                        html=content,
+                        etag=response.headers.get("ETag"),
+                        last_modified=response.headers.get("Last-Modified"),
+                        headers=response.headers,
+                    )
+                host_latency.record(time.monotonic() - started)
+                return fetched
+        except TransportTimeoutException as e:
+            host_limiter.record_throttle("timeout")
+            host_latency.record_timeout(timeout)
+            if proxy:
+                self.proxy_pool.record_failure(proxy, "timeout")
+            logger.error(f"Timed out after {timeout:.1f}s fetching page {url}")
+            raise NetworkException(f"Timed out fetching page: {url}") from e
+        except TransportProxyException as e:
+            if proxy:
+                self.proxy_pool.record_failure(proxy, str(e))
+            proxy_url = proxy.url if proxy else transport.proxy
+            logger.error(f"Proxy {proxy_url} failed fetching page {url}: {str(e)}")
+            raise ProxyException(f"Proxy {proxy_url} failed: {str(e)}") from e
+        except TransportException as e:
+            logger.error(f"Error fetching page {url}: {str(e)}")
+            raise NetworkException(f"Failed to fetch page: {str(e)}") from e
 
-    async def parse_product(self, product_element: Tag, base_url: str) -> Optional[Product]:
+    @staticmethod
+    def _raise_for_status(url: str, status: int) -> None:
         """
-        Parse a product element and return a Product object.
+        Raise the scraper exception matching an error status.
 
         Args:
-            product_element (Tag): The BeautifulSoup Tag containing product information.
-            base_url (str): The base URL of the page.
+            url (str): The URL that was fetched.
+            status (int): The HTTP status of the response.
+
+        Raises:
+            PageNotFoundException: If the status is 404.
+            ClientErrorException: If the status is another client error that retrying won't fix.
+            NetworkException: If the status is any other error.
+        """
+        if status < 400:
+            return
+        if status == 404:
+            logger.info(f"Page not found: {url}")
+            raise PageNotFoundException(f"Page not found: {url}")
+        if status < 500 and status not in RETRYABLE_CLIENT_STATUSES:
+            logger.error(f"Client error {status} fetching page {url}")
+            raise ClientErrorException(f"Failed to fetch page: {status} for {url}")
+        logger.error(f"Error {status} fetching page {url}")
+        raise NetworkException(f"Failed to fetch page: {status} for {url}")
+
+    async def parse_product(self, record: ProductRecord) -> Optional[Product]:
+        """
+        Download a product's image and build a Product object from its extracted record.
+
+        Args:
+            record (ProductRecord): The product data extracted by the parser engine.
 
         Returns:
             Optional[Product]: A Product object if parsing is successful, None otherwise.
@@ -109,140 +431,487 @@ class Scraper:
             DataExtractionException: If there's an error parsing the product.
         """
         try:
-            product_id = self._extract_product_id(product_element)
-            product_title = self._extract_product_title(product_element)
-            product_price = self._extract_product_price(product_element)
-            product_image_url = self._extract_product_image_url(product_element, base_url)
-
-            local_image_path = await download_image(product_image_url, self.image_save_dir)
+            local_image_path = await self._download_product_image(record.image_url)
             if not local_image_path:
-                raise DataExtractionException(f"Failed to download image: {product_image_url}")
+                raise DataExtractionException(f"Failed to download image: {record.image_url}")
 
-            source = self._get_source_url()
-
-            logger.info(f"Parsed product: {product_id}, {product_title}, {product_price}, {local_image_path}")
+            logger.info(
+                f"Parsed product: {record.source_id}, {record.product_title}, "
+                f"{record.product_price}, {local_image_path}"
+            )
             return Product(
-                id=f"{source}_{product_id}",
-                source=source,
-                source_id=product_id,
-                product_title=product_title,
-                product_price=product_price,
+                id=f"{self.source}_{record.source_id}",
+                source=self.source,
+                source_id=record.source_id,
+                product_title=record.product_title,
+                product_price=record.product_price,
                 path_to_image=local_image_path
             )
+        except DataExtractionException:
+            raise
         except (AttributeError, ValueError, KeyError) as e:
             logger.warning(f"Error parsing product: {str(e)}")
-            logger.warning(f"Product element: {product_element}")
+            logger.warning(f"Product record: {record}")
             raise DataExtractionException(f"Failed to parse product: {str(e)}") from e
         except Exception as e:
             logger.error(f"Unexpected error parsing product: {str(e)}")
-            logger.error(f"Product element: {product_element}")
+            logger.error(f"Product record: {record}")
             raise DataExtractionException(f"Unexpected error parsing product: {str(e)}") from e
 
-    @staticmethod
-    def _extract_product_id(product_element: Tag) -> str:
-        """Extract the product ID from the product element."""
-        product_id_element = product_element.find('a', class_='button')
-        return product_id_element.get('data-product_id', '') if product_id_element else ''
+    async def _download_product_image(self, image_url: str) -> Optional[str]:
+        """
+        Download a product image within the global and per-host concurrency limits.
 
-    @staticmethod
-    def _extract_product_title(product_element: Tag) -> str:
-        """Extract the product title from the product element."""
-        title_element = product_element.find('h2', class_=PRODUCT_TITLE_CLASS)
-        return title_element.a.text.strip() if title_element and title_element.a else ''
+        Args:
+            image_url (str): The URL of the image to download.
 
-    @staticmethod
-    def _extract_product_price(product_element: Tag) -> Decimal:
-        """Extract the product price from the product element."""
-        price_element = product_element.find('span', class_=PRODUCT_PRICE_CLASS)
-        if price_element:
-            price_text = price_element.text.strip()
-            price_value = ''.join(filter(lambda x: x.isdigit() or x == '.', price_text))
-            return Decimal(price_value) if price_value else Decimal('0')
-        return Decimal('0')
+        Returns:
+            Optional[str]: The local path of the saved image if successful, None otherwise.
+        """
+        host = urlparse(image_url).netloc
+        host_semaphore = self._image_host_semaphores.get(host)
+        if host_semaphore is None:
+            host_semaphore = self._image_host_semaphores[host] = asyncio.Semaphore(self.image_concurrency_per_host)
+        async with host_semaphore, self._image_semaphore:
+            proxy = self.proxy_pool.choose() if self.proxy_pool else None
+            transport = await self.proxy_pool.transport_for(proxy) if proxy else self.transport
+            return await download_image(
+                image_url,
+                self.image_save_dir,
+                transport,
+                self.image_store,
+                rate_limiter=self.rate_limiter,
+                proxy_pool=self.proxy_pool,
+                proxy=proxy,
+            )
 
-    @staticmethod
-    def _extract_product_image_url(product_element: Tag, base_url: str) -> str:
-        """Extract the product image URL from the product element."""
-        image_element = product_element.find('img', class_=PRODUCT_IMAGE_CLASS)
-        image_url = image_element.get('data-lazy-src', '') if image_element else ''
-        return urljoin(base_url, image_url)
+    async def parse_page(self, url: str, html: str) -> PageResult:
+        """
+        Parse a fetched page once with the configured parser engine.
 
-    @staticmethod
-    def _get_source_url() -> str:
-        """Get the source URL from the TARGET_URL constant."""
-        parsed_url = urlparse(TARGET_URL)
-        return f"{parsed_url.scheme}://{parsed_url.netloc}"
+        When a parser pool is set, parsing runs in a worker process so the event loop
+        stays free for I/O; otherwise it runs inline.
 
-    @retry_async(max_attempts=MAX_RETRY_ATTEMPTS, delay=RETRY_DELAY)
-    async def scrape_page(self, url: str) -> List[Product]:
+        Args:
+            url (str): The URL the HTML was fetched from.
+            html (str): The HTML content of the page.
+
+        Returns:
+            PageResult: The product records and pagination data of the page.
+
+        Raises:
+            ParsingException: If the HTML cannot be parsed.
+            PaginationException: If there's an error getting the next page URL.
         """
-        Scrape a single page and return a list of Product objects.
+        if self.parser_pool is not None:
+            parsed = await self.parser_pool.parse_page(url, html, self.site.selectors)
+        else:
+            parsed = self.parser.parse_page(url, html)
+        return PageResult.from_parsed(url, parsed)
+
+    async def load_page(self, url: str) -> PageResult:
+        """
+        Fetch and parse a page, reusing the page cache where possible.
+
+        A cached page is revalidated with its stored validators. When the server answers
+        304, or the body hashes the same as last time, extraction is skipped and the
+        previously extracted records are reused.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            PageResult: The product records and pagination data of the page.
+
+        Raises:
+            NetworkException: If there's an error fetching the page.
+            ParsingException: If the HTML cannot be parsed.
+            PaginationException: If there's an error getting the next page URL.
+        """
+        cached = self.page_cache.get(url) if self.page_cache else None
+        fetched = await self.fetch_page_conditional(url, cached.conditional_headers() if cached else None)
+
+        if fetched.html is None:
+            if cached is None:
+                raise NetworkException(f"Received 304 for uncached page: {url}")
+            logger.info(f"Reusing cached extraction for unmodified page: {url}")
+            return PageResult.from_parsed(url, cached.parsed)
+
+        body_hash = hash_body(fetched.html)
+        if cached is not None and cached.body_hash == body_hash:
+            logger.info(f"Reusing cached extraction for unchanged page: {url}")
+            page = PageResult.from_parsed(url, cached.parsed)
+        else:
+            page = await self.parse_page(url, fetched.html)
+
+        if self.page_cache:
+            self.page_cache.set(url, fetched.etag, fetched.last_modified, body_hash, page.to_parsed())
+        return page
+
+    async def scrape_page_result(self, url: str) -> PageResult:
+        """
+        Fetch, parse and extract a single page in one pass, retrying it under the scraper's retry policy.
 
         Args:
             url (str): The URL of the page to scrape.
 
         Returns:
-            List[Product]: A list of Product objects scraped from the page.
+            PageResult: The page with its extracted products and next page URL.
 
         Raises:
+            PageNotFoundException: If the page doesn't exist.
+            CircuitOpenException: If the host's circuit breaker is open.
+            NetworkException: If there's an error fetching the page.
             ParsingException: If there's an error parsing the page.
         """
+        return await self.retry_policy.run(self._scrape_page_result_once, url, url=url)
+
+    async def _scrape_page_result_once(self, url: str) -> PageResult:
+        """
+        Make a single attempt at scraping a page, within the site's share when scheduled.
+
+        Args:
+            url (str): The URL of the page to scrape.
+
+        Returns:
+            PageResult: The page with its extracted products and next page URL.
+        """
+        if self.share is None:
+            return await self._extract_page(url)
+        async with self.share.slot():
+            return await self._extract_page(url)
+
+    async def _extract_page(self, url: str) -> PageResult:
+        """
+        Load a page and build its products, downloading their images.
+
+        Args:
+            url (str): The URL of the page to scrape.
+
+        Returns:
+            PageResult: The page with its extracted products and next page URL.
+        """
         try:
-            html = await self.fetch_page(url)
-            soup = BeautifulSoup(html, 'html.parser')
-            product_elements = soup.find_all('li', class_=PRODUCT_CLASS)
+            page = await self.load_page(url)
 
-            products = []
-            for element in product_elements:
-                try:
-                    product = await self.parse_product(element, url)
-                    if product:
-                        products.append(product)
-                except DataExtractionException as e:
-                    logger.warning(f"Skipping product due to parsing error: {str(e)}")
-
-            logger.info(f"Scraped {len(products)} products from {url}")
-            return products
+            results = await asyncio.gather(
+                *(self.parse_product(record) for record in page.product_records), return_exceptions=True
+            )
+            for result in results:
+                if isinstance(result, DataExtractionException):
+                    logger.warning(f"Skipping product due to parsing error: {str(result)}")
+                elif isinstance(result, BaseException):
+                    raise result
+                elif result:
+                    page.products.append(result)
+
+            logger.info(f"Scraped {len(page.products)} products from {url}")
+            return page
         except ParsingException as e:
             logger.error(f"Error parsing page {url}: {str(e)}")
             raise
 
-    @retry_async(max_attempts=MAX_RETRY_ATTEMPTS, delay=RETRY_DELAY)
-    async def scrape_catalog(self, page_limit: Optional[int] = None) -> List[Product]:
+    async def scrape_page(self, url: str) -> List[Product]:
+        """
+        Scrape a single page and return a list of Product objects.
+
+        Args:
+            url (str): The URL of the page to scrape.
+
+        Returns:
+            List[Product]: A list of Product objects scraped from the page.
+
+        Raises:
+            ParsingException: If there's an error parsing the page.
+        """
+        page = await self.scrape_page_result(url)
+        return page.products
+
+    async def scrape_catalog(
+        self,
+        page_limit: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+    ) -> List[Product]:
         """
         Scrape the entire catalog or up to the specified page limit.
 
+        Failed pages are retried on their own by scrape_page_result; the catalog
+        crawl itself is never restarted. Pass a checkpoint to make the crawl resumable.
+
         Args:
             page_limit (Optional[int]): The maximum number of pages to scrape.
+            concurrency (Optional[int]): The maximum number of pages in flight.
+                Defaults to SCRAPER_PAGE_CONCURRENCY.
+            checkpoint (Optional[CrawlCheckpoint]): The checkpoint to record progress in and resume from.
 
         Returns:
             List[Product]: A list of all Product objects scraped from the catalog.
         """
-        url = TARGET_URL
         all_products: List[Product] = []
         page_count = 0
-
-        logger.info(f"Starting catalog scrape with page_limit: {page_limit}")
-        while url and (page_limit is None or page_count < page_limit):
-            try:
-                logger.info(f"Scraping page {page_count + 1}: {url}")
-                html = await self.fetch_page(url)
-                products = await self.scrape_page(url)
-                all_products.extend(products)
-
-                url = self.get_next_page_url(url, html)
-                page_count += 1
-            except (NetworkException, ParsingException, PaginationException) as e:
-                logger.error(f"Error scraping page {url}: {str(e)}")
-                break
+        async for page in self.iter_pages(page_limit=page_limit, concurrency=concurrency, checkpoint=checkpoint):
+            all_products.extend(page.products)
+            page_count += 1
 
         logger.info(f"Scraped {len(all_products)} products from {page_count} pages")
         return all_products
 
+    async def iter_products(
+        self,
+        page_limit: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+    ) -> AsyncIterator[Product]:
+        """
+        Yield the catalog's products as their pages are scraped.
+
+        Pages are only scheduled while the consumer keeps pulling, so a slow consumer
+        holds back the crawl instead of letting scraped products pile up in memory.
+
+        Args:
+            page_limit (Optional[int]): The maximum number of pages to scrape.
+            concurrency (Optional[int]): The maximum number of pages in flight.
+                Defaults to SCRAPER_PAGE_CONCURRENCY.
+            checkpoint (Optional[CrawlCheckpoint]): The checkpoint to record progress in and resume from.
+
+        Yields:
+            Product: The scraped products, in catalog order.
+
+        Raises:
+            ClientErrorException: If the site rejects a page request.
+            CircuitOpenException: If the site's circuit breaker is open.
+        """
+        async for page in self.iter_pages(page_limit=page_limit, concurrency=concurrency, checkpoint=checkpoint):
+            for product in page.products:
+                yield product
+
+    async def iter_pages(
+        self,
+        page_limit: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        checkpoint: Optional[CrawlCheckpoint] = None,
+    ) -> AsyncIterator[PageResult]:
+        """
+        Yield the catalog's pages in order as they are scraped.
+
+        The first page is scraped on its own. If its pagination follows WooCommerce's
+        /page/N/ pattern, the following pages are scheduled ahead with at most
+        `concurrency` pages in flight; otherwise next page links are followed one by one.
+
+        A page that still fails after its retries ends the crawl there, leaving it to be
+        resumed from the checkpoint; errors the retry policy treats as fatal, such as
+        client errors and open circuits, are raised instead. With a checkpoint, every
+        page is recorded before it is yielded, the crawl continues after the checkpoint's
+        last completed page, and the checkpoint is marked completed once the end of the
+        catalog or the page limit is reached.
+
+        Args:
+            page_limit (Optional[int]): The maximum number of pages to scrape.
+            concurrency (Optional[int]): The maximum number of pages in flight.
+                Defaults to SCRAPER_PAGE_CONCURRENCY.
+            checkpoint (Optional[CrawlCheckpoint]): The checkpoint to record progress in and resume from.
+
+        Yields:
+            PageResult: The scraped pages, in catalog order.
+
+        Raises:
+            ClientErrorException: If the site rejects a page request.
+            CircuitOpenException: If the site's circuit breaker is open.
+        """
+        concurrency = concurrency or self.page_concurrency
+        logger.info(f"Starting catalog scrape with page_limit: {page_limit}, concurrency: {concurrency}")
+
+        try:
+            async for page in self._iter_crawl(page_limit, concurrency, checkpoint):
+                yield page
+        except self.retry_policy.fatal_exceptions:
+            raise
+        except (NetworkException, ParsingException, PaginationException, ProxyException) as e:
+            logger.error(f"Catalog crawl interrupted: {str(e)}")
+            return
+
+        if checkpoint is not None:
+            checkpoint.mark_completed()
+
+    async def _iter_crawl(
+        self, page_limit: Optional[int], concurrency: int, checkpoint: Optional[CrawlCheckpoint]
+    ) -> AsyncIterator[PageResult]:
+        """
+        Scrape the catalog from page 1, or from after the checkpoint's last completed page.
+
+        Args:
+            page_limit (Optional[int]): The maximum number of pages to scrape.
+            concurrency (int): The maximum number of pages in flight.
+            checkpoint (Optional[CrawlCheckpoint]): The checkpoint to record progress in and resume from.
+
+        Yields:
+            PageResult: The scraped pages, in catalog order.
+
+        Raises:
+            NetworkException: If a page still can't be fetched after its retries.
+            ParsingException: If a page still can't be parsed after its retries.
+        """
+        if checkpoint is not None and checkpoint.pages_done > 0:
+            pages_done = checkpoint.pages_done
+            next_url = checkpoint.next_url
+            page_url_template = checkpoint.page_url_template
+            last_page_number = checkpoint.last_page_number
+            logger.info(f"Resuming crawl {checkpoint.token} after page {pages_done}")
+        else:
+            start_url = self._get_start_url()
+            logger.info(f"Scraping page 1: {start_url}")
+            first_page = await self.scrape_page_result(start_url)
+            pages_done = 1
+            next_url = first_page.next_page_url
+            page_url_template = self._get_page_url_template(next_url)
+            last_page_number = first_page.last_page_number
+            if checkpoint is not None:
+                checkpoint.set_pagination(page_url_template, last_page_number)
+                checkpoint.record_page(1, next_url, first_page.products)
+            yield first_page
+
+        if next_url is None or (page_limit is not None and pages_done >= page_limit):
+            return
+
+        if page_url_template and concurrency > 1:
+            # `end` is the first page number that is known not to belong to the crawl.
+            end = float("inf")
+            if last_page_number:
+                end = last_page_number + 1
+            if page_limit is not None:
+                end = min(end, page_limit + 1)
+            pages = self._iter_numbered_pages(page_url_template, pages_done + 1, end, concurrency)
+        else:
+            pages = self._iter_linked_pages(next_url, pages_done + 1, page_limit)
+
+        number = pages_done
+        async for page in pages:
+            number += 1
+            if checkpoint is not None:
+                checkpoint.record_page(number, page.next_page_url, page.products)
+            yield page
+
+    async def _iter_linked_pages(
+        self, url: Optional[str], number: int, page_limit: Optional[int]
+    ) -> AsyncIterator[PageResult]:
+        """
+        Follow next page links one page at a time.
+
+        Args:
+            url (Optional[str]): The URL of the first page to scrape.
+            number (int): The catalog page number of that page.
+            page_limit (Optional[int]): The maximum number of pages to scrape.
+
+        Yields:
+            PageResult: The scraped pages, in catalog order.
+        """
+        while url and (page_limit is None or number <= page_limit):
+            logger.info(f"Scraping page {number}: {url}")
+            page = await self.scrape_page_result(url)
+            yield page
+            number += 1
+            url = page.next_page_url
+
+    async def _iter_numbered_pages(
+        self,
+        page_url_template: str,
+        start: int,
+        end: float,
+        concurrency: int,
+    ) -> AsyncIterator[PageResult]:
+        """
+        Scrape numbered pages from a predicted page URL template, keeping a window of pages in flight.
+
+        Pages are scheduled up to `end`, or until one returns 404 or has no next page link
+        when the pagination block didn't give the last page.
+
+        Args:
+            page_url_template (str): The page URL with a `{}` placeholder for the page number.
+            start (int): The first page number to scrape.
+            end (float): The first page number that doesn't belong to the crawl.
+            concurrency (int): The maximum number of pages in flight.
+
+        Yields:
+            PageResult: The scraped pages, in catalog order.
+        """
+        logger.info(f"Crawling numbered pages from {page_url_template} from page {start} up to page {end - 1}")
+
+        pending: Dict[int, asyncio.Task] = {}
+        next_number = start
+        number = start
+        try:
+            while number < end:
+                while next_number < end and len(pending) < concurrency:
+                    pending[next_number] = asyncio.ensure_future(
+                        self._scrape_numbered_page(page_url_template, next_number)
+                    )
+                    next_number += 1
+
+                page = await pending.pop(number)
+                if page is None:
+                    break
+                yield page
+                if page.next_page_url is None:
+                    break
+                number += 1
+        finally:
+            for task in pending.values():
+                task.cancel()
+            await asyncio.gather(*pending.values(), return_exceptions=True)
+
+    async def _scrape_numbered_page(self, page_url_template: str, number: int) -> Optional[PageResult]:
+        """
+        Scrape one numbered page, returning None if it is past the end of the catalog.
+
+        Args:
+            page_url_template (str): The page URL with a `{}` placeholder for the page number.
+            number (int): The page number.
+
+        Returns:
+            Optional[PageResult]: The scraped page, or None if it doesn't exist.
+
+        Raises:
+            NetworkException: If the page still can't be fetched after its retries.
+            ParsingException: If the page still can't be parsed after its retries.
+        """
+        url = page_url_template.format(number)
+        try:
+            logger.info(f"Scraping page {number}: {url}")
+            return await self.scrape_page_result(url)
+        except PageNotFoundException:
+            logger.info(f"Reached end of catalog at page {number}")
+            return None
+
+    def _get_start_url(self) -> str:
+        """Return the URL of the first catalog page."""
+        return self.site.start_url
+
+    @staticmethod
+    def _get_page_url_template(next_page_url: Optional[str]) -> Optional[str]:
+        """
+        Derive a numbered page URL template from the link to page 2.
+
+        Args:
+            next_page_url (Optional[str]): The next page URL found on the first page.
+
+        Returns:
+            Optional[str]: The URL with a `{}` placeholder for the page number, or None
+                if the link doesn't follow the /page/N/ pattern.
+        """
+        if not next_page_url:
+            return None
+        match = PAGE_NUMBER_PATTERN.search(next_page_url)
+        if not match or match.group(1) != "2":
+            return None
+        return f"{next_page_url[:match.start(1)]}{{}}{next_page_url[match.end(1):]}"
+
     def get_next_page_url(self, current_url: str, html: str) -> Optional[str]:
         """
         Get the URL of the next page, if it exists.
 
+        Prefer PageResult.next_page_url when the page has already been parsed.
+
         Args:
             current_url (str): The URL of the current page.
             html (str): The HTML content of the current page.
@@ -253,15 +922,4 @@ class Scraper:
         Raises:
             PaginationException: If there's an error getting the next page URL.
         """
-        try:
-            soup = BeautifulSoup(html, 'html.parser')
-            next_page = soup.select_one(f'.{NEXT_PAGE_CLASS}')
-            if next_page and 'href' in next_page.attrs:
-                next_url = urljoin(current_url, next_page['href'])
-                logger.info(f"Found next page URL: {next_url}")
-                return next_url
-            logger.info("No next page found")
-            return None
-        except Exception as e:
-            logger.error(f"Error getting next page URL: {str(e)}")
-            raise PaginationException(f"Failed to get next page URL: {str(e)}") from e
+        return self.parser.parse_page(current_url, html).next_page_url
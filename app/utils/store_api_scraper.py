@@ -0,0 +1,182 @@
+import html
+import json
+import logging
+from decimal import Decimal, InvalidOperation
+from typing import Any, AsyncIterator, Dict, List, Mapping, Optional
+
+from app.constants import STORE_API_PER_PAGE, STORE_API_PRODUCTS_PATH
+from app.exceptions.scraper_exceptions import NetworkException, StoreApiUnavailableException
+from app.parsers.base_parser import ProductRecord
+from app.utils.crawl_checkpoint import CrawlCheckpoint
+from app.utils.scraper import PageResult, Scraper
+
+logger = logging.getLogger(__name__)
+
+
+class StoreApiScraper(Scraper):
+    """
+    A scraper that reads the catalog from the WooCommerce Store API instead of its HTML.
+
+    The Store API returns products as JSON, up to 100 per request, so a crawl downloads
+    a fraction of the bytes of the themed catalog pages and skips HTML parsing entirely.
+    Its pages go through the same crawl, checkpoint, retry, proxy and image download
+    machinery as HTML pages. If the first API request shows the endpoint is missing, or
+    still fails with network or server errors after its retries, the scraper switches to
+    HTML scraping for the rest of its lifetime.
+
+    Attributes:
+        per_page (int): The number of products requested per API page.
+        use_store_api (bool): Whether pages are read from the Store API; False after falling back to HTML.
+    """
+
+    def __init__(self, *args: Any, per_page: int = STORE_API_PER_PAGE, **kwargs: Any) -> None:
+        """
+        Initialize the StoreApiScraper.
+
+        Args:
+            *args: Positional arguments for Scraper.
+            per_page (int): The number of products requested per API page. The Store API allows up to 100.
+            **kwargs: Keyword arguments for Scraper.
+        """
+        super().__init__(*args, **kwargs)
+        self.per_page = per_page
+        self.use_store_api = True
+
+    @property
+    def api_url(self) -> str:
+        """The Store API products endpoint of the site."""
+        return f"{self.source}{STORE_API_PRODUCTS_PATH}"
+
+    def _get_api_page_url(self, number: int) -> str:
+        """Return the Store API URL of a page of products."""
+        return f"{self.api_url}?per_page={self.per_page}&page={number}"
+
+    def _get_start_url(self) -> str:
+        """Return the URL of the first catalog page, as an API page unless the scraper fell back to HTML."""
+        if self.use_store_api:
+            return self._get_api_page_url(1)
+        return super()._get_start_url()
+
+    def _get_page_url_template(self, next_page_url: Optional[str]) -> Optional[str]:
+        """Return the page URL template, which for the Store API is its page query parameter."""
+        if self.use_store_api:
+            return f"{self.api_url}?per_page={self.per_page}&page={{}}"
+        return super()._get_page_url_template(next_page_url)
+
+    async def _iter_crawl(
+        self, page_limit: Optional[int], concurrency: int, checkpoint: Optional[CrawlCheckpoint]
+    ) -> AsyncIterator[PageResult]:
+        """
+        Crawl through the Store API, falling back to HTML if its first page is rejected or keeps failing.
+
+        A resumed crawl keeps the engine it was started with, judged by the URLs in its checkpoint.
+
+        Args:
+            page_limit (Optional[int]): The maximum number of pages to scrape.
+            concurrency (int): The maximum number of pages in flight.
+            checkpoint (Optional[CrawlCheckpoint]): The checkpoint to record progress in and resume from.
+
+        Yields:
+            PageResult: The scraped pages, in catalog order.
+        """
+        if checkpoint is not None and checkpoint.pages_done > 0:
+            resume_url = checkpoint.page_url_template or checkpoint.next_url or ""
+            self.use_store_api = resume_url.startswith(self.api_url)
+        pages = super()._iter_crawl(page_limit, concurrency, checkpoint)
+
+        if self.use_store_api:
+            try:
+                first_page = await pages.__anext__()
+            except StopAsyncIteration:
+                return
+            except NetworkException as e:
+                # Covers 4xx (no Store API) as well as timeouts and 5xx that outlasted the retries.
+                logger.warning(f"Store API unavailable, falling back to HTML scraping: {str(e)}")
+                self.use_store_api = False
+                pages = super()._iter_crawl(page_limit, concurrency, checkpoint)
+            else:
+                yield first_page
+
+        async for page in pages:
+            yield page
+
+    async def load_page(self, url: str) -> PageResult:
+        """
+        Fetch a page of products from the Store API and map it to product records.
+
+        Args:
+            url (str): The URL of the page.
+
+        Returns:
+            PageResult: The product records and pagination data of the page.
+
+        Raises:
+            StoreApiUnavailableException: If the response isn't a Store API product list.
+            NetworkException: If there's an error fetching the page.
+        """
+        if not self.use_store_api:
+            return await super().load_page(url)
+
+        fetched = await self.fetch_page_conditional(url, {"Accept": "application/json"})
+        try:
+            items = json.loads(fetched.html or "")
+        except ValueError as e:
+            raise StoreApiUnavailableException(f"Store API returned a non-JSON response: {url}") from e
+        if not isinstance(items, list):
+            raise StoreApiUnavailableException(f"Store API returned an unexpected response: {url}")
+
+        records: List[ProductRecord] = []
+        for item in items:
+            try:
+                records.append(self._map_product(item))
+            except (KeyError, IndexError, TypeError, InvalidOperation) as e:
+                logger.warning(f"Skipping Store API product due to parsing error: {str(e)}")
+
+        number = int(url.rsplit("page=", 1)[1])
+        total_pages = self._get_total_pages(fetched.headers)
+        if total_pages is not None:
+            has_next = number < total_pages
+        else:
+            has_next = len(items) >= self.per_page
+        return PageResult(
+            url=url,
+            product_records=records,
+            next_page_url=self._get_api_page_url(number + 1) if has_next else None,
+            last_page_number=total_pages,
+        )
+
+    @staticmethod
+    def _get_total_pages(headers: Mapping[str, str]) -> Optional[int]:
+        """Read the total page count WordPress sends in the X-WP-TotalPages header."""
+        value = headers.get("X-WP-TotalPages")
+        return int(value) if value and value.isdigit() else None
+
+    @staticmethod
+    def _map_product(item: Dict[str, Any]) -> ProductRecord:
+        """
+        Map a Store API product to the record the HTML parsers extract.
+
+        Prices are given in minor units as strings, e.g. "129900" with a minor unit of 2.
+        The price read is the one the HTML parsers take, the first amount the catalog shows:
+        the regular price, which comes before the sale price on sale items, or the lowest
+        price of a variable product's range. Switching engines thus never changes a price.
+
+        Args:
+            item (Dict[str, Any]): A product object from the Store API.
+
+        Returns:
+            ProductRecord: The product's ID, title, price and first image URL.
+        """
+        prices = item["prices"]
+        minor_unit = int(prices.get("currency_minor_unit", 2))
+        price_range = prices.get("price_range")
+        if price_range:
+            price = price_range["min_amount"]
+        else:
+            price = prices.get("regular_price") or prices["price"]
+        return ProductRecord(
+            source_id=str(item["id"]),
+            product_title=html.unescape(item["name"]),
+            product_price=Decimal(price).scaleb(-minor_unit),
+            image_url=item["images"][0]["src"],
+        )
@@ -1,47 +1,74 @@
 import os
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from fastapi import FastAPI, HTTPException
 from app.routers import scraper
 from app.middleware.auth_middleware import AuthMiddleware
-from app.cache.redis_cache import RedisCache
+from app.cache.cache_factory import create_cache
+from app.cache.near_cache import NearCache
 from app.models.db_models import Base
-from sqlalchemy.ext.asyncio import create_async_engine
+from app.models.site_config import load_site_configs
+from app.notifications.notifier_factory import create_notifiers
+from app.parsers.parser_pool import ParserPool
+from app.repositories.postgres_repository import create_db_engine
+from app.services.notification_service import NotificationService
+from app.transports.transport_factory import create_transport
+from app.utils.job_queue import ScrapeJobQueue
 from app.utils.logging_config import setup_logging
 import logging
 from app.exceptions.authentication_exceptions import AuthenticationException
 from app.exceptions.caching_exceptions import CacheException
 from app.exceptions.storage_exceptions import StorageException
 from starlette.status import HTTP_403_FORBIDDEN, HTTP_503_SERVICE_UNAVAILABLE, HTTP_500_INTERNAL_SERVER_ERROR
-from app.constants import API_KEY, DATABASE_URL, PORT, HOST
+from app.constants import API_KEY, CACHE_BACKEND, NEAR_CACHE_ENABLED, PORT, HOST
 
 setup_logging()
 logger = logging.getLogger(__name__)
 
-app = FastAPI()
+async def startup(app: FastAPI) -> None:
+    """
+    Create the connection pools and services shared by every request.
 
-# Add the authentication middleware
-app.add_middleware(AuthMiddleware, api_key=API_KEY)
-
-app.include_router(scraper.router, prefix="/api/v1", tags=["scraper"])
-
-@app.on_event("startup")
-async def startup_event():
+    The site configs, database engine, price cache, HTTP transport, parser pool, notifiers
+    and scrape job queue live for the lifetime of the app and are injected into request
+    handlers through dependencies.
+    """
     logger.info("Starting up the application")
     try:
         os.makedirs("storage", exist_ok=True)
-        app.state.redis_cache = RedisCache()
-        await app.state.redis_cache.initialize()
-        logger.info("Redis cache initialized")
+        app.state.sites = load_site_configs()
+        logger.info(f"Loaded site configs: {[site.name for site in app.state.sites]}")
+
+        app.state.cache = create_cache()
+        await app.state.cache.initialize()
+        logger.info(f"{CACHE_BACKEND} price cache initialized")
+
+        app.state.near_cache = NearCache() if NEAR_CACHE_ENABLED else None
+        if app.state.near_cache is not None:
+            app.state.near_cache.start_invalidation_listener(app.state.cache)
+            logger.info("Near cache initialized")
+
+        app.state.parser_pool = ParserPool()
+        app.state.parser_pool.start()
+
+        app.state.transport = create_transport()
+        await app.state.transport.open()
+
+        app.state.notification_service = NotificationService(create_notifiers())
 
         # Initialize database
-        engine = create_async_engine(DATABASE_URL, echo=True)
-        async with engine.begin() as conn:
+        app.state.db_engine = create_db_engine()
+        async with app.state.db_engine.begin() as conn:
             await conn.run_sync(Base.metadata.create_all)
         logger.info("Database initialized")
+
+        app.state.job_queue = ScrapeJobQueue()
+        app.state.job_queue.start()
     except AuthenticationException as e:
         logger.error(f"Authentication error during startup: {str(e)}")
         raise HTTPException(status_code=HTTP_403_FORBIDDEN, detail="Authentication failed during startup")
     except CacheException as e:
-        logger.error(f"Failed to initialize Redis cache: {str(e)}")
+        logger.error(f"Failed to initialize price cache: {str(e)}")
         raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Service Unavailable: Cache initialization failed")
     except StorageException as e:
         logger.error(f"Failed to initialize database: {str(e)}")
@@ -50,19 +77,47 @@ async def startup_event():
         logger.error(f"Unexpected error during startup: {str(e)}")
         raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal Server Error: Unexpected error during startup")
 
-@app.on_event("shutdown")
-async def shutdown_event():
+async def shutdown(app: FastAPI) -> None:
+    """
+    Close the connection pools and services created at startup.
+    """
     logger.info("Shutting down the application")
     try:
-        await app.state.redis_cache.close()
-        logger.info("Redis cache closed")
+        await app.state.job_queue.stop()
+
+        if app.state.near_cache is not None:
+            await app.state.near_cache.stop_invalidation_listener()
+            logger.info(f"Near cache stopped with stats: {app.state.near_cache.stats()}")
+        await app.state.cache.close()
+        logger.info(f"{CACHE_BACKEND} price cache closed")
+
+        await app.state.transport.close()
+        await app.state.db_engine.dispose()
+        logger.info("Database engine disposed")
+
+        app.state.parser_pool.shutdown()
     except CacheException as e:
-        logger.error(f"Error closing Redis cache: {str(e)}")
-        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Service Unavailable: Error closing Redis cache")
+        logger.error(f"Error closing price cache: {str(e)}")
+        raise HTTPException(status_code=HTTP_503_SERVICE_UNAVAILABLE, detail="Service Unavailable: Error closing price cache")
     except Exception as e:
         logger.error(f"Unexpected error during shutdown: {str(e)}")
         raise HTTPException(status_code=HTTP_500_INTERNAL_SERVER_ERROR, detail="Internal Server Error: Unexpected error during shutdown")
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    await startup(app)
+    try:
+        yield
+    finally:
+        await shutdown(app)
+
+app = FastAPI(lifespan=lifespan)
+
+# Add the authentication middleware
+app.add_middleware(AuthMiddleware, api_key=API_KEY)
+
+app.include_router(scraper.router, prefix="/api/v1", tags=["scraper"])
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host=HOST, port=PORT)
\ No newline at end of file
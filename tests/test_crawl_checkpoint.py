@@ -0,0 +1,55 @@
+import json
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.models.product import Product  # noqa: E402
+from app.utils.crawl_checkpoint import CrawlCheckpoint  # noqa: E402
+
+
+@pytest.fixture
+def make_product(tmp_path):
+    image_path = tmp_path / "product.jpg"
+    image_path.write_bytes(b"\xff\xd8\xff")
+
+    def make(number: int) -> Product:
+        return Product(
+            id=f"https://shop.example_{number}",
+            source="https://shop.example",
+            source_id=str(number),
+            product_title=f"Product {number}",
+            product_price=Decimal("10.00"),
+            path_to_image=str(image_path),
+        )
+
+    return make
+
+
+def test_resume_replays_only_unpersisted_products(tmp_path, make_product):
+    checkpoint = CrawlCheckpoint.create(checkpoint_dir=str(tmp_path / "checkpoints"))
+    checkpoint.record_page(1, "https://shop.example/page/2/", [make_product(1), make_product(2)])
+    checkpoint.record_page(2, "https://shop.example/page/3/", [make_product(3), make_product(4)])
+    checkpoint.record_persisted(3, products_updated=2)
+
+    loaded = CrawlCheckpoint.load(checkpoint.token, checkpoint.checkpoint_dir)
+
+    assert loaded.products_recorded == 4
+    assert loaded.products_persisted == 3
+    assert loaded.products_updated == 2
+    assert [(position, product.source_id) for position, product in loaded.iter_unpersisted_products()] == [(3, "4")]
+
+
+def test_load_discards_products_of_unfinished_pages(tmp_path, make_product):
+    checkpoint = CrawlCheckpoint.create(checkpoint_dir=str(tmp_path / "checkpoints"))
+    checkpoint.record_page(1, "https://shop.example/page/2/", [make_product(1)])
+    # A crash between appending a page's products and saving the state leaves stray lines.
+    with open(checkpoint.products_path, "a") as f:
+        f.write(json.dumps({"page": 2, "product": make_product(2).dict()}, default=str) + "\n")
+
+    loaded = CrawlCheckpoint.load(checkpoint.token, checkpoint.checkpoint_dir)
+    loaded.record_page(2, None, [make_product(3)])
+
+    assert loaded.products_recorded == 2
+    assert [product.source_id for _, product in loaded.iter_unpersisted_products()] == ["1", "3"]
@@ -0,0 +1,121 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from app.utils.crawl_scheduler import FairShareLimiter
+
+
+def test_slots_are_granted_up_to_the_limit():
+    async def scenario():
+        limiter = FairShareLimiter(limit=2)
+        await limiter.acquire("a")
+        await limiter.acquire("b")
+        third = asyncio.ensure_future(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        assert not third.done()
+        assert limiter.in_flight == {"a": 1, "b": 1}
+
+        limiter.release("b")
+        await third
+        assert limiter.in_flight == {"a": 2, "b": 0}
+        assert limiter.served == {"a": 2, "b": 1}
+
+    asyncio.run(scenario())
+
+
+def test_released_slot_goes_to_the_site_with_the_smallest_weighted_share():
+    async def scenario():
+        limiter = FairShareLimiter(limit=2)
+        limiter.register("big", weight=1.0)
+        limiter.register("small", weight=1.0)
+        await limiter.acquire("big")
+        await limiter.acquire("big")
+        big_waiter = asyncio.ensure_future(limiter.acquire("big"))
+        small_waiter = asyncio.ensure_future(limiter.acquire("small"))
+        await asyncio.sleep(0)
+
+        limiter.release("big")
+        await asyncio.sleep(0)
+        assert small_waiter.done()
+        assert not big_waiter.done()
+        assert limiter.in_flight == {"big": 1, "small": 1}
+
+        limiter.release("small")
+        await big_waiter
+        assert limiter.in_flight == {"big": 2, "small": 0}
+
+    asyncio.run(scenario())
+
+
+def test_slots_are_shared_in_proportion_to_weight():
+    async def scenario() -> List[str]:
+        limiter = FairShareLimiter(limit=1)
+        limiter.register("heavy", weight=3.0)
+        limiter.register("light", weight=1.0)
+        granted: List[str] = []
+
+        async def page(site: str) -> None:
+            await limiter.acquire(site)
+            granted.append(site)
+
+        await limiter.acquire("heavy")
+        granted.append("heavy")
+        # Both sites keep more pages queued than the budget can serve.
+        waiters = [asyncio.ensure_future(page(site)) for site in ["heavy", "light"] * 8]
+        await asyncio.sleep(0)
+        for _ in range(8):
+            limiter.release(granted[-1])
+            await asyncio.sleep(0)
+        for waiter in waiters:
+            waiter.cancel()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        return granted[1:]
+
+    order = asyncio.run(scenario())
+    assert order == ["light", "heavy", "heavy", "heavy", "light", "heavy", "heavy", "heavy"]
+
+
+def test_cancelled_waiter_does_not_leak_a_slot():
+    async def scenario():
+        limiter = FairShareLimiter(limit=1)
+        await limiter.acquire("a")
+        waiter = asyncio.ensure_future(limiter.acquire("b"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release("a")
+        assert limiter.in_flight == {"a": 0, "b": 0}
+        await asyncio.wait_for(limiter.acquire("a"), timeout=1)
+        assert limiter.in_flight == {"a": 1, "b": 0}
+
+    asyncio.run(scenario())
+
+
+def test_waiter_cancelled_after_its_grant_returns_the_slot():
+    async def scenario():
+        limiter = FairShareLimiter(limit=1)
+        await limiter.acquire("a")
+        waiter = asyncio.ensure_future(limiter.acquire("b"))
+        await asyncio.sleep(0)
+        # The slot is handed over, but the waiter is cancelled before it resumes.
+        limiter.release("a")
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert limiter.in_flight == {"a": 0, "b": 0}
+
+    asyncio.run(scenario())
+
+
+def test_slot_is_released_when_the_block_raises():
+    async def scenario():
+        limiter = FairShareLimiter(limit=1)
+        with pytest.raises(RuntimeError):
+            async with limiter.slot("a"):
+                raise RuntimeError("page failed")
+        assert limiter.in_flight == {"a": 0}
+
+    asyncio.run(scenario())
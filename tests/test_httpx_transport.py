@@ -0,0 +1,47 @@
+import asyncio
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from app.exceptions.transport_exceptions import TransportTimeoutException  # noqa: E402
+from app.transports.httpx_transport import HttpxTransport  # noqa: E402
+
+
+class TricklingStream(httpx.AsyncByteStream):
+    """A response body that sends a chunk every `interval` seconds."""
+
+    def __init__(self, chunks: int, interval: float) -> None:
+        self.chunks = chunks
+        self.interval = interval
+
+    async def __aiter__(self):
+        for _ in range(self.chunks):
+            await asyncio.sleep(self.interval)
+            yield b"x"
+
+
+def make_transport(chunks: int, interval: float) -> HttpxTransport:
+    transport = HttpxTransport()
+    transport._client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, stream=TricklingStream(chunks, interval)))
+    )
+    return transport
+
+
+async def read(transport: HttpxTransport, timeout: float) -> str:
+    try:
+        async with transport.get("https://shop.example/", timeout=timeout) as response:
+            return await response.text()
+    finally:
+        await transport.close()
+
+
+def test_timeout_bounds_the_whole_request():
+    # Every chunk arrives well within the timeout, but the body as a whole doesn't.
+    with pytest.raises(TransportTimeoutException):
+        asyncio.run(read(make_transport(chunks=10, interval=0.05), timeout=0.2))
+
+
+def test_request_within_timeout_completes():
+    assert asyncio.run(read(make_transport(chunks=3, interval=0.01), timeout=1.0)) == "xxx"
@@ -0,0 +1,176 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("pydantic")
+
+from app.exceptions.job_exceptions import JobNotFoundException, JobQueueFullException  # noqa: E402
+from app.utils.job_queue import JOB_COMPLETED, JOB_FAILED, ScrapeJobQueue  # noqa: E402
+
+
+async def scrape(job):
+    await asyncio.sleep(0.01)
+    return {"total_scraped": 1}
+
+
+async def fail(job):
+    raise RuntimeError("site down")
+
+
+async def settle(queue: ScrapeJobQueue) -> None:
+    await queue._queue.join()
+
+
+def run(scenario, **options):
+    async def wrapper():
+        queue = ScrapeJobQueue(**options)
+        queue.start()
+        try:
+            await scenario(queue)
+        finally:
+            await queue.stop()
+
+    asyncio.run(wrapper())
+
+
+def test_identical_requests_share_one_job():
+    async def scenario(queue):
+        first = queue.submit(scrape, {"page_limit": 2}, key="shop:2")
+        second = queue.submit(scrape, {"page_limit": 2}, key="shop:2")
+        other = queue.submit(scrape, {"page_limit": 3}, key="shop:3")
+        assert second is first
+        assert other is not first
+        assert first.submissions == 2
+
+        await settle(queue)
+        assert first.status == JOB_COMPLETED
+        assert queue.get(first.id).result == {"total_scraped": 1}
+
+    run(scenario)
+
+
+def test_request_attaches_to_a_running_job():
+    async def scenario(queue):
+        started = asyncio.Event()
+        release = asyncio.Event()
+        runs = []
+
+        async def slow(job):
+            runs.append(job.id)
+            started.set()
+            await release.wait()
+
+        first = queue.submit(slow, key="shop")
+        await started.wait()
+        assert queue.submit(slow, key="shop") is first
+        release.set()
+        await settle(queue)
+        assert runs == [first.id]
+
+    run(scenario)
+
+
+def test_completed_result_is_reused_within_the_window_only():
+    async def scenario(queue):
+        first = queue.submit(scrape, key="shop")
+        await settle(queue)
+        assert queue.submit(scrape, key="shop") is first
+
+        first.finished_at -= 61
+        fresh = queue.submit(scrape, key="shop")
+        assert fresh is not first
+        assert queue.submit(scrape, key="shop") is fresh
+
+    run(scenario, reuse_seconds=60)
+
+
+def test_failed_job_is_not_reused():
+    async def scenario(queue):
+        failed = queue.submit(fail, key="shop")
+        await settle(queue)
+        assert failed.status == JOB_FAILED
+        assert queue.submit(scrape, key="shop") is not failed
+
+    run(scenario)
+
+
+def test_requests_without_a_key_are_never_coalesced():
+    async def scenario(queue):
+        assert queue.submit(scrape) is not queue.submit(scrape)
+
+    run(scenario)
+
+
+def test_coalesced_request_does_not_take_a_queue_slot():
+    async def scenario(queue):
+        first = queue.submit(scrape, key="shop")
+        queue.submit(scrape, key="other")
+        assert queue.submit(scrape, key="shop") is first
+        with pytest.raises(JobQueueFullException):
+            queue.submit(scrape, key="third")
+
+    run(scenario, workers=0, max_pending=2)
+
+
+def test_forgotten_job_is_no_longer_served():
+    async def scenario(queue):
+        first = queue.submit(scrape, key="shop")
+        await settle(queue)
+        queue.submit(scrape, key="a")
+        queue.submit(scrape, key="b")
+        with pytest.raises(JobNotFoundException):
+            queue.get(first.id)
+        assert queue.submit(scrape, key="shop") is not first
+
+    run(scenario, history=2)
+
+
+def test_request_key_ignores_proxy_order_and_resolves_the_default_site():
+    pytest.importorskip("fastapi")
+    from app.routers.scraper import _request_key
+    from app.schemas.scraper_schemas import ScraperRequest
+
+    a = ScraperRequest(page_limit=2, proxies=["http://p1.example:8080", "http://p2.example:8080"], site="shop")
+    b = ScraperRequest(page_limit=2, proxies=["http://p2.example:8080", "http://p1.example:8080"], site="shop")
+    c = ScraperRequest(page_limit=3, proxies=["http://p1.example:8080"], site="shop")
+    assert _request_key(a) == _request_key(b)
+    assert _request_key(a) != _request_key(c)
+
+
+def test_multi_site_scrape_runs_as_a_job():
+    pytest.importorskip("fastapi")
+    from app.exceptions.scraper_exceptions import ScraperException
+    from app.routers.scraper import _job_response, scrape_sites
+    from app.schemas.scraper_schemas import MultiSiteScraperRequest, MultiSiteScraperResponse
+
+    class Site:
+        def __init__(self, name):
+            self.name = name
+
+    class FakeScraperService:
+        sites = [Site("shop"), Site("outlet")]
+
+        def get_site(self, name):
+            for site in self.sites:
+                if site.name == name:
+                    return site
+            raise ScraperException(f"Unknown site: {name}")
+
+        async def scrape_sites(self, site_names, page_limit, proxies):
+            return {"shop": (5, 2, [], None), "outlet": RuntimeError("site down")}
+
+    async def scenario(queue):
+        service = FakeScraperService()
+        accepted = await scrape_sites(MultiSiteScraperRequest(page_limit=2), service, queue)
+        again = await scrape_sites(MultiSiteScraperRequest(sites=["outlet", "shop"], page_limit=2), service, queue)
+        assert again.job_id == accepted.job_id
+        await settle(queue)
+
+        job = _job_response(queue.get(accepted.job_id))
+        assert job.status == JOB_COMPLETED
+        assert isinstance(job.result, MultiSiteScraperResponse)
+        assert job.result.status == "partial"
+        assert job.result.results["shop"].total_scraped == 5
+        assert job.result.errors == {"outlet": "site down"}
+
+    run(scenario)
@@ -0,0 +1,76 @@
+import os
+from decimal import Decimal
+
+import pytest
+
+pytest.importorskip("bs4")
+pytest.importorskip("lxml")
+
+from app.parsers.base_parser import BaseParser, ParsedPage, ProductRecord  # noqa: E402
+from app.parsers.parser_factory import create_parser  # noqa: E402
+
+URL = "https://dentalstall.com/shop/"
+FIXTURE = os.path.join(os.path.dirname(__file__), "fixtures", "catalog_page.html")
+
+ENGINES = [
+    pytest.param({"engine": "soup", "targeted": False}, id="soup"),
+    pytest.param({"engine": "soup", "targeted": True}, id="soup-targeted"),
+    pytest.param({"engine": "lxml"}, id="lxml"),
+]
+
+
+@pytest.fixture(scope="module")
+def catalog_html() -> str:
+    with open(FIXTURE, encoding="utf-8") as f:
+        return f.read()
+
+
+@pytest.mark.parametrize("options", ENGINES)
+def test_engine_extracts_the_fixture_page(options, catalog_html):
+    page = create_parser(**options).parse_page(URL, catalog_html)
+
+    assert page == ParsedPage(
+        product_records=[
+            ProductRecord(
+                source_id="101",
+                product_title="Composite Kit & Shade Guide",
+                product_price=Decimal("1299.00"),
+                image_url="https://dentalstall.com/wp-content/uploads/2024/01/composite-kit-300x300.jpg",
+            ),
+            ProductRecord(
+                source_id="102",
+                product_title="Bonding Agent 5ml",
+                product_price=Decimal("2450.00"),
+                image_url="https://dentalstall.com/wp-content/uploads/2024/02/bonding-agent.png",
+            ),
+            ProductRecord(
+                source_id="103",
+                product_title="Mixing Pad",
+                product_price=Decimal("85.50"),
+                image_url=URL,
+            ),
+        ],
+        next_page_url="https://dentalstall.com/shop/page/2/",
+        last_page_number=1024,
+    )
+
+
+def test_engines_agree_on_the_fixture_page(catalog_html):
+    pages = [create_parser(**param.values[0]).parse_page(URL, catalog_html) for param in ENGINES]
+    assert all(page == pages[0] for page in pages[1:])
+
+
+@pytest.mark.parametrize("options", ENGINES)
+def test_engine_handles_a_page_without_products_or_pagination(options):
+    page = create_parser(**options).parse_page(URL, "<html><body><p>No products found</p></body></html>")
+    assert page == ParsedPage()
+
+
+def test_parse_price_strips_currency_and_separators():
+    assert BaseParser.parse_price("₹1,299.00") == Decimal("1299.00")
+    assert BaseParser.parse_price("") == Decimal("0")
+
+
+def test_unknown_engine_is_rejected():
+    with pytest.raises(ValueError):
+        create_parser(engine="regex")
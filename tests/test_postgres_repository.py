@@ -0,0 +1,108 @@
+import asyncio
+from decimal import Decimal
+from typing import Any, List
+
+import pytest
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic")
+
+from sqlalchemy.dialects import postgresql  # noqa: E402
+
+from app.models.product import Product  # noqa: E402
+from app.repositories.postgres_repository import (  # noqa: E402
+    MAX_BIND_PARAMETERS,
+    UPSERT_COLUMNS,
+    PostgresRepository,
+)
+
+COLUMNS_PER_ROW = len(UPSERT_COLUMNS) + 1
+
+
+class RecordingSession:
+    """An AsyncSession stand-in that records the statements it executes."""
+
+    def __init__(self, executed: List[Any]) -> None:
+        self.executed = executed
+
+    async def __aenter__(self) -> "RecordingSession":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> bool:
+        return False
+
+    def begin(self) -> "RecordingSession":
+        return self
+
+    async def execute(self, statement: Any) -> None:
+        self.executed.append(statement.compile(dialect=postgresql.dialect()))
+
+
+def make_repository(batch_size: int) -> PostgresRepository:
+    repository = PostgresRepository(engine=None, batch_size=batch_size)
+    repository.executed = []
+    repository.async_session = lambda: RecordingSession(repository.executed)
+    return repository
+
+
+@pytest.fixture
+def make_product(tmp_path):
+    image_path = tmp_path / "product.jpg"
+    image_path.write_bytes(b"\xff\xd8\xff")
+
+    def make(number: int, price: str = "10.00") -> Product:
+        return Product(
+            id=f"https://shop.example_{number}",
+            source="https://shop.example",
+            source_id=str(number),
+            product_title=f"Product {number}",
+            product_price=Decimal(price),
+            path_to_image=str(image_path),
+        )
+
+    return make
+
+
+def test_products_are_upserted_in_batches(make_product):
+    repository = make_repository(batch_size=1000)
+    asyncio.run(repository.save_products([make_product(number) for number in range(2500)]))
+
+    rows_per_statement = [len(compiled.params) // COLUMNS_PER_ROW for compiled in repository.executed]
+    assert rows_per_statement == [1000, 1000, 500]
+
+
+def test_upsert_overwrites_every_column_on_conflict(make_product):
+    repository = make_repository(batch_size=10)
+    asyncio.run(repository.save_products([make_product(1)]))
+
+    sql = str(repository.executed[0])
+    assert "ON CONFLICT (id) DO UPDATE SET" in sql
+    for column in UPSERT_COLUMNS:
+        assert f"{column} = excluded.{column}" in sql
+
+
+def test_duplicate_ids_keep_the_last_product(make_product):
+    repository = make_repository(batch_size=10)
+    asyncio.run(repository.save_products([make_product(1, "1.00"), make_product(2), make_product(1, "2.00")]))
+
+    (compiled,) = repository.executed
+    assert len(compiled.params) == 2 * COLUMNS_PER_ROW
+    prices = [value for value in compiled.params.values() if isinstance(value, Decimal)]
+    assert Decimal("2.00") in prices
+    assert Decimal("1.00") not in prices
+
+
+def test_batch_size_is_capped_by_the_bind_parameter_limit(make_product):
+    repository = make_repository(batch_size=100_000)
+    assert repository.batch_size * COLUMNS_PER_ROW <= MAX_BIND_PARAMETERS
+
+    asyncio.run(repository.save_products([make_product(number) for number in range(12000)]))
+    assert len(repository.executed) > 1
+    assert all(len(compiled.params) <= MAX_BIND_PARAMETERS for compiled in repository.executed)
+    assert sum(len(compiled.params) for compiled in repository.executed) == 12000 * COLUMNS_PER_ROW
+
+
+def test_no_statement_for_an_empty_list():
+    repository = make_repository(batch_size=10)
+    asyncio.run(repository.save_products([]))
+    assert repository.executed == []
@@ -0,0 +1,150 @@
+import asyncio
+
+import pytest
+
+from app.exceptions.scraper_exceptions import CircuitOpenException, NetworkException, ParsingException
+from app.utils.retry_policy import CircuitBreaker, RetryBudget, RetryPolicy
+
+URL = "https://shop.example/page/1/"
+
+
+def open_breaker(policy: RetryPolicy) -> CircuitBreaker:
+    breaker = policy.breaker_for(URL)
+    for _ in range(policy.failure_threshold):
+        breaker.before_call()
+        breaker.record_failure()
+    return breaker
+
+
+def test_breaker_opens_after_threshold_of_consecutive_failures():
+    breaker = CircuitBreaker("shop.example", failure_threshold=3, reset_timeout=60)
+    for _ in range(2):
+        breaker.before_call()
+        breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call()
+
+
+def test_success_resets_the_failure_count():
+    breaker = CircuitBreaker("shop.example", failure_threshold=2, reset_timeout=60)
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_success()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 1
+
+
+def test_half_open_allows_a_single_trial():
+    breaker = CircuitBreaker("shop.example", failure_threshold=1, reset_timeout=0)
+    breaker.before_call()
+    breaker.record_failure()
+
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    with pytest.raises(CircuitOpenException):
+        breaker.before_call()
+
+
+def test_trial_success_closes_and_trial_failure_reopens():
+    breaker = CircuitBreaker("shop.example", failure_threshold=1, reset_timeout=0)
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.before_call()
+    breaker.record_failure()
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_cancelled_half_open_trial_releases_the_breaker():
+    policy = RetryPolicy(failure_threshold=1, reset_timeout=0, base_delay=0)
+    breaker = open_breaker(policy)
+
+    async def scenario():
+        started = asyncio.Event()
+
+        async def hang():
+            started.set()
+            await asyncio.sleep(60)
+
+        trial = asyncio.create_task(policy.run(hang, url=URL))
+        await started.wait()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        trial.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await trial
+
+        async def ok():
+            return "page"
+
+        return await policy.run(ok, url=URL)
+
+    assert asyncio.run(scenario()) == "page"
+    assert breaker.state == CircuitBreaker.CLOSED
+
+
+def test_unclassified_error_in_half_open_trial_releases_the_breaker():
+    policy = RetryPolicy(failure_threshold=1, reset_timeout=0, base_delay=0)
+    breaker = open_breaker(policy)
+
+    async def broken():
+        raise TypeError("bug")
+
+    with pytest.raises(TypeError):
+        asyncio.run(policy.run(broken, url=URL))
+    breaker.before_call()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+
+def test_policy_retries_until_success():
+    policy = RetryPolicy(max_attempts=3, base_delay=0)
+    calls = []
+
+    async def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ParsingException("truncated page")
+        return "page"
+
+    assert asyncio.run(policy.run(flaky, url=URL)) == "page"
+    assert len(calls) == 3
+    assert policy.budget.spent == 2
+
+
+def test_policy_fails_fast_once_the_breaker_opens():
+    policy = RetryPolicy(max_attempts=5, base_delay=0, failure_threshold=2, reset_timeout=60)
+    calls = []
+
+    async def down():
+        calls.append(1)
+        raise NetworkException("connection refused")
+
+    with pytest.raises(CircuitOpenException):
+        asyncio.run(policy.run(down, url=URL))
+    assert len(calls) == 2
+
+
+def test_exhausted_budget_stops_retries():
+    policy = RetryPolicy(max_attempts=5, base_delay=0, budget=RetryBudget(max_retries=1))
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        raise ParsingException("truncated page")
+
+    with pytest.raises(ParsingException):
+        asyncio.run(policy.run(failing))
+    assert len(calls) == 2
+    assert policy.budget.remaining == 0